@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+"""
+Benchmark the time taken to import zipline modules in a fresh interpreter.
+
+Usage: bench_import_time.py [-n REPEATS] [MODULE ...]
+
+tests/test_imports.py guards which modules are imported eagerly; this script
+reports how long the imports actually take.
+"""
+from __future__ import print_function
+
+import argparse
+from subprocess import check_call
+import sys
+import timeit
+
+DEFAULT_MODULES = (
+    'zipline',
+    'zipline.utils.cli',
+    'zipline.api',
+    'zipline.pipeline',
+)
+
+
+def time_import(module, repeats):
+    """
+    Get the wall times, in seconds, of ``repeats`` fresh interpreters each
+    importing ``module``, less the startup time of a bare interpreter.
+    """
+    def run(code):
+        return min(timeit.repeat(
+            lambda: check_call([sys.executable, '-c', code]),
+            number=1,
+            repeat=repeats,
+        ))
+    return run('import ' + module) - run('pass')
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('-n', '--repeats', type=int, default=5)
+    parser.add_argument('modules', nargs='*', default=DEFAULT_MODULES)
+    args = parser.parse_args(argv)
+
+    for module in args.modules:
+        print('%-30s %8.3fs' % (module, time_import(module, args.repeats)))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -84,9 +84,13 @@ ext_modules = [
     Extension(
         'zipline.lib._float64window', ['zipline/lib/_float64window.pyx']
     ),
+    Extension(
+        'zipline.lib._float32window', ['zipline/lib/_float32window.pyx']
+    ),
     Extension('zipline.lib._int64window', ['zipline/lib/_int64window.pyx']),
     Extension('zipline.lib._uint8window', ['zipline/lib/_uint8window.pyx']),
     Extension('zipline.lib.rank', ['zipline/lib/rank.pyx']),
+    Extension('zipline.lib._normalize', ['zipline/lib/_normalize.pyx']),
     Extension('zipline.data._equities', ['zipline/data/_equities.pyx']),
     Extension('zipline.data._adjustments', ['zipline/data/_adjustments.pyx']),
     Extension('zipline._protocol', ['zipline/_protocol.pyx']),
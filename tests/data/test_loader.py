@@ -0,0 +1,82 @@
+"""
+Tests for the binary market data cache in zipline.data.loader.
+"""
+import os
+from unittest import TestCase
+
+from mock import patch
+from numpy import arange, nan
+from pandas import DataFrame, Series, date_range
+from pandas.util.testing import assert_frame_equal, assert_series_equal
+from testfixtures import TempDirectory
+
+from zipline.data import loader
+from zipline.data.loader import (
+    read_binary_cache,
+    read_csv_with_binary_cache,
+    write_binary_cache,
+)
+
+
+class BinaryCacheTestCase(TestCase):
+
+    def setUp(self):
+        self.dir_ = TempDirectory()
+        self.dir_.create()
+        self.index = date_range('2014-01-02', periods=5, tz='UTC')
+
+    def tearDown(self):
+        self.dir_.cleanup()
+
+    def test_series_roundtrip(self):
+        expected = Series(arange(5, dtype=float), index=self.index)
+        path = self.dir_.getpath('series.npz')
+
+        write_binary_cache(path, expected, 1.0)
+        assert_series_equal(read_binary_cache(path, 1.0), expected)
+
+    def test_frame_roundtrip(self):
+        expected = DataFrame(
+            {'1month': arange(5, dtype=float), '10year': nan},
+            index=self.index,
+            columns=['1month', '10year'],
+        )
+        path = self.dir_.getpath('frame.npz')
+
+        write_binary_cache(path, expected, 1.0)
+        assert_frame_equal(read_binary_cache(path, 1.0), expected)
+
+    def test_stale_cache(self):
+        data = Series(arange(5, dtype=float), index=self.index)
+        path = self.dir_.getpath('series.npz')
+
+        write_binary_cache(path, data, 1.0)
+        self.assertIsNone(read_binary_cache(path, 2.0))
+        self.assertIsNone(read_binary_cache(self.dir_.getpath('missing'), 1.0))
+
+    def test_version_mismatch(self):
+        data = Series(arange(5, dtype=float), index=self.index)
+        path = self.dir_.getpath('series.npz')
+
+        write_binary_cache(path, data, 1.0)
+        with patch.object(loader, 'BINARY_CACHE_VERSION', -1):
+            self.assertIsNone(read_binary_cache(path, 1.0))
+
+    def test_read_csv_only_parses_once(self):
+        expected = Series(arange(5, dtype=float), index=self.index)
+        csv_path = self.dir_.getpath('bench.csv')
+        expected.to_csv(csv_path)
+
+        calls = []
+
+        def read_csv(path):
+            calls.append(path)
+            return Series.from_csv(path).tz_localize('UTC')
+
+        with patch.dict(os.environ, {'ZIPLINE_ROOT': self.dir_.path}):
+            first = read_csv_with_binary_cache(csv_path, read_csv)
+            second = read_csv_with_binary_cache(csv_path, read_csv)
+
+        self.assertEqual(calls, [csv_path])
+        assert_series_equal(first, expected, check_names=False)
+        assert_series_equal(second, first)
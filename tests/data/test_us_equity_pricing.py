@@ -18,6 +18,8 @@ from nose_parameterized import parameterized
 from numpy import (
     arange,
     datetime64,
+    nan,
+    ones,
 )
 from numpy.testing import (
     assert_array_equal,
@@ -210,6 +212,41 @@ class BcolzDailyBarTestCase(TestCase):
             TEST_QUERY_STOP,
         )
 
+    def test_read_with_mask(self):
+        table = self.writer.write(self.dest, self.trading_days, self.assets)
+        reader = BcolzDailyBarReader(table)
+        columns = [USEquityPricing.close, USEquityPricing.volume]
+        dates = self.trading_days_between(TEST_QUERY_START, TEST_QUERY_STOP)
+
+        mask = ones((len(dates), len(self.assets)), dtype=bool)
+        # Never live.
+        mask[:, 2] = False
+        # Live for a span in the middle of the query.
+        mask[:, 3] = False
+        mask[2:5, 3] = True
+
+        close, volume = reader.load_raw_arrays(
+            columns,
+            TEST_QUERY_START,
+            TEST_QUERY_STOP,
+            self.assets,
+            mask=mask,
+        )
+        expected_close = self.writer.expected_values_2d(
+            dates,
+            self.assets,
+            'close',
+        )
+        expected_volume = self.writer.expected_values_2d(
+            dates,
+            self.assets,
+            'volume',
+        )
+        expected_close[~mask] = nan
+        expected_volume[~mask] = 0
+        assert_array_equal(close, expected_close)
+        assert_array_equal(volume, expected_volume)
+
     def test_start_on_asset_start(self):
         """
         Test loading with queries that starts on the first day of each asset's
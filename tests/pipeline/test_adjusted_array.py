@@ -10,6 +10,7 @@ from numpy import (
     arange,
     array,
     full,
+    may_share_memory,
     where,
 )
 from numpy.testing import assert_array_equal
@@ -27,6 +28,7 @@ from zipline.utils.numpy_utils import (
     coerce_to_dtype,
     datetime64ns_dtype,
     default_missing_value_for_dtype,
+    float32_dtype,
     float64_dtype,
     int64_dtype,
 )
@@ -102,6 +104,7 @@ def _gen_multiplicative_adjustment_cases(dtype):
     We then build all legal windows over these buffers.
     """
     adjustment_type = {
+        float32_dtype: Float64Multiply,
         float64_dtype: Float64Multiply,
     }[dtype]
 
@@ -282,7 +285,12 @@ class AdjustedArrayTestCase(TestCase):
                 self.assertEqual(yielded.dtype, data.dtype)
                 assert_array_equal(yielded, expected_yield)
 
-    @parameterized.expand(_gen_multiplicative_adjustment_cases(float64_dtype))
+    @parameterized.expand(
+        chain(
+            _gen_multiplicative_adjustment_cases(float64_dtype),
+            _gen_multiplicative_adjustment_cases(float32_dtype),
+        )
+    )
     def test_multiplicative_adjustments(self,
                                         name,
                                         data,
@@ -295,6 +303,7 @@ class AdjustedArrayTestCase(TestCase):
         for _ in range(2):  # Iterate 2x ensure adjusted_arrays are re-usable.
             window_iter = array.traverse(lookback)
             for yielded, expected_yield in zip_longest(window_iter, expected):
+                self.assertEqual(yielded.dtype, data.dtype)
                 assert_array_equal(yielded, expected_yield)
 
     @parameterized.expand(
@@ -341,6 +350,122 @@ class AdjustedArrayTestCase(TestCase):
         for expected, actual in zip(gen_expected, gen_actual):
             check_arrays(expected, actual)
 
+    @parameter_space(max_batch=[1, 2, 10], offset=[0, 1])
+    def test_batches_match_windows(self, max_batch, offset):
+        data = arange(48, dtype=float).reshape(12, 4)
+        adjustments = {
+            3: [Float64Multiply(0, 3, 0, 0, 2.0)],
+            4: [Float64Multiply(2, 4, 1, 2, 0.5)],
+            9: [Float64Multiply(0, 9, 3, 3, 4.0)],
+        }
+        adj_array = AdjustedArray(data, NOMASK, adjustments, float('nan'))
+
+        # Copy, since windows are only valid until the next advance.
+        expected = [
+            window.copy() for window in adj_array.traverse(3, offset=offset)
+        ]
+        windows = adj_array.traverse(3, offset=offset)
+        batches = []
+        while windows.batch_length():
+            size = min(max_batch, windows.batch_length())
+            batch = windows.next_batch(size)
+            self.assertEqual(batch.shape, (size, 3, 4))
+            with self.assertRaises(ValueError):
+                batch[0, 0, 0] = 5.0
+            # Copy, since batches are only valid until the next advance.
+            batches.extend(batch.copy())
+
+        self.assertEqual(len(batches), len(expected))
+        for actual, window in zip(batches, expected):
+            assert_array_equal(actual, window)
+
+    def test_batch_length_stops_at_adjustments(self):
+        data = arange(30, dtype=float).reshape(10, 3)
+        adj_array = AdjustedArray(
+            data,
+            NOMASK,
+            {5: [Float64Multiply(0, 5, 0, 0, 2.0)]},
+            float('nan'),
+        )
+        windows = adj_array.traverse(2)
+
+        # Windows ending at rows 1 through 4 don't see the adjustment, which
+        # is applied before the window ending at row 5.
+        self.assertEqual(windows.batch_length(), 4)
+        with self.assertRaises(ValueError):
+            windows.next_batch(5)
+
+        windows.next_batch(4)
+        self.assertEqual(windows.batch_length(), 5)
+        windows.next_batch(5)
+        self.assertEqual(windows.batch_length(), 0)
+
+    def test_traverse_copies_on_write(self):
+        data = arange(30, dtype=float).reshape(10, 3)
+        adj_array = AdjustedArray(
+            data,
+            NOMASK,
+            {5: [Float64Multiply(0, 5, 0, 0, 2.0)]},
+            float('nan'),
+        )
+        baseline = adj_array.data.copy()
+
+        windows = adj_array.traverse(2)
+        self.assertTrue(windows.shares_data)
+        # Windows before the adjustment view the array's data directly.
+        for _ in range(4):
+            window = next(windows)
+            self.assertTrue(may_share_memory(window, adj_array.data))
+        self.assertTrue(windows.shares_data)
+
+        # Applying the adjustment switches to a private copy.
+        window = next(windows)
+        self.assertFalse(windows.shares_data)
+        self.assertFalse(may_share_memory(window, adj_array.data))
+        assert_array_equal(window[:, 0], baseline[4:6, 0] * 2)
+        for window in windows:
+            pass
+        assert_array_equal(adj_array.data, baseline)
+
+        # Traversing past the last adjustment never copies.
+        unadjusted = AdjustedArray(data, NOMASK, {}, float('nan'))
+        windows = unadjusted.traverse(3)
+        for window in windows:
+            self.assertTrue(may_share_memory(window, unadjusted.data))
+        self.assertTrue(windows.shares_data)
+
+    def test_custom_adjustment_type(self):
+
+        class Negate(Float64Multiply):
+            """
+            Adjustment with a mutate method the compiled windows don't know
+            about.
+            """
+            def mutate(self, data):
+                for row in range(self.first_row, self.last_row + 1):
+                    for col in range(self.first_col, self.last_col + 1):
+                        data[row, col] = -data[row, col]
+
+        data = arange(12, dtype=float).reshape(4, 3)
+        adj_array = AdjustedArray(
+            data,
+            NOMASK,
+            {
+                1: [Negate(0, 1, 1, 1, 0.0)],
+                2: [Float64Multiply(0, 2, 1, 2, 2.0)],
+            },
+            float('nan'),
+        )
+        windows = [window.copy() for window in adj_array.traverse(2)]
+
+        # Adjustments are applied before any window ending after their row.
+        expected = data.copy()
+        expected[0:2, 1] *= -1
+        assert_array_equal(windows[0], expected[0:2])
+        expected[0:3, 1:3] *= 2
+        assert_array_equal(windows[1], expected[1:3])
+        assert_array_equal(windows[2], expected[2:4])
+
     def test_invalid_lookback(self):
 
         data = arange(30, dtype=float).reshape(6, 5)
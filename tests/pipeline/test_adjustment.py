@@ -3,6 +3,8 @@ Tests for zipline.lib.adjustment
 """
 from unittest import TestCase
 from nose_parameterized import parameterized
+from numpy import dtype
+from numpy.testing import assert_array_equal
 
 from zipline.lib import adjustment as adj
 from zipline.utils.numpy_utils import make_datetime64ns
@@ -68,3 +70,35 @@ class AdjustmentTestCase(TestCase):
             "%r." % SomeClass
         )
         self.assertEqual(str(exc), expected_msg)
+
+    def test_pack_adjustments(self):
+        multiply = adj.Float64Multiply(0, 4, 1, 2, 0.5)
+        add = adj.Float64Add(1, 4, 0, 0, 3.0)
+        overwrite = adj.Float64Overwrite(2, 7, 3, 3, 1.5)
+        dt_overwrite = adj.Datetime64Overwrite(
+            0, 1, 0, 0, make_datetime64ns(0),
+        )
+        packed = adj.pack_adjustments(
+            {7: [overwrite, dt_overwrite], 4: [multiply, add]},
+            dtype('float64'),
+        )
+
+        # Adjustments are sorted by anchor, keeping their order within an
+        # anchor.
+        assert_array_equal(packed.anchors, [4, 4, 7, 7])
+        assert_array_equal(packed.first_rows, [0, 1, 2, 0])
+        assert_array_equal(packed.last_rows, [4, 4, 7, 1])
+        assert_array_equal(packed.first_cols, [1, 0, 3, 0])
+        assert_array_equal(packed.last_cols, [2, 0, 3, 0])
+        # The datetime adjustment doesn't apply to float data, so it's left
+        # for its mutate method to handle.
+        assert_array_equal(
+            packed.kinds,
+            [adj.MULTIPLY, adj.ADD, adj.OVERWRITE, adj.CUSTOM],
+        )
+        assert_array_equal(packed.values, [0.5, 3.0, 1.5, 0.0])
+        self.assertEqual(packed.objects, [None, None, None, dt_overwrite])
+
+        empty = adj.pack_adjustments({}, dtype('int64'))
+        self.assertEqual(len(empty.anchors), 0)
+        self.assertEqual(empty.values.dtype, dtype('int64'))
@@ -0,0 +1,293 @@
+"""
+Tests for zipline.pipeline.cache.
+"""
+from unittest import TestCase
+
+from mock import patch
+from numpy import arange
+from numpy.testing import assert_array_equal
+from pandas import DataFrame, date_range, Int64Index, Timestamp
+from pandas.util.testing import assert_frame_equal
+from testfixtures import TempDirectory
+
+from zipline.finance.trading import TradingEnvironment
+from zipline.pipeline import CustomFactor, Pipeline
+from zipline.pipeline.cache import TermResultCache, term_fingerprint
+from zipline.pipeline.data import USEquityPricing
+from zipline.pipeline.engine import SimplePipelineEngine
+from zipline.pipeline.factors import SimpleMovingAverage
+from zipline.pipeline.loaders.frame import DataFrameLoader
+from zipline.testing import make_simple_equity_info
+
+
+class CountingFactor(CustomFactor):
+    """
+    Factor recording the dates on which it's computed.
+    """
+    inputs = [USEquityPricing.close]
+    window_length = 2
+    calls = []
+
+    def compute(self, today, assets, out, close):
+        self.calls.append(today)
+        out[:] = close.sum(axis=0)
+
+
+# Global used by ``shift``, which is in turn used by ShiftedFactor.
+SHIFT = 1.0
+
+
+def shift(values):
+    return values + SHIFT
+
+
+class ShiftedFactor(CustomFactor):
+    """
+    Factor computed with a module-level helper, recording the dates on which
+    it's computed.
+    """
+    inputs = [USEquityPricing.close]
+    window_length = 1
+    calls = []
+
+    def compute(self, today, assets, out, close):
+        self.calls.append(today)
+        out[:] = shift(close[-1])
+
+
+class TermFingerprintTestCase(TestCase):
+
+    def test_fingerprint(self):
+        sma = SimpleMovingAverage(
+            inputs=[USEquityPricing.close],
+            window_length=5,
+        )
+        same = SimpleMovingAverage(
+            inputs=[USEquityPricing.close],
+            window_length=5,
+        )
+        longer = SimpleMovingAverage(
+            inputs=[USEquityPricing.close],
+            window_length=10,
+        )
+        of_open = SimpleMovingAverage(
+            inputs=[USEquityPricing.open],
+            window_length=5,
+        )
+
+        self.assertEqual(term_fingerprint(sma), term_fingerprint(same))
+        self.assertNotEqual(term_fingerprint(sma), term_fingerprint(longer))
+        self.assertNotEqual(term_fingerprint(sma), term_fingerprint(of_open))
+        self.assertNotEqual(
+            term_fingerprint(sma),
+            term_fingerprint(sma.rank()),
+        )
+
+    def test_fingerprint_covers_code(self):
+
+        def make_factor(offset):
+            class Offset(CustomFactor):
+                inputs = [USEquityPricing.close]
+                window_length = 1
+
+                if offset:
+                    def compute(self, today, assets, out, close):
+                        out[:] = close[-1] + 1
+                else:
+                    def compute(self, today, assets, out, close):
+                        out[:] = close[-1]
+
+            return Offset()
+
+        self.assertNotEqual(
+            term_fingerprint(make_factor(True)),
+            term_fingerprint(make_factor(False)),
+        )
+
+    def test_fingerprint_covers_referenced_values(self):
+        factor = ShiftedFactor()
+        expected = term_fingerprint(factor)
+        self.assertEqual(term_fingerprint(ShiftedFactor()), expected)
+
+        # Globals used by helpers.
+        with patch.dict(globals(), {'SHIFT': 2.0}):
+            self.assertNotEqual(term_fingerprint(factor), expected)
+
+        # The code of helpers.
+        def other_shift(values):
+            return values - SHIFT
+
+        with patch.dict(globals(), {'shift': other_shift}):
+            self.assertNotEqual(term_fingerprint(factor), expected)
+
+        # Class attributes other than methods.
+        with patch.object(ShiftedFactor, 'window_safe', True, create=True):
+            self.assertNotEqual(term_fingerprint(factor), expected)
+
+        self.assertEqual(term_fingerprint(factor), expected)
+
+    def test_fingerprint_covers_closures(self):
+
+        def make_factor(offset):
+            class Offset(CustomFactor):
+                inputs = [USEquityPricing.close]
+                window_length = 1
+
+                def compute(self, today, assets, out, close):
+                    out[:] = close[-1] + offset
+
+            return Offset()
+
+        self.assertEqual(
+            term_fingerprint(make_factor(1.0)),
+            term_fingerprint(make_factor(1.0)),
+        )
+        self.assertNotEqual(
+            term_fingerprint(make_factor(1.0)),
+            term_fingerprint(make_factor(2.0)),
+        )
+
+
+class TermResultCacheTestCase(TestCase):
+
+    def setUp(self):
+        self.dir_ = TempDirectory()
+        self.dir_.create()
+
+    def tearDown(self):
+        self.dir_.cleanup()
+
+    def test_roundtrip(self):
+        cache = TermResultCache(self.dir_.getpath('cache'))
+        self.assertIsNone(cache.get('key'))
+
+        expected = arange(20.0).reshape(4, 5)
+        cache.put('key', expected)
+        assert_array_equal(cache.get('key'), expected)
+        self.assertIsNone(cache.get('other'))
+
+        cache.clear()
+        self.assertIsNone(cache.get('key'))
+        self.assertEqual(cache.nbytes, 0)
+
+    def test_size_limit(self):
+        value = arange(100.0)
+        cache = TermResultCache(self.dir_.getpath('cache'), max_bytes=2000)
+
+        for i in range(5):
+            cache.put('key%d' % i, value)
+            self.assertLessEqual(cache.nbytes, 2000)
+
+        # Each entry is a bit larger than 800 bytes, so only the last two
+        # fit.
+        self.assertIsNotNone(cache.get('key4'))
+        self.assertIsNotNone(cache.get('key3'))
+        self.assertIsNone(cache.get('key0'))
+
+
+class EngineTermCacheTestCase(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.env = TradingEnvironment()
+        cls.dates = date_range(
+            '2015-02-01',
+            '2015-02-28',
+            freq=cls.env.trading_day,
+            tz='UTC',
+        )
+        cls.sids = Int64Index([1, 2, 3])
+        cls.env.write_data(equities_df=make_simple_equity_info(
+            cls.sids,
+            start_date=Timestamp('2015-01-31', tz='UTC'),
+            end_date=Timestamp('2015-03-01', tz='UTC'),
+        ))
+        cls.asset_finder = cls.env.asset_finder
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.env
+        del cls.asset_finder
+
+    def setUp(self):
+        self.dir_ = TempDirectory()
+        self.dir_.create()
+        del CountingFactor.calls[:]
+        del ShiftedFactor.calls[:]
+
+    def tearDown(self):
+        self.dir_.cleanup()
+
+    def make_engine(self, data, cache):
+        loader = DataFrameLoader(
+            USEquityPricing.close,
+            DataFrame(data, index=self.dates, columns=self.sids),
+        )
+        return SimplePipelineEngine(
+            lambda column: loader,
+            self.dates,
+            self.asset_finder,
+            term_cache=cache,
+        )
+
+    def run_counted(self, engine):
+        pipeline = Pipeline(columns={'counted': CountingFactor()})
+        return engine.run_pipeline(pipeline, self.dates[5], self.dates[-1])
+
+    def test_results_are_reused(self):
+        cache = TermResultCache(self.dir_.getpath('cache'))
+        data = arange(len(self.dates) * len(self.sids), dtype=float).reshape(
+            len(self.dates), len(self.sids),
+        )
+
+        first = self.run_counted(self.make_engine(data, cache))
+        num_calls = len(CountingFactor.calls)
+        self.assertGreater(num_calls, 0)
+
+        # A new engine over the same data should read results from the cache.
+        second = self.run_counted(self.make_engine(data, cache))
+        self.assertEqual(len(CountingFactor.calls), num_calls)
+        assert_frame_equal(second, first)
+
+        # Changing the data changes the loader's data version.
+        third = self.run_counted(self.make_engine(data * 2, cache))
+        self.assertEqual(len(CountingFactor.calls), num_calls * 2)
+        assert_frame_equal(third, first * 2)
+
+    def test_changed_helper_misses_cache(self):
+        cache = TermResultCache(self.dir_.getpath('cache'))
+        data = arange(len(self.dates) * len(self.sids), dtype=float).reshape(
+            len(self.dates), len(self.sids),
+        )
+        pipeline = Pipeline(columns={'shifted': ShiftedFactor()})
+
+        def run():
+            return self.make_engine(data, cache).run_pipeline(
+                pipeline, self.dates[5], self.dates[-1],
+            )
+
+        first = run()
+        num_calls = len(ShiftedFactor.calls)
+        self.assertGreater(num_calls, 0)
+        assert_frame_equal(run(), first)
+        self.assertEqual(len(ShiftedFactor.calls), num_calls)
+
+        def double_shift(values):
+            return values + 2 * SHIFT
+
+        with patch.dict(globals(), {'shift': double_shift}):
+            second = run()
+        self.assertEqual(len(ShiftedFactor.calls), 2 * num_calls)
+        assert_frame_equal(second, first + 1.0)
+
+    def test_no_cache(self):
+        data = arange(len(self.dates) * len(self.sids), dtype=float).reshape(
+            len(self.dates), len(self.sids),
+        )
+        first = self.run_counted(self.make_engine(data, None))
+        second = self.run_counted(self.make_engine(data, None))
+        self.assertEqual(
+            len(CountingFactor.calls),
+            2 * len(self.dates[5:]),
+        )
+        assert_frame_equal(second, first)
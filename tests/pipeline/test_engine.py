@@ -15,11 +15,12 @@ from numpy import (
     full,
     log,
     nan,
+    ones,
     tile,
     where,
     zeros,
 )
-from numpy.testing import assert_almost_equal
+from numpy.testing import assert_almost_equal, assert_array_equal
 from pandas import (
     DataFrame,
     date_range,
@@ -52,7 +53,12 @@ from zipline.pipeline.loaders.frame import DataFrameLoader
 from zipline.pipeline.loaders.equity_pricing_loader import (
     USEquityPricingLoader,
 )
-from zipline.pipeline.engine import SimplePipelineEngine
+from zipline.pipeline.engine import (
+    SimplePipelineEngine,
+    _WorkspaceRefcounts,
+)
+from zipline.pipeline.graph import TermGraph
+from zipline.pipeline.term import AssetExists
 from zipline.pipeline import CustomFactor
 from zipline.pipeline.factors import (
     AverageDollarVolume,
@@ -61,7 +67,10 @@ from zipline.pipeline.factors import (
     ExponentialWeightedMovingAverage,
     ExponentialWeightedMovingStdDev,
     MaxDrawdown,
+    Returns,
+    RSI,
     SimpleMovingAverage,
+    VWAP,
 )
 from zipline.testing import (
     make_rotating_equity_info,
@@ -72,6 +81,22 @@ from zipline.testing import (
 from zipline.utils.memoize import lazyval
 
 
+def unbatched(factor_type):
+    """
+    Make a subclass of ``factor_type`` that calls ``compute`` once per date
+    instead of using ``compute_batch``.
+    """
+    def compute(self, today, assets, out, *inputs, **params):
+        super(subtype, self).compute(today, assets, out, *inputs, **params)
+
+    subtype = type(
+        'Unbatched' + factor_type.__name__,
+        (factor_type,),
+        {'compute': compute},
+    )
+    return subtype
+
+
 class RollingSumDifference(CustomFactor):
     window_length = 3
     inputs = [USEquityPricing.open, USEquityPricing.close]
@@ -607,6 +632,119 @@ class ConstantInputTestCase(TestCase):
                          {ColumnArgs.sorted_by_ds(Loader2DataSet.col1,
                                                   Loader2DataSet.col2)})
 
+    def test_num_threads_matches_serial(self):
+        loader = self.loader
+        dates = self.dates[10:15]
+
+        short_factor = RollingSumDifference(window_length=3)
+        long_factor = RollingSumDifference(window_length=5)
+        high_factor = RollingSumDifference(
+            window_length=3,
+            inputs=[USEquityPricing.open, USEquityPricing.high],
+        )
+        pipeline = Pipeline(
+            columns={
+                'short': short_factor,
+                'long': long_factor,
+                'high': high_factor,
+                'combined': (short_factor + long_factor) / high_factor,
+                'asset_id': AssetID(),
+            },
+            screen=AssetID() > 1,
+        )
+
+        results = [
+            SimplePipelineEngine(
+                lambda column: loader,
+                self.dates,
+                self.asset_finder,
+                num_threads=num_threads,
+            ).run_pipeline(pipeline, dates[0], dates[-1])
+            for num_threads in (1, 2, 8)
+        ]
+        serial = results[0]
+        self.assertEqual(len(serial), len(dates) * (len(self.assets) - 1))
+        for result in results[1:]:
+            assert_frame_equal(result, serial)
+
+    def test_num_threads_reraises_errors(self):
+
+        class Broken(CustomFactor):
+            inputs = [USEquityPricing.close]
+            window_length = 2
+
+            def compute(self, today, assets, out, close):
+                raise ZeroDivisionError()
+
+        loader = self.loader
+        engine = SimplePipelineEngine(
+            lambda column: loader,
+            self.dates,
+            self.asset_finder,
+            num_threads=4,
+        )
+        pipeline = Pipeline(
+            columns={'ok': RollingSumDifference(), 'broken': Broken()},
+        )
+        with self.assertRaises(ZeroDivisionError):
+            engine.run_pipeline(pipeline, self.dates[10], self.dates[15])
+
+    def test_workspace_eviction(self):
+        open_, close = USEquityPricing.open, USEquityPricing.close
+        rolling = RollingSumDifference()
+        latest_open = OpenPrice()
+        combined = rolling + latest_open
+        root = AssetExists()
+
+        graph = TermGraph({'combined': combined})
+        workspace = {root: ones((5, 4), dtype=bool)}
+        refcounts = _WorkspaceRefcounts(graph, workspace)
+        self.assertEqual(refcounts.nbytes, 20)
+
+        def values():
+            return zeros((5, 4))
+
+        refcounts.store((close, open_), {close: values(), open_: values()})
+        self.assertEqual(set(workspace), {root, open_, close})
+        self.assertEqual(refcounts.nbytes, 340)
+
+        # `close` is only needed by `rolling`, but `open` is also needed by
+        # `latest_open`.
+        refcounts.store((rolling,), {rolling: values()})
+        self.assertEqual(set(workspace), {root, open_, rolling})
+        self.assertEqual(refcounts.nbytes, 340)
+
+        refcounts.store((latest_open,), {latest_open: values()})
+        self.assertEqual(set(workspace), {root, rolling, latest_open})
+
+        refcounts.store((combined,), {combined: values()})
+        self.assertEqual(set(workspace), {combined})
+        self.assertEqual(refcounts.nbytes, 160)
+        self.assertEqual(refcounts.peak_nbytes, 500)
+
+    def test_peak_workspace_nbytes(self):
+        loader = self.loader
+        engine = SimplePipelineEngine(
+            lambda column: loader, self.dates, self.asset_finder,
+        )
+        self.assertIsNone(engine.peak_workspace_nbytes)
+
+        engine.run_pipeline(
+            Pipeline(columns={'f': RollingSumDifference() + OpenPrice()}),
+            self.dates[10],
+            self.dates[14],
+        )
+        self.assertGreater(engine.peak_workspace_nbytes, 0)
+
+    def test_bad_num_threads(self):
+        with self.assertRaises(ValueError):
+            SimplePipelineEngine(
+                lambda column: self.loader,
+                self.dates,
+                self.asset_finder,
+                num_threads=0,
+            )
+
 
 class FrameInputTestCase(TestCase):
 
@@ -724,6 +862,72 @@ class FrameInputTestCase(TestCase):
                 high_results = results.unstack()['high']
                 assert_frame_equal(high_results, high_base.iloc[iloc_bounds])
 
+    @parameterized.expand([
+        (SimpleMovingAverage, {'inputs': [USEquityPricing.close]}),
+        (AverageDollarVolume, {}),
+        (VWAP, {}),
+        (EWMA, {'inputs': [USEquityPricing.close], 'decay_rate': 0.5}),
+        (EWMSTD, {'inputs': [USEquityPricing.close], 'decay_rate': 0.5}),
+    ])
+    def test_rolling_factors_with_adjustments(self, factor_type, kwargs):
+        dates, asset_ids = self.dates, self.asset_ids
+        close = self.make_frame(
+            arange(len(dates) * len(asset_ids), dtype=float).reshape(
+                len(dates), len(asset_ids),
+            ) % 7 + 10,
+        )
+        close.iloc[5, 0] = nan
+        close.iloc[12:15, 2] = nan
+        adjustments = DataFrame.from_records([
+            dict(
+                kind=MULTIPLY,
+                sid=sid,
+                value=ratio,
+                start_date=None,
+                end_date=dates[idx - 1],
+                apply_date=dates[idx],
+            )
+            for sid, ratio, idx in [
+                (asset_ids[0], 0.5, 8),
+                (asset_ids[1], 3.0, 10),
+                (asset_ids[0], 0.25, 15),
+            ]
+        ])
+        engine = SimplePipelineEngine(
+            {
+                USEquityPricing.close: DataFrameLoader(
+                    USEquityPricing.close, close, adjustments,
+                ),
+                USEquityPricing.volume: DataFrameLoader(
+                    USEquityPricing.volume, close * 100 + 1,
+                ),
+            }.__getitem__,
+            dates,
+            self.asset_finder,
+        )
+
+        # Rolling kernels must restart their running totals wherever an
+        # adjustment rewrites the trailing window.
+        window_length = 5
+        results = engine.run_pipeline(
+            Pipeline(
+                columns={
+                    'batched': factor_type(
+                        window_length=window_length, **kwargs
+                    ),
+                    'unbatched': unbatched(factor_type)(
+                        window_length=window_length, **kwargs
+                    ),
+                }
+            ),
+            dates[window_length],
+            dates[-1],
+        )
+        assert_frame_equal(
+            results['batched'].unstack(),
+            results['unbatched'].unstack(),
+        )
+
 
 class SyntheticBcolzTestCase(TestCase):
 
@@ -930,11 +1134,12 @@ class ParameterizedFactorTestCase(TestCase):
             cls.raw_data * 2,
         )
 
+        cls.get_loader = {
+            USEquityPricing.close: close_loader,
+            USEquityPricing.volume: volume_loader,
+        }.__getitem__
         cls.engine = SimplePipelineEngine(
-            {
-                USEquityPricing.close: close_loader,
-                USEquityPricing.volume: volume_loader,
-            }.__getitem__,
+            cls.get_loader,
             cls.dates,
             cls.asset_finder,
         )
@@ -1078,3 +1283,266 @@ class ParameterizedFactorTestCase(TestCase):
 
         expected_5 = rolling_mean((self.raw_data ** 2) * 2, window=5)[5:]
         assert_frame_equal(results['dv5'].unstack(), expected_5)
+
+    @parameterized.expand([
+        (Returns, {}),
+        (RSI, {}),
+        (SimpleMovingAverage, {'inputs': [USEquityPricing.close]}),
+        (VWAP, {}),
+        (AverageDollarVolume, {}),
+        (MaxDrawdown, {'inputs': [USEquityPricing.close]}),
+        (EWMA, {'inputs': [USEquityPricing.close], 'decay_rate': 0.5}),
+        (EWMSTD, {'inputs': [USEquityPricing.close], 'decay_rate': 0.5}),
+    ])
+    def test_compute_batch_matches_compute(self, factor_type, kwargs):
+        small_batches = type(
+            'SmallBatch' + factor_type.__name__,
+            (factor_type,),
+            {'max_batch_elements': 1},
+        )
+        window_length = 5
+        results = self.engine.run_pipeline(
+            Pipeline(
+                columns={
+                    'batched': factor_type(
+                        window_length=window_length, **kwargs
+                    ),
+                    'small_batches': small_batches(
+                        window_length=window_length, **kwargs
+                    ),
+                    'unbatched': unbatched(factor_type)(
+                        window_length=window_length, **kwargs
+                    ),
+                }
+            ),
+            self.dates[window_length],
+            self.dates[-1],
+        )
+
+        expected = results['unbatched'].unstack()
+        assert_frame_equal(results['batched'].unstack(), expected)
+        assert_frame_equal(results['small_batches'].unstack(), expected)
+
+    def screened_pipeline(self):
+        sma = SimpleMovingAverage(
+            inputs=[USEquityPricing.close],
+            window_length=5,
+        )
+        return Pipeline(
+            columns={
+                'sma': sma,
+                'dv': AverageDollarVolume(window_length=3),
+                'returns': Returns(window_length=2),
+            },
+            screen=sma > 10,
+        )
+
+    def test_array_outputs_match_frame(self):
+        pipeline = self.screened_pipeline()
+        start_date, end_date = self.dates[5], self.dates[-1]
+        expected = self.engine.run_pipeline(pipeline, start_date, end_date)
+        expected_dates = expected.index.get_level_values(0).values
+        expected_sids = [
+            asset.sid for asset in expected.index.get_level_values(1)
+        ]
+
+        columnar = self.engine.run_pipeline(
+            pipeline, start_date, end_date, output='columnar',
+        )
+        assert_array_equal(columnar.dates, expected_dates)
+        assert_array_equal(columnar.sids, expected_sids)
+        self.assertEqual(set(columnar.columns), set(expected.columns))
+        for name, values in iteritems(columnar.columns):
+            assert_array_equal(values, expected[name].values)
+
+        dense = self.engine.run_pipeline(
+            pipeline, start_date, end_date, output='dense',
+        )
+        assert_array_equal(dense.dates, self.dates[5:])
+        assert_array_equal(dense.sids, self.sids)
+        rows, columns = dense.mask.nonzero()
+        assert_array_equal(dense.dates.values[rows], expected_dates)
+        assert_array_equal(dense.sids.values[columns], expected_sids)
+        self.assertEqual(set(dense.columns), set(expected.columns))
+        for name, values in iteritems(dense.columns):
+            assert_array_equal(values[dense.mask], expected[name].values)
+
+    def test_bad_output_format(self):
+        with self.assertRaises(ValueError):
+            self.engine.run_pipeline(
+                self.screened_pipeline(),
+                self.dates[5],
+                self.dates[-1],
+                output='wide',
+            )
+
+    def test_no_trading_days(self):
+        saturday = Timestamp('2015-02-14', tz='UTC')
+        self.assertNotIn(saturday, self.dates)
+        pipeline = self.screened_pipeline()
+
+        with self.assertRaises(ValueError):
+            self.engine.run_pipeline(pipeline, saturday, saturday)
+        for output in 'frame', 'dense', 'columnar':
+            with self.assertRaises(ValueError):
+                self.engine.run_chunked_pipeline(
+                    pipeline,
+                    saturday,
+                    saturday,
+                    chunksize=3,
+                    output=output,
+                )
+
+    @parameterized.expand(product([1, 3, 100], ['dense', 'columnar']))
+    def test_run_chunked_pipeline_array_outputs(self, chunksize, output):
+        pipeline = self.screened_pipeline()
+        start_date, end_date = self.dates[5], self.dates[-1]
+
+        expected = self.engine.run_pipeline(
+            pipeline, start_date, end_date, output=output,
+        )
+        result = self.engine.run_chunked_pipeline(
+            pipeline,
+            start_date,
+            end_date,
+            chunksize=chunksize,
+            output=output,
+        )
+        self.assertIs(type(result), type(expected))
+        for field in expected._fields:
+            if field == 'columns':
+                continue
+            assert_array_equal(
+                getattr(result, field),
+                getattr(expected, field),
+            )
+
+        mask = getattr(expected, 'mask', Ellipsis)
+        self.assertEqual(set(result.columns), set(expected.columns))
+        for name, values in iteritems(expected.columns):
+            assert_array_equal(result.columns[name][mask], values[mask])
+
+    @parameterized.expand(product([1, 3, 100], [1, 2]))
+    def test_run_chunked_pipeline(self, chunksize, processes):
+        pipeline = self.screened_pipeline()
+        start_date, end_date = self.dates[5], self.dates[-1]
+
+        expected = self.engine.run_pipeline(pipeline, start_date, end_date)
+        result = self.engine.run_chunked_pipeline(
+            pipeline,
+            start_date,
+            end_date,
+            chunksize=chunksize,
+            processes=processes,
+        )
+        assert_frame_equal(result, expected)
+
+    def test_screen_pushdown_matches_full_computation(self):
+        sma = SimpleMovingAverage(
+            inputs=[USEquityPricing.close],
+            window_length=5,
+        )
+        returns = Returns(window_length=2)
+        pipeline = Pipeline(
+            columns={
+                'sma': sma,
+                'dv': AverageDollarVolume(window_length=3),
+                'masked_dv': AverageDollarVolume(
+                    window_length=3,
+                    mask=returns.bottom(2),
+                ),
+                'returns_rank': returns.rank(),
+                'demeaned': sma.demean(),
+                'zscore_plus_one': sma.zscore() + 1,
+                'unbatched': unbatched(SimpleMovingAverage)(
+                    inputs=[USEquityPricing.close],
+                    window_length=5,
+                ),
+            },
+            screen=sma.top(2),
+        )
+        start_date, end_date = self.dates[5], self.dates[-1]
+
+        full_engine = SimplePipelineEngine(
+            self.get_loader,
+            self.dates,
+            self.asset_finder,
+            screen_pushdown=False,
+        )
+        expected = full_engine.run_pipeline(pipeline, start_date, end_date)
+        result = self.engine.run_pipeline(pipeline, start_date, end_date)
+        assert_frame_equal(result, expected)
+
+    def test_screen_pushdown_skips_assets(self):
+
+        class RecordAssets(CustomFactor):
+            inputs = [USEquityPricing.close]
+            window_length = 1
+            seen = []
+
+            def compute_batch(self, dates, assets, out, close):
+                self.seen.append(assets)
+                out[:] = close[:, -1]
+
+        sma = SimpleMovingAverage(
+            inputs=[USEquityPricing.close],
+            window_length=5,
+        )
+        pipeline = Pipeline(
+            columns={'recorded': RecordAssets()},
+            # Prices increase with sid, so only the last sid passes.
+            screen=sma.top(1),
+        )
+        result = self.engine.run_pipeline(
+            pipeline,
+            self.dates[5],
+            self.dates[-1],
+        )
+
+        self.assertTrue(RecordAssets.seen)
+        for assets in RecordAssets.seen:
+            assert_array_equal(assets, self.sids[-1:])
+        assert_array_equal(
+            result.index.get_level_values(1).unique(),
+            self.asset_finder.retrieve_all(self.sids[-1:]),
+        )
+
+    def test_run_pipelines(self):
+
+        class CountCalls(CustomFactor):
+            inputs = [USEquityPricing.close]
+            window_length = 3
+            calls = []
+
+            def compute_batch(self, dates, assets, out, close):
+                self.calls.append(dates)
+                out[:] = close.sum(axis=1)
+
+        shared = CountCalls()
+        pipelines = {
+            'screened': self.screened_pipeline(),
+            'counted': Pipeline(
+                columns={'shared': shared, 'ranked': shared.rank()},
+            ),
+            'also_counted': Pipeline(
+                columns={'shared': shared},
+                screen=shared.top(2),
+            ),
+        }
+        start_date, end_date = self.dates[5], self.dates[-1]
+
+        expected = {
+            name: self.engine.run_pipeline(pipeline, start_date, end_date)
+            for name, pipeline in iteritems(pipelines)
+        }
+        del CountCalls.calls[:]
+        results = self.engine.run_pipelines(pipelines, start_date, end_date)
+
+        # The shared factor is only computed once for both pipelines.
+        self.assertEqual(
+            sum(len(dates) for dates in CountCalls.calls),
+            len(self.dates[5:]),
+        )
+        self.assertEqual(set(results), set(pipelines))
+        for name, result in iteritems(results):
+            assert_frame_equal(result, expected[name])
@@ -20,9 +20,10 @@ from numpy import (
     rot90,
     where,
 )
-from numpy.random import randn, seed
+from numpy.random import randn, RandomState, seed
 
 from zipline.errors import UnknownRankMethod
+from zipline.lib import normalize
 from zipline.lib.rank import masked_rankdata_2d
 from zipline.lib.normalize import naive_grouped_rowwise_apply as grouped_apply
 from zipline.pipeline import Classifier, Factor, Filter, TermGraph
@@ -629,6 +630,38 @@ class FactorTestCase(BasePipelineTestCase):
             mask=self.build_mask(nomask),
         )
 
+    @parameter_space(
+        seed_value=[1, 2, 3],
+        normalizer_name_and_func=[
+            ('demean', lambda row: row - nanmean(row)),
+            ('zscore', lambda row: (row - nanmean(row)) / nanstd(row)),
+        ],
+    )
+    def test_compiled_grouped_normalizations(self,
+                                             seed_value,
+                                             normalizer_name_and_func):
+        name, func = normalizer_name_and_func
+        shape = (10, 40)
+        rand = RandomState(seed_value)
+
+        data = rand.randn(*shape)
+        data[rand.rand(*shape) < 0.25] = nan
+        labels = rand.randint(0, 5, shape).astype(int64_dtype)
+        # Group 0 is entirely NaN, and group 5 has a single member per row.
+        data[labels == 0] = nan
+        labels[:, 0] = 5
+
+        result = normalize.grouped_rowwise_apply(
+            data,
+            labels,
+            getattr(normalize, name),
+        )
+        check_allclose(
+            result,
+            grouped_apply(data, labels, func),
+            atol=1e-12,
+        )
+
     @parameter_space(method_name=['demean', 'zscore'])
     def test_cant_normalize_non_float(self, method_name):
         class DateFactor(Factor):
@@ -832,6 +865,29 @@ class FactorTestCase(BasePipelineTestCase):
             mask=self.build_mask(self.ones_mask(shape=shape)),
         )
 
+    def test_quantiles_fully_masked_rows(self):
+        shape = (3, 4)
+        factor_data = arange(12, dtype=float).reshape(shape)
+        mask_data = array([[True, True, True, True],
+                           [False, False, False, False],
+                           [True, False, True, True]])
+
+        f = F()
+        m = Mask()
+        self.check_terms(
+            terms={'2_masked': f.quantiles(bins=2, mask=m)},
+            initial_workspace={
+                f: factor_data,
+                m: mask_data,
+            },
+            expected={
+                '2_masked': array([[0, 0, 1, 1],
+                                   [-1, -1, -1, -1],
+                                   [0, -1, 0, 1]], dtype=int64_dtype),
+            },
+            mask=self.build_mask(self.ones_mask(shape=shape)),
+        )
+
     def test_quantile_helpers(self):
         f = self.f
         m = Mask()
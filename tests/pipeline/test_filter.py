@@ -178,6 +178,35 @@ class FilterTestCase(BasePipelineTestCase):
             expected = rowwise_rank(data) < c
             check_arrays(result, expected)
 
+    def test_top_and_bottom_match_rank(self):
+        # Few distinct values, so that most rows contain ties.
+        data = arange(19 * 7, dtype=float64).reshape(7, 19) % 4
+        data[[0, 2, 3], [5, 10, 15]] = nan
+        mask_data = ones_like(data, dtype=bool)
+        mask_data[[1, 3, 6], [0, 4, 18]] = False
+        # Rows with fewer than N unmasked, non-NaN values.
+        data[4, 3:] = nan
+        mask_data[5, 2:] = False
+
+        mask = Mask()
+        terms = {}
+        for N, masked in product([0, 1, 4, 5, 19, 25], [True, False]):
+            kwargs = {'mask': mask} if masked else {}
+            for method, ascending in ('top', False), ('bottom', True):
+                name = '_'.join([method, str(N), str(masked)])
+                terms[name] = getattr(self.f, method)(N, **kwargs)
+                rank = self.f.rank(ascending=ascending, **kwargs)
+                terms[name + '_expected'] = rank <= N
+
+        results = self.run_graph(
+            TermGraph(terms),
+            initial_workspace={self.f: data, mask: mask_data},
+            mask=self.build_mask(ones((7, 19))),
+        )
+        for name in terms:
+            if not name.endswith('_expected'):
+                check_arrays(results[name], results[name + '_expected'])
+
     def test_percentile_between(self):
 
         quintiles = range(5)
@@ -0,0 +1,160 @@
+"""
+Tests for zipline.pipeline.incremental.
+"""
+from unittest import TestCase
+
+from nose_parameterized import parameterized
+from numpy import arange
+from numpy.testing import assert_array_equal
+from pandas import DataFrame, date_range, Int64Index, Timestamp
+from pandas.util.testing import assert_frame_equal
+from six import iteritems
+
+from zipline.finance.trading import TradingEnvironment
+from zipline.lib.adjustment import MULTIPLY
+from zipline.pipeline import Pipeline
+from zipline.pipeline.data import USEquityPricing
+from zipline.pipeline.engine import SimplePipelineEngine
+from zipline.pipeline.factors import (
+    AverageDollarVolume,
+    Returns,
+    SimpleMovingAverage,
+)
+from zipline.pipeline.loaders.frame import DataFrameLoader
+from zipline.testing import make_simple_equity_info
+
+
+class IncrementalPipelineTestCase(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.env = TradingEnvironment()
+        cls.dates = dates = date_range(
+            '2015-02-01',
+            '2015-03-31',
+            freq=cls.env.trading_day,
+            tz='UTC',
+        )
+        cls.sids = sids = Int64Index([1, 2, 3, 4])
+        cls.env.write_data(equities_df=make_simple_equity_info(
+            sids,
+            start_date=Timestamp('2015-01-31', tz='UTC'),
+            end_date=Timestamp('2015-04-01', tz='UTC'),
+        ))
+        cls.asset_finder = cls.env.asset_finder
+
+        data = DataFrame(
+            arange(len(dates) * len(sids), dtype=float).reshape(
+                len(dates), len(sids),
+            ) + 1,
+            index=dates,
+            columns=sids,
+        )
+        # Split sid 2 twice, and sid 4 once.
+        adjustments = DataFrame.from_records([
+            dict(
+                kind=MULTIPLY,
+                sid=sid,
+                value=ratio,
+                start_date=None,
+                end_date=dates[idx - 1],
+                apply_date=dates[idx],
+            )
+            for sid, ratio, idx in [(2, 0.5, 12), (2, 0.25, 30), (4, 2.0, 20)]
+        ])
+        close_loader = DataFrameLoader(
+            USEquityPricing.close,
+            data,
+            adjustments=adjustments,
+        )
+        volume_loader = DataFrameLoader(USEquityPricing.volume, data * 10)
+        cls.engine = SimplePipelineEngine(
+            {
+                USEquityPricing.close: close_loader,
+                USEquityPricing.volume: volume_loader,
+            }.__getitem__,
+            dates,
+            cls.asset_finder,
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.env
+        del cls.asset_finder
+
+    def make_pipeline(self):
+        sma = SimpleMovingAverage(
+            inputs=[USEquityPricing.close],
+            window_length=10,
+        )
+        returns = Returns(window_length=5)
+        return Pipeline(
+            columns={
+                'sma': sma,
+                'dv': AverageDollarVolume(window_length=3),
+                'returns_rank': returns.rank(),
+                'close': USEquityPricing.close.latest,
+            },
+            screen=sma.top(3),
+        )
+
+    @parameterized.expand([(1,), (4,), (100,)])
+    def test_matches_run_pipeline(self, chunksize):
+        pipeline = self.make_pipeline()
+        start_date, end_date = self.dates[10], self.dates[-1]
+        expected = self.engine.run_pipeline(pipeline, start_date, end_date)
+
+        incremental = self.engine.incremental_pipeline(
+            pipeline,
+            start_date,
+            end_date,
+            chunksize=chunksize,
+        )
+        for date in self.dates[10:]:
+            self.assertEqual(incremental.next_date, date)
+            result = incremental.compute(date)
+            expected_today = expected.loc[[date]]
+            self.assertEqual(list(result.index), list(expected_today.index))
+            assert_frame_equal(
+                result.reset_index(drop=True),
+                expected_today.reset_index(drop=True),
+            )
+        self.assertIsNone(incremental.next_date)
+
+    def test_skipped_dates(self):
+        pipeline = self.make_pipeline()
+        start_date, end_date = self.dates[10], self.dates[-1]
+        expected = self.engine.run_pipeline(
+            pipeline, start_date, end_date, output='dense',
+        )
+
+        incremental = self.engine.incremental_pipeline(
+            pipeline, start_date, end_date, chunksize=7, output='dense',
+        )
+        for idx in range(0, len(expected.dates), 3):
+            date = expected.dates[idx]
+            result = incremental.compute(date)
+            # Asking for the same date again doesn't recompute.
+            self.assertIs(incremental.compute(date), result)
+
+            assert_array_equal(result.mask, expected.mask[idx:idx + 1])
+            for name, values in iteritems(result.columns):
+                mask = result.mask
+                assert_array_equal(
+                    values[mask],
+                    expected.columns[name][idx:idx + 1][mask],
+                )
+
+        with self.assertRaises(ValueError):
+            incremental.compute(self.dates[10])
+
+    def test_bad_dates(self):
+        incremental = self.engine.incremental_pipeline(
+            self.make_pipeline(), self.dates[10], self.dates[20],
+        )
+        with self.assertRaises(ValueError):
+            incremental.compute(self.dates[9])
+        with self.assertRaises(ValueError):
+            incremental.compute(self.dates[21])
+        with self.assertRaises(ValueError):
+            incremental.compute(Timestamp('2015-02-14', tz='UTC'))
@@ -39,6 +39,7 @@ from zipline.api import (
 from zipline.data.data_portal import DataPortal
 from zipline.errors import (
     AttachPipelineAfterInitialize,
+    DuplicatePipelineName,
     PipelineOutputDuringInitialize,
     NoSuchPipeline,
 )
@@ -302,6 +303,90 @@ class ClosesOnly(TestCase):
         with self.assertRaises(NoSuchPipeline):
             algo.run(self.data_portal)
 
+    def test_duplicate_pipeline_name(self):
+        """
+        Assert that attaching two pipelines with the same name raises.
+        """
+        def initialize(context):
+            attach_pipeline(Pipeline(), 'test')
+            attach_pipeline(Pipeline(), 'test')
+            raise AssertionError("Shouldn't make it past attach_pipeline!")
+
+        algo = TradingAlgorithm(
+            initialize=initialize,
+            data_frequency='daily',
+            get_pipeline_loader=lambda column: self.pipeline_loader,
+            start=self.first_asset_start - trading_day,
+            end=self.last_asset_end + trading_day,
+            env=self.env,
+        )
+
+        with self.assertRaises(DuplicatePipelineName):
+            algo.run(self.data_portal)
+
+    @parameterized.expand([('same_chunks', 5),
+                           ('different_chunks', 3)])
+    def test_multiple_pipelines(self, test_name, other_chunksize):
+        """
+        Assert that several attached pipelines each produce their own
+        outputs and screen.
+        """
+        close = USEquityPricing.close.latest
+
+        def initialize(context):
+            attach_pipeline(
+                Pipeline(columns={'close': close}),
+                'all',
+                chunksize=5,
+            )
+            attach_pipeline(
+                Pipeline(
+                    columns={'close': close, 'doubled': close * 2},
+                    screen=close > 20,
+                ),
+                'screened',
+                chunksize=other_chunksize,
+            )
+
+        def handle_data(context, data):
+            all_results = pipeline_output('all')
+            screened_results = pipeline_output('screened')
+            self.assertEqual(list(all_results.columns), ['close'])
+            self.assertEqual(
+                sorted(screened_results.columns), ['close', 'doubled'],
+            )
+            date = get_datetime().normalize()
+            for asset in self.assets:
+                exists_today = self.exists(date, asset)
+                existed_yesterday = self.exists(date - trading_day, asset)
+                if not (exists_today and existed_yesterday):
+                    self.assertNotIn(asset, all_results.index)
+                    self.assertNotIn(asset, screened_results.index)
+                    continue
+                expected = self.expected_close(date, asset)
+                self.assertEqual(all_results.loc[asset, 'close'], expected)
+                if expected <= 20:
+                    self.assertNotIn(asset, screened_results.index)
+                    continue
+                self.assertEqual(
+                    screened_results.loc[asset, 'close'], expected,
+                )
+                self.assertEqual(
+                    screened_results.loc[asset, 'doubled'], expected * 2,
+                )
+
+        algo = TradingAlgorithm(
+            initialize=initialize,
+            handle_data=handle_data,
+            before_trading_start=handle_data,
+            data_frequency='daily',
+            get_pipeline_loader=lambda column: self.pipeline_loader,
+            start=self.first_asset_start,
+            end=self.last_asset_end,
+            env=self.env,
+        )
+        algo.run(self.data_portal)
+
     @parameterized.expand([('default', None),
                            ('day', 1),
                            ('week', 5),
@@ -519,10 +604,12 @@ class PipelineAlgorithmTestCase(TestCase):
         return vwaps
 
     @parameterized.expand([
-        (True,),
-        (False,),
+        (True, False),
+        (False, False),
+        (True, True),
+        (False, True),
     ])
-    def test_handle_adjustment(self, set_screen):
+    def test_handle_adjustment(self, set_screen, incremental):
         AAPL, MSFT, BRK_A = assets = self.AAPL, self.MSFT, self.BRK_A
 
         window_lengths = [1, 2, 5, 10]
@@ -545,7 +632,7 @@ class PipelineAlgorithmTestCase(TestCase):
             if set_screen:
                 pipeline.set_screen(filter_)
 
-            attach_pipeline(pipeline, 'test')
+            attach_pipeline(pipeline, 'test', incremental=incremental)
 
         def handle_data(context, data):
             today = get_datetime()
@@ -630,3 +717,40 @@ class PipelineAlgorithmTestCase(TestCase):
         )
 
         self.assertTrue(count[0] > 0)
+
+    def test_incremental_pipeline_without_loader(self):
+
+        # For ensuring we call before_trading_start.
+        count = [0]
+
+        def initialize(context):
+            pipeline = attach_pipeline(Pipeline(), 'test', incremental=True)
+            pipeline.add(VWAP(window_length=10), 'vwap')
+
+        def handle_data(context, data):
+            pass
+
+        def before_trading_start(context, data):
+            context.results = pipeline_output('test')
+            self.assertTrue(context.results.empty)
+            self.assertEqual(list(context.results.columns), ['vwap'])
+            count[0] += 1
+
+        # Without a pipeline loader, the algorithm uses a
+        # NoOpPipelineEngine.
+        algo = TradingAlgorithm(
+            initialize=initialize,
+            handle_data=handle_data,
+            before_trading_start=before_trading_start,
+            data_frequency='daily',
+            start=self.dates[0],
+            end=self.dates[-1],
+            env=self.env,
+        )
+
+        algo.run(
+            FakeDataPortal(),
+            overwrite_sim_params=False,
+        )
+
+        self.assertTrue(count[0] > 0)
@@ -0,0 +1,261 @@
+"""
+Tests for zipline.pipeline.precision.
+"""
+from unittest import TestCase
+
+from numpy import arange, float32, int8
+from numpy.random import RandomState
+from numpy.testing import assert_allclose, assert_array_equal
+from pandas import DataFrame, date_range, Int64Index, Timestamp
+from testfixtures import TempDirectory
+
+from zipline.finance.trading import TradingEnvironment
+from zipline.pipeline import Pipeline
+from zipline.pipeline.cache import TermResultCache
+from zipline.pipeline.data import USEquityPricing
+from zipline.pipeline.engine import SimplePipelineEngine
+from zipline.pipeline.factors import (
+    EWMSTD,
+    Returns,
+    SimpleMovingAverage,
+)
+from zipline.pipeline.graph import TermGraph
+from zipline.pipeline.loaders.frame import DataFrameLoader
+from zipline.pipeline.loaders.synthetic import PrecomputedLoader
+from zipline.pipeline.precision import compact_results, PrecisionPolicy
+from zipline.testing import make_simple_equity_info
+from zipline.utils.numpy_utils import (
+    float32_dtype,
+    float64_dtype,
+    int16_dtype,
+    int32_dtype,
+    int64_dtype,
+)
+
+
+class RecordingCache(TermResultCache):
+    """
+    TermResultCache recording the keys under which results are stored.
+    """
+    def __init__(self, *args, **kwargs):
+        super(RecordingCache, self).__init__(*args, **kwargs)
+        self.stored = []
+
+    def put(self, key, result):
+        self.stored.append(key)
+        return super(RecordingCache, self).put(key, result)
+
+
+class PrecisionPolicyTestCase(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.env = TradingEnvironment()
+        cls.dates = date_range(
+            '2015-02-01',
+            '2015-03-31',
+            freq=cls.env.trading_day,
+            tz='UTC',
+        )
+        cls.sids = Int64Index(arange(1, 9))
+        cls.env.write_data(equities_df=make_simple_equity_info(
+            cls.sids,
+            start_date=Timestamp('2015-01-31', tz='UTC'),
+            end_date=Timestamp('2015-04-01', tz='UTC'),
+        ))
+        cls.asset_finder = cls.env.asset_finder
+
+        rand = RandomState(5)
+        shape = len(cls.dates), len(cls.sids)
+        cls.loader = PrecomputedLoader(
+            {
+                USEquityPricing.close: 100 + rand.randn(*shape).cumsum(0),
+                USEquityPricing.volume: rand.randint(1000, 100000, shape),
+            },
+            cls.dates,
+            cls.sids,
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.env
+        del cls.asset_finder
+
+    def make_engine(self, **kwargs):
+        return SimplePipelineEngine(
+            lambda column: self.loader,
+            self.dates,
+            self.asset_finder,
+            **kwargs
+        )
+
+    def make_pipeline(self):
+        self.sma = SimpleMovingAverage(
+            inputs=[USEquityPricing.close],
+            window_length=5,
+        )
+        self.returns = Returns(window_length=3)
+        self.quartiles = self.returns.quartiles()
+        self.demeaned = self.sma.demean(groupby=self.quartiles)
+        self.ewmstd = EWMSTD(
+            inputs=[USEquityPricing.close],
+            window_length=10,
+            decay_rate=0.9,
+        )
+        return Pipeline(columns={
+            'sma': self.sma,
+            'quartiles': self.quartiles,
+            'demeaned': self.demeaned,
+            'ewmstd': self.ewmstd,
+        })
+
+    def test_storage_dtypes(self):
+        pipeline = self.make_pipeline()
+        graph = pipeline.to_graph('screen', self.make_engine()._root_mask_term)
+        storage = PrecisionPolicy().storage_dtypes(graph)
+
+        self.assertEqual(storage[self.sma], float32_dtype)
+        self.assertEqual(storage[self.demeaned], float32_dtype)
+        self.assertEqual(storage[self.quartiles], int32_dtype)
+        self.assertEqual(storage[USEquityPricing.volume], float32_dtype)
+
+        # EWMSTD keeps its precision, and so does its input.
+        self.assertNotIn(self.ewmstd, storage)
+        self.assertNotIn(USEquityPricing.close, storage)
+
+        storage = PrecisionPolicy(preserve=[self.quartiles]).storage_dtypes(
+            graph,
+        )
+        self.assertNotIn(self.quartiles, storage)
+        self.assertNotIn(self.returns, storage)
+        self.assertEqual(storage[self.sma], float32_dtype)
+
+    def test_run_pipeline(self):
+        pipeline = self.make_pipeline()
+        start_date, end_date = self.dates[15], self.dates[-1]
+        expected = self.make_engine().run_pipeline(
+            pipeline, start_date, end_date, output='dense',
+        )
+        engine = self.make_engine(precision=PrecisionPolicy())
+        for result in (
+                engine.run_pipeline(
+                    pipeline, start_date, end_date, output='dense',
+                ),
+                engine.run_chunked_pipeline(
+                    pipeline, start_date, end_date, chunksize=10,
+                    output='dense',
+                )):
+            columns = result.columns
+            self.assertEqual(columns['sma'].dtype, float32_dtype)
+            self.assertEqual(columns['demeaned'].dtype, float32_dtype)
+            self.assertEqual(columns['quartiles'].dtype, int32_dtype)
+            self.assertEqual(columns['ewmstd'].dtype, float64_dtype)
+
+            assert_allclose(
+                columns['sma'],
+                expected.columns['sma'],
+                rtol=1e-6,
+            )
+            assert_allclose(
+                columns['demeaned'],
+                expected.columns['demeaned'],
+                atol=1e-4,
+            )
+            assert_array_equal(
+                columns['quartiles'],
+                expected.columns['quartiles'],
+            )
+            assert_array_equal(columns['ewmstd'], expected.columns['ewmstd'])
+
+    def test_incremental(self):
+        pipeline = self.make_pipeline()
+        start_date, end_date = self.dates[15], self.dates[-1]
+        expected = self.make_engine().run_pipeline(
+            pipeline, start_date, end_date,
+        )
+        incremental = self.make_engine(
+            precision=PrecisionPolicy(),
+        ).incremental_pipeline(
+            pipeline, start_date, end_date, chunksize=7,
+        )
+        for date in self.dates[15:]:
+            result = incremental.compute(date)
+            expected_today = expected.loc[[date]]
+            self.assertEqual(result['sma'].dtype, float32_dtype)
+            assert_allclose(
+                result['sma'].values,
+                expected_today['sma'].values,
+                rtol=1e-6,
+            )
+            assert_array_equal(
+                result['ewmstd'].values,
+                expected_today['ewmstd'].values,
+            )
+
+    def test_term_cache_keys_include_storage(self):
+        close = DataFrame(
+            100 + RandomState(3).randn(len(self.dates), len(self.sids)),
+            index=self.dates,
+            columns=self.sids,
+        )
+        loader = DataFrameLoader(USEquityPricing.close, close)
+        sma = SimpleMovingAverage(
+            inputs=[USEquityPricing.close],
+            window_length=5,
+        )
+        # The filter is stored as bool either way, but it's computed from a
+        # factor stored at reduced precision by the policy.
+        pipeline = Pipeline(columns={'top': sma.top(3)})
+
+        with TempDirectory() as tmp:
+            cache = RecordingCache(tmp.getpath('cache'))
+
+            def run(precision):
+                del cache.stored[:]
+                SimplePipelineEngine(
+                    lambda column: loader,
+                    self.dates,
+                    self.asset_finder,
+                    term_cache=cache,
+                    precision=precision,
+                ).run_pipeline(pipeline, self.dates[10], self.dates[-1])
+                return set(cache.stored)
+
+            first = run(PrecisionPolicy())
+            self.assertTrue(first)
+
+            # Neither the factor nor the filter may be reused at full
+            # precision, or the other way around.
+            second = run(None)
+            self.assertEqual(len(second), len(first))
+            self.assertFalse(first & second)
+
+            self.assertEqual(run(PrecisionPolicy()), set())
+            self.assertEqual(run(None), set())
+
+    def test_invalid_dtypes(self):
+        with self.assertRaises(ValueError):
+            PrecisionPolicy(float_dtype=int64_dtype)
+        with self.assertRaises(ValueError):
+            PrecisionPolicy(float_dtype='float16')
+        with self.assertRaises(ValueError):
+            PrecisionPolicy(classifier_dtype=float32)
+        # dtypes are coerced.
+        policy = PrecisionPolicy(float_dtype='float64', classifier_dtype=int8)
+        self.assertEqual(policy.float_dtype, float64_dtype)
+
+    def test_codes_dont_fit(self):
+        quartiles = Returns(window_length=3).quartiles()
+        graph = TermGraph({'quartiles': quartiles})
+        storage = PrecisionPolicy(
+            classifier_dtype=int16_dtype,
+        ).storage_dtypes(graph)
+
+        codes = arange(2 ** 15 - 1, 2 ** 15 + 1).reshape(1, 2)
+        with self.assertRaises(ValueError):
+            compact_results({quartiles: codes}, storage)
+
+        codes[0, 1] = -1
+        compacted = compact_results({quartiles: codes}, storage)[quartiles]
+        self.assertEqual(compacted.dtype, int16_dtype)
+        assert_array_equal(compacted, codes)
@@ -0,0 +1,142 @@
+"""
+Tests for zipline.pipeline.profiler.
+"""
+from unittest import TestCase
+
+from nose_parameterized import parameterized
+from pandas import date_range, Int64Index, Timestamp
+from pandas.util.testing import assert_frame_equal
+
+from zipline.finance.trading import TradingEnvironment
+from zipline.pipeline import Pipeline
+from zipline.pipeline.data import USEquityPricing
+from zipline.pipeline.engine import SimplePipelineEngine
+from zipline.pipeline.factors import AverageDollarVolume, SimpleMovingAverage
+from zipline.pipeline.loaders.synthetic import PrecomputedLoader
+from zipline.pipeline.profiler import PipelineProfiler
+from zipline.testing import make_simple_equity_info
+
+
+class PipelineProfilerTestCase(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.env = TradingEnvironment()
+        cls.dates = date_range(
+            '2015-02-01',
+            '2015-02-28',
+            freq=cls.env.trading_day,
+            tz='UTC',
+        )
+        cls.sids = Int64Index([1, 2, 3])
+        cls.env.write_data(equities_df=make_simple_equity_info(
+            cls.sids,
+            start_date=Timestamp('2015-01-31', tz='UTC'),
+            end_date=Timestamp('2015-03-01', tz='UTC'),
+        ))
+        cls.asset_finder = cls.env.asset_finder
+        cls.loader = PrecomputedLoader(
+            {USEquityPricing.close: 10.0, USEquityPricing.volume: 100.0},
+            cls.dates,
+            cls.sids,
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.env
+        del cls.asset_finder
+
+    def make_engine(self, **kwargs):
+        return SimplePipelineEngine(
+            lambda column: self.loader,
+            self.dates,
+            self.asset_finder,
+            **kwargs
+        )
+
+    def make_pipeline(self):
+        self.sma = SimpleMovingAverage(
+            inputs=[USEquityPricing.close],
+            window_length=3,
+        )
+        self.dv = AverageDollarVolume(window_length=3)
+        return Pipeline(columns={'sma': self.sma, 'dv': self.dv})
+
+    @parameterized.expand([(1,), (2,)])
+    def test_report(self, num_threads):
+        profiler = PipelineProfiler()
+        engine = self.make_engine(profiler=profiler, num_threads=num_threads)
+        self.assertIs(engine.profiler, profiler)
+
+        pipeline = self.make_pipeline()
+        start_date, end_date = self.dates[5], self.dates[-1]
+        result = engine.run_pipeline(pipeline, start_date, end_date)
+        assert_frame_equal(
+            result,
+            self.make_engine().run_pipeline(pipeline, start_date, end_date),
+        )
+
+        report = profiler.report()
+        close, volume = USEquityPricing.close, USEquityPricing.volume
+        for term in self.sma, self.dv, close, volume:
+            self.assertIn(term, report.index)
+
+        num_dates = len(self.dates[5:])
+        nbytes = (num_dates + 2) * len(self.sids) * 8
+
+        self.assertEqual(report.loc[self.sma, 'kind'], 'compute')
+        self.assertEqual(report.loc[self.sma, 'loader'], '')
+        self.assertEqual(report.loc[self.sma, 'calls'], 1)
+        self.assertEqual(report.loc[self.sma, 'rows'], num_dates)
+        self.assertEqual(report.loc[self.sma, 'group_size'], 1.0)
+
+        # Both columns are loaded with two extra rows by a single call.
+        self.assertEqual(report.loc[close, 'kind'], 'load')
+        self.assertEqual(report.loc[close, 'loader'], 'PrecomputedLoader')
+        self.assertEqual(report.loc[close, 'calls'], 1)
+        self.assertEqual(report.loc[close, 'rows'], num_dates + 2)
+        self.assertEqual(report.loc[close, 'nbytes'], nbytes)
+        self.assertEqual(report.loc[close, 'group_size'], 2.0)
+        self.assertEqual(
+            report.loc[close, 'seconds'],
+            report.loc[volume, 'seconds'],
+        )
+        self.assertTrue((report['seconds'] >= 0).all())
+        self.assertTrue(
+            (report['seconds'].values[:-1] >=
+             report['seconds'].values[1:]).all()
+        )
+
+        loader_report = profiler.loader_report()
+        self.assertEqual(list(loader_report.index), [self.loader])
+        self.assertEqual(loader_report.loc[self.loader, 'calls'], 1)
+        self.assertEqual(loader_report.loc[self.loader, 'terms'], 2)
+        self.assertEqual(loader_report.loc[self.loader, 'nbytes'], 2 * nbytes)
+
+        # Running again accumulates measurements until we reset.
+        engine.run_pipeline(pipeline, start_date, end_date)
+        self.assertEqual(profiler.report().loc[self.sma, 'calls'], 2)
+        profiler.reset()
+        self.assertEqual(profiler.jobs, [])
+        self.assertEqual(len(profiler.report()), 0)
+
+    def test_incremental(self):
+        profiler = PipelineProfiler()
+        engine = self.make_engine(profiler=profiler)
+        incremental = engine.incremental_pipeline(
+            self.make_pipeline(),
+            self.dates[5],
+            self.dates[-1],
+            chunksize=4,
+        )
+        incremental.compute(self.dates[-1])
+
+        num_dates = len(self.dates[5:])
+        report = profiler.report()
+        self.assertEqual(report.loc[self.sma, 'calls'], num_dates)
+        self.assertEqual(report.loc[self.sma, 'rows'], num_dates)
+        # Raw data is loaded in chunks of 4 dates.
+        self.assertEqual(
+            report.loc[USEquityPricing.close, 'calls'],
+            -(-num_dates // 4),
+        )
@@ -265,6 +265,28 @@ class MockDailyBarSpotReader(object):
         return 100.0
 
 
+class CountingDailyBarReader(object):
+    """
+    A wrapper around a BcolzDailyBarReader which counts the values it reads.
+    """
+    def __init__(self, reader):
+        self._reader = reader
+        self._calendar = reader._calendar
+        self.values_read = 0
+
+    def load_raw_arrays(self, columns, start_date, end_date, assets,
+                        mask=None):
+        arrays = self._reader.load_raw_arrays(
+            columns,
+            start_date,
+            end_date,
+            assets,
+            mask=mask,
+        )
+        self.values_read += sum(array.size for array in arrays)
+        return arrays
+
+
 class USEquityPricingLoaderTestCase(TestCase):
 
     @classmethod
@@ -561,3 +583,62 @@ class USEquityPricingLoaderTestCase(TestCase):
             highs.traverse(windowlen + 1)
         with self.assertRaises(WindowLengthTooLong):
             volumes.traverse(windowlen + 1)
+
+    def test_cached_chunks(self):
+        columns = [USEquityPricing.close, USEquityPricing.volume]
+        uncached_reader = CountingDailyBarReader(
+            BcolzDailyBarReader(self.bcolz_path),
+        )
+        cached_reader = CountingDailyBarReader(
+            BcolzDailyBarReader(self.bcolz_path),
+        )
+        adjustment_reader = SQLiteAdjustmentReader(self.db_path)
+        uncached = USEquityPricingLoader(uncached_reader, adjustment_reader)
+        cached = USEquityPricingLoader(
+            cached_reader,
+            adjustment_reader,
+            cache=True,
+        )
+
+        # Overlapping chunks, each spanning a weekend before its first date,
+        # and each gaining and dropping assets.
+        chunks = [
+            ('2015-06-02', '2015-06-12', [1, 2, 3, 4]),
+            ('2015-06-08', '2015-06-19', [2, 3, 4, 5, 6]),
+            ('2015-06-15', '2015-06-26', [1, 3, 5, 6]),
+            ('2015-06-16', '2015-06-23', [3, 5, 6]),
+        ]
+        for start, end, sids in chunks:
+            query_days = self.calendar_days_between(
+                Timestamp(start, tz='UTC'),
+                Timestamp(end, tz='UTC'),
+            )
+            assets = Int64Index(sids)
+            mask = ones((len(query_days), len(assets)), dtype=bool)
+            expected = uncached.load_adjusted_array(
+                columns, query_days, assets, mask,
+            )
+            results = cached.load_adjusted_array(
+                columns, query_days, assets, mask,
+            )
+            for column in columns:
+                for windowlen in 1, 3, len(query_days):
+                    for expected_window, window in zip(
+                            expected[column].traverse(windowlen),
+                            results[column].traverse(windowlen)):
+                        assert_array_equal(expected_window, window)
+
+        self.assertLess(
+            cached_reader.values_read,
+            uncached_reader.values_read,
+        )
+
+        # Cleared caches read everything again.
+        cached.clear_cache()
+        cached_reader.values_read = uncached_reader.values_read = 0
+        uncached.load_adjusted_array(columns, query_days, assets, mask)
+        cached.load_adjusted_array(columns, query_days, assets, mask)
+        self.assertEqual(
+            cached_reader.values_read,
+            uncached_reader.values_read,
+        )
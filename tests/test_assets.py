@@ -902,6 +902,22 @@ class AssetFinderTestCase(TestCase):
             result = finder.lifetimes(dates, include_start_date=False)
             assert_frame_equal(result, expected_no_start)
 
+            # Restricting to assets alive on some of the dates drops the
+            # columns of every other asset.
+            cases = (
+                (True, expected_with_start),
+                (False, expected_no_start),
+            )
+            for alive_dates in dates[:1], dates[-2:], dates:
+                for include_start_date, expected in cases:
+                    alive = expected.loc[alive_dates].any()
+                    result = finder.lifetimes(
+                        dates,
+                        include_start_date=include_start_date,
+                        alive_dates=alive_dates,
+                    )
+                    assert_frame_equal(result, expected.loc[:, alive])
+
     def test_sids(self):
         # Ensure that the sids property of the AssetFinder is functioning
         self.env.write_data(equities_identifiers=[1, 2, 3])
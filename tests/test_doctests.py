@@ -4,7 +4,7 @@ import doctest
 from unittest import TestCase
 
 from zipline import testing
-from zipline.lib import adjustment, normalize
+from zipline.lib import adjustment, normalize, quantiles, rolling
 from zipline.pipeline import (
     engine,
     expression,
@@ -89,3 +89,9 @@ class DoctestTestCase(TestCase):
 
     def test_normalize_docs(self):
         self._check_docs(normalize)
+
+    def test_quantiles_docs(self):
+        self._check_docs(quantiles)
+
+    def test_rolling_docs(self):
+        self._check_docs(rolling)
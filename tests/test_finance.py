@@ -578,6 +578,36 @@ class TradingEnvironmentTestCase(TestCase):
         self.assertTrue(all(friday == minutes[31:421]))
         self.assertTrue(all(thursday == minutes[421:]))
 
+    def test_market_minute_navigation(self):
+        us_east = pytz.timezone('US/Eastern')
+
+        # Friday Jan 4th 2008, 3:59 PM Eastern.
+        before_close = pd.Timestamp(
+            us_east.localize(datetime(2008, 1, 4, 15, 59)),
+        ).tz_convert('UTC')
+        close = before_close + timedelta(minutes=1)
+        monday_open = pd.Timestamp(
+            us_east.localize(datetime(2008, 1, 7, 9, 31)),
+        ).tz_convert('UTC')
+        saturday = pd.Timestamp('2008-01-05 12:00', tz='UTC')
+
+        self.assertEqual(self.env.next_market_minute(before_close), close)
+        self.assertEqual(self.env.next_market_minute(close), monday_open)
+        self.assertEqual(self.env.next_market_minute(saturday), monday_open)
+
+        self.assertEqual(self.env.previous_market_minute(close), before_close)
+        self.assertEqual(self.env.previous_market_minute(monday_open), close)
+        self.assertEqual(self.env.previous_market_minute(saturday), close)
+
+        pos = self.env.market_minute_position(close)
+        self.assertEqual(self.env.market_minute_at(pos), close)
+        self.assertEqual(self.env.next_market_minute_position(close), pos + 1)
+        self.assertEqual(
+            self.env.previous_market_minute_position(close),
+            pos - 1,
+        )
+        self.assertEqual(self.env.market_minute_at(pos + 1), monday_open)
+
     def test_min_date(self):
         min_date = pd.Timestamp('2016-03-04', tz='UTC')
         env = TradingEnvironment(min_date=min_date)
@@ -593,3 +623,34 @@ class TradingEnvironmentTestCase(TestCase):
         self.assertLessEqual(env.last_trading_day, max_date)
         self.assertLessEqual(env.treasury_curves.index[-1],
                              max_date)
+
+    def test_calendar_core_is_shared(self):
+        max_date = pd.Timestamp('2008-08-01', tz='UTC')
+        env1 = TradingEnvironment(max_date=max_date)
+        env2 = TradingEnvironment(max_date=max_date)
+
+        self.assertIs(env1.calendar_core, env2.calendar_core)
+        self.assertIsNot(env1.calendar_core, self.env.calendar_core)
+
+    def test_calendar_core_market_minutes(self):
+        min_date = pd.Timestamp('2008-11-25', tz='UTC')
+        max_date = pd.Timestamp('2008-12-02', tz='UTC')
+        core = TradingEnvironment(
+            min_date=min_date,
+            max_date=max_date,
+        ).calendar_core
+
+        expected = pd.DatetimeIndex(np.concatenate([
+            self.env.market_minutes_for_day(day)
+            for day in core.trading_days
+        ]))
+        np.testing.assert_array_equal(
+            core.market_minutes_nanos,
+            expected.asi8,
+        )
+        # The day after thanksgiving is an early close.
+        np.testing.assert_array_equal(
+            core.minutes_per_day,
+            [390, 390, 210, 390, 390],
+        )
+        self.assertFalse(core.market_minutes_nanos.flags.writeable)
@@ -0,0 +1,78 @@
+"""
+Tests that importing zipline stays cheap.
+
+These run in subprocesses so that modules imported by other tests don't hide
+regressions.
+"""
+from subprocess import check_output
+import sys
+from unittest import TestCase
+
+from six import iteritems
+
+# Modules that must not be imported until they're actually used, mapped to
+# the import statement under test.
+LAZY_MODULES = {
+    'import zipline': [
+        'bcolz',
+        'blaze',
+        'networkx',
+        'numexpr',
+        'pandas',
+        'sqlalchemy',
+        'zipline.algorithm',
+        'zipline.data',
+        'zipline.finance',
+        'zipline.pipeline',
+    ],
+    'from zipline.utils import parse_args': [
+        'pandas',
+        'pygments',
+        'zipline.algorithm',
+    ],
+    'import zipline.pipeline': [
+        'blaze',
+        'zipline.pipeline.loaders.blaze',
+        'zipline.pipeline.visualize',
+    ],
+}
+
+
+def imported_modules(statement, candidates):
+    """
+    Run ``statement`` in a fresh interpreter and return the subset of
+    ``candidates`` that ended up in ``sys.modules``.
+    """
+    code = '\n'.join([
+        'import sys',
+        statement,
+        'print(" ".join(m for m in %r if m in sys.modules))' % candidates,
+    ])
+    return check_output([sys.executable, '-c', code]).decode().split()
+
+
+class ImportTestCase(TestCase):
+
+    def test_lazy_imports(self):
+        for statement, modules in iteritems(LAZY_MODULES):
+            self.assertEqual(
+                imported_modules(statement, modules),
+                [],
+                "%r imported modules that should be lazy" % statement,
+            )
+
+    def test_lazy_attributes(self):
+        import zipline
+        from zipline.algorithm import TradingAlgorithm
+
+        self.assertIs(zipline.TradingAlgorithm, TradingAlgorithm)
+
+    def test_api_methods_registered(self):
+        code = '\n'.join([
+            'from zipline.api import order, symbol',
+            'print(order.__name__, symbol.__name__)',
+        ])
+        self.assertEqual(
+            check_output([sys.executable, '-c', code]).decode().split(),
+            ['order', 'symbol'],
+        )
@@ -13,7 +13,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 from unittest import TestCase
+
+from mock import patch
+import pandas as pd
+from testfixtures import TempDirectory
+
 from zipline.utils import tradingcalendar
 from zipline.utils import tradingcalendar_lse
 from zipline.utils import tradingcalendar_tse
@@ -21,6 +27,10 @@ from zipline.utils import tradingcalendar_bmf
 import pytz
 import datetime
 from zipline.finance.trading import TradingEnvironment
+from zipline.utils.lazy_calendar import (
+    LazyCalendarModule,
+    cached_calendar_days,
+)
 from nose.tools import nottest
 
 
@@ -263,3 +273,89 @@ If NYE falls on a weekend, {0} the Tuesday after is the first trading day.
         friday_after = datetime.datetime(2013, 7, 5, tzinfo=pytz.utc)
         self.assertIn(wednesday_before, early_closes)
         self.assertNotIn(friday_after, early_closes)
+
+
+class TestLazyCalendar(TestCase):
+
+    def test_calendars_are_lazy(self):
+        for calendar in (tradingcalendar,
+                         tradingcalendar_lse,
+                         tradingcalendar_tse,
+                         tradingcalendar_bmf):
+            self.assertIsInstance(calendar, LazyCalendarModule)
+            self.assertGreater(len(calendar.trading_days), 0)
+
+        with self.assertRaises(AttributeError):
+            tradingcalendar.not_a_calendar_attribute
+
+    def test_cached_bmf_early_closes(self):
+        start = tradingcalendar_bmf.start
+        build = tradingcalendar_bmf._build_calendar_days
+        ash_wednesday = pd.Timestamp('2015-02-18', tz='UTC')
+        early_end = pd.Timestamp('2015-01-09 10:00', tz='UTC')
+        late_end = pd.Timestamp('2015-06-30 10:00', tz='UTC')
+
+        with TempDirectory() as tmp, \
+                patch.dict(os.environ, {'ZIPLINE_ROOT': tmp.path}):
+            # The first calendar ends before Ash Wednesday, but the file it
+            # writes must still serve the second.
+            early = cached_calendar_days('bmf', start, early_end, build)
+            late = cached_calendar_days('bmf', start, late_end, build)
+
+        self.assertNotIn(ash_wednesday, early['early_closes'])
+        self.assertIn(ash_wednesday, late['early_closes'])
+        self.assertTrue(late['early_closes'].equals(
+            tradingcalendar_bmf.get_early_closes(start, late_end),
+        ))
+        self.assertTrue(early['early_closes'].equals(
+            late['early_closes'][late['early_closes'] <= early_end],
+        ))
+
+    def test_cached_calendar_days(self):
+        start = pd.Timestamp('2014-01-01', tz='UTC')
+        end = pd.Timestamp('2014-12-31', tz='UTC')
+
+        calls = []
+
+        def build(build_start, build_end):
+            calls.append((build_start, build_end))
+            return {
+                'non_trading_days': tradingcalendar.get_non_trading_days(
+                    build_start, build_end,
+                ),
+            }
+
+        def expected(end):
+            return tradingcalendar.get_non_trading_days(start, end)
+
+        # Ends like ``tradingcalendar.end``, which includes the time of day.
+        first_end = pd.Timestamp('2014-07-04 09:30:15.123456', tz='UTC')
+        second_end = pd.Timestamp('2014-07-04 16:45:01.654321', tz='UTC')
+        later_end = pd.Timestamp('2014-11-28 12:00', tz='UTC')
+
+        with TempDirectory() as tmp, \
+                patch.dict(os.environ, {'ZIPLINE_ROOT': tmp.path}):
+            first = cached_calendar_days('test', start, first_end, build)
+            second = cached_calendar_days('test', start, second_end, build)
+            later = cached_calendar_days('test', start, later_end, build)
+
+            # Every end in 2014 shares the cache of the whole year.
+            self.assertEqual(calls, [(start, end)])
+
+            # An end in a different year is a cache miss.
+            next_year_end = pd.Timestamp('2015-01-02', tz='UTC')
+            next_year = cached_calendar_days(
+                'test', start, next_year_end, build,
+            )
+            self.assertEqual(
+                calls,
+                [(start, end), (start, pd.Timestamp('2015-12-31', tz='UTC'))],
+            )
+
+        for days, days_end in ((first, first_end),
+                               (second, second_end),
+                               (later, later_end),
+                               (next_year, next_year_end)):
+            self.assertTrue(
+                days['non_trading_days'].equals(expected(days_end)),
+            )
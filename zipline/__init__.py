@@ -16,24 +16,25 @@
 
 # This is *not* a place to dump arbitrary classes/modules for convenience,
 # it is a place to expose the public interfaces.
-from . import data
-from . import finance
-from . import gens
 from . import utils
 from ._version import get_versions
-# These need to happen after the other imports.
-from . algorithm import TradingAlgorithm
-from . import api
+from .utils.lazy_module import install_lazy_module, lazy_import
 
 __version__ = get_versions()['version']
 del get_versions
 
+
+def _parse_cell_magic(line, cell):
+    from .utils.cli import parse_cell_magic
+    return parse_cell_magic(line, cell)
+
+
 try:
     ip = get_ipython()  # flake8: noqa
 except NameError:
     pass
 else:
-    ip.register_magic_function(utils.parse_cell_magic, "line_cell", "zipline")
+    ip.register_magic_function(_parse_cell_magic, "line_cell", "zipline")
     del ip
 
 __all__ = [
@@ -44,3 +45,15 @@ __all__ = [
     'api',
     'TradingAlgorithm',
 ]
+
+# The algorithm, data, finance and pipeline machinery is only imported when
+# first accessed, so that ``import zipline`` and short-lived processes like
+# the command line interface don't pay for it up front.
+install_lazy_module(
+    __name__,
+    data=lazy_import('zipline.data'),
+    finance=lazy_import('zipline.finance'),
+    gens=lazy_import('zipline.gens'),
+    api=lazy_import('zipline.api'),
+    TradingAlgorithm=lazy_import('zipline.algorithm', 'TradingAlgorithm'),
+)
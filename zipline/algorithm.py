@@ -36,6 +36,7 @@ from zipline._protocol import handle_non_market_minutes
 from zipline.data.data_portal import DataPortal
 from zipline.errors import (
     AttachPipelineAfterInitialize,
+    DuplicatePipelineName,
     HistoryInInitialize,
     NoSuchPipeline,
     OrderDuringInitialize,
@@ -278,9 +279,16 @@ class TradingAlgorithm(object):
         # Initialize Pipeline API data.
         self.init_engine(kwargs.pop('get_pipeline_loader', None))
         self._pipelines = {}
-        # Create an always-expired cache so that we compute the first time data
-        # is requested.
-        self._pipeline_cache = CachedObject(None, pd.Timestamp(0, tz='UTC'))
+        # Pipelines attached with the same chunksize are computed together.
+        # Map from chunksize -> iterator of chunk lengths.
+        self._pipeline_chunks = {}
+        # Map from chunksize -> cached results of the pipelines computed with
+        # that chunksize.  Missing entries are treated as an always-expired
+        # cache, so that we compute the first time data is requested.
+        self._pipeline_caches = {}
+        # Map from name -> IncrementalPipeline computing an incremental
+        # pipeline, created the first time its output is requested.
+        self._incremental_pipelines = {}
 
         self.blotter = kwargs.pop('blotter', None)
         self.cancel_policy = kwargs.pop('cancel_policy', NeverCancel())
@@ -454,12 +462,14 @@ class TradingAlgorithm(object):
         """
         if self.sim_params.data_frequency == 'minute':
             env = self.trading_environment
-            trading_o_and_c = env.open_and_closes.ix[
-                self.sim_params.trading_days]
-            market_opens = trading_o_and_c['market_open'].values.astype(
-                'datetime64[ns]').astype(np.int64)
-            market_closes = trading_o_and_c['market_close'].values.astype(
-                'datetime64[ns]').astype(np.int64)
+            core = env.calendar_core
+            sim_days = self.sim_params.trading_days
+            start = env.trading_days.searchsorted(sim_days[0])
+            stop = start + len(sim_days)
+            # Copy the shared, read-only arrays for the simulation period so
+            # that the clock can hold writable buffers.
+            market_opens = core.market_opens_nanos[start:stop].copy()
+            market_closes = core.market_closes_nanos[start:stop].copy()
 
             minutely_emission = self.sim_params.emission_rate == "minute"
 
@@ -1445,19 +1455,59 @@ class TradingAlgorithm(object):
     ##############
     @api_method
     @require_not_initialized(AttachPipelineAfterInitialize())
-    def attach_pipeline(self, pipeline, name, chunksize=None):
+    def attach_pipeline(self,
+                        pipeline,
+                        name,
+                        chunksize=None,
+                        incremental=False):
         """
         Register a pipeline to be computed at the start of each day.
-        """
-        if self._pipelines:
-            raise NotImplementedError("Multiple pipelines are not supported.")
-        if chunksize is None:
-            # Make the first chunk smaller to get more immediate results:
-            # (one week, then every half year)
-            chunks = iter(chain([5], repeat(126)))
-        else:
-            chunks = iter(repeat(int(chunksize)))
-        self._pipelines[name] = pipeline, chunks
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            The pipeline to compute.
+        name : str
+            The name under which results are available from
+            ``pipeline_output``.
+        chunksize : int, optional
+            The number of days to compute at once.  By default, the first
+            chunk is one week and later chunks are half a year.  In
+            incremental mode, this is instead the number of days of raw data
+            to load at once, which defaults to half a year.
+        incremental : bool, optional
+            Whether to compute the pipeline one day at a time, carrying
+            trailing windows from each day to the next, instead of computing
+            it in chunks of days.  Default is False.
+
+        Raises
+        ------
+        DuplicatePipelineName
+            Raised when a pipeline named `name` has already been attached.
+
+        Notes
+        -----
+        Pipelines attached without ``incremental=True`` and with the same
+        `chunksize` are computed together, so terms they share are only
+        loaded and computed once per chunk.
+
+        See Also
+        --------
+        zipline.pipeline.incremental.IncrementalPipeline
+        """
+        if name in self._pipelines:
+            raise DuplicatePipelineName(name=name)
+        if incremental:
+            chunksize = 126 if chunksize is None else int(chunksize)
+        elif chunksize not in self._pipeline_chunks:
+            if chunksize is None:
+                # Make the first chunk smaller to get more immediate results:
+                # (one week, then every half year)
+                chunks = iter(chain([5], repeat(126)))
+            else:
+                chunks = iter(repeat(int(chunksize)))
+            self._pipeline_chunks[chunksize] = chunks
+        self._pipelines[name] = pipeline, chunksize, incremental
 
         # Return the pipeline to allow expressions like
         # p = attach_pipeline(Pipeline(), 'name')
@@ -1489,29 +1539,37 @@ class TradingAlgorithm(object):
         --------
         :meth:`zipline.pipeline.engine.PipelineEngine.run_pipeline`
         """
-        # NOTE: We don't currently support multiple pipelines, but we plan to
-        # in the future.
         try:
-            p, chunks = self._pipelines[name]
+            p, chunksize, incremental = self._pipelines[name]
         except KeyError:
             raise NoSuchPipeline(
                 name=name,
                 valid=list(self._pipelines.keys()),
             )
-        return self._pipeline_output(p, chunks)
+        if incremental:
+            return self._incremental_pipeline_output(name, p, chunksize)
+        return self._pipeline_output(name, chunksize)
 
-    def _pipeline_output(self, pipeline, chunks):
+    def _pipeline_output(self, name, chunksize):
         """
         Internal implementation of `pipeline_output`.
         """
         today = normalize_date(self.get_datetime())
         try:
-            data = self._pipeline_cache.unwrap(today)
-        except Expired:
-            data, valid_until = self._run_pipeline(
-                pipeline, today, next(chunks),
+            results = self._pipeline_caches[chunksize].unwrap(today)
+        except (KeyError, Expired):
+            pipelines = {
+                n: p
+                for n, (p, c, incremental) in iteritems(self._pipelines)
+                if c == chunksize and not incremental
+            }
+            results, valid_until = self._run_pipelines(
+                pipelines, today, next(self._pipeline_chunks[chunksize]),
             )
-            self._pipeline_cache = CachedObject(data, valid_until)
+            self._pipeline_caches[chunksize] = CachedObject(
+                results, valid_until,
+            )
+        data = results[name]
 
         # Now that we have a cached result, try to return the data for today.
         try:
@@ -1521,23 +1579,48 @@ class TradingAlgorithm(object):
             # day.
             return pd.DataFrame(index=[], columns=data.columns)
 
-    def _run_pipeline(self, pipeline, start_date, chunksize):
+    def _incremental_pipeline_output(self, name, pipeline, chunksize):
+        """
+        Internal implementation of `pipeline_output` for pipelines attached
+        with ``incremental=True``.
+        """
+        today = normalize_date(self.get_datetime())
+        try:
+            incremental = self._incremental_pipelines[name]
+        except KeyError:
+            incremental = self._incremental_pipelines[name] = \
+                self.engine.incremental_pipeline(
+                    pipeline,
+                    today,
+                    self.sim_params.last_close.normalize(),
+                    chunksize=chunksize,
+                )
+
+        data = incremental.compute(today)
+        try:
+            return data.loc[today]
+        except KeyError:
+            # This happens if no assets passed the pipeline screen today.
+            return pd.DataFrame(index=[], columns=data.columns)
+
+    def _run_pipelines(self, pipelines, start_date, chunksize):
         """
-        Compute `pipeline`, providing values for at least `start_date`.
+        Compute `pipelines`, providing values for at least `start_date`.
 
-        Produces a DataFrame containing data for days between `start_date` and
-        `end_date`, where `end_date` is defined by:
+        Produces a DataFrame for each pipeline containing data for days
+        between `start_date` and `end_date`, where `end_date` is defined by:
 
             `end_date = min(start_date + chunksize trading days,
                             simulation_end)`
 
         Returns
         -------
-        (data, valid_until) : tuple (pd.DataFrame, pd.Timestamp)
+        (results, valid_until) : tuple (dict[str -> pd.DataFrame],
+                                        pd.Timestamp)
 
         See Also
         --------
-        PipelineEngine.run_pipeline
+        PipelineEngine.run_pipelines
         """
         days = self.trading_environment.trading_days
 
@@ -1550,8 +1633,10 @@ class TradingAlgorithm(object):
         end_loc = min(start_date_loc + chunksize, days.get_loc(sim_end))
         end_date = days[end_loc]
 
-        return \
-            self.engine.run_pipeline(pipeline, start_date, end_date), end_date
+        return (
+            self.engine.run_pipelines(pipelines, start_date, end_date),
+            end_date,
+        )
 
     ##################
     # End Pipeline API
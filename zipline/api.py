@@ -48,3 +48,8 @@ __all__ = [
     'date_rules',
     'time_rules'
 ]
+
+# TradingAlgorithm adds its API methods to this module when it is defined, so
+# it has to be imported for ``from zipline.api import order`` to work.  This
+# must come after ``__all__`` is defined.
+import zipline.algorithm  # noqa
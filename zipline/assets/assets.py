@@ -78,6 +78,71 @@ def _convert_asset_timestamp_fields(dict_):
     return dict_
 
 
+class _LifetimeIndex(object):
+    """
+    Sorted interval index over the lifetimes of the assets in an AssetFinder.
+
+    Lifetimes are sorted by start date and paired with the running maximum
+    of their end dates.  Both are non-decreasing, so the lifetimes that can
+    overlap a range of dates form a contiguous run found by two binary
+    searches: every lifetime before the run ended before the range began, and
+    every lifetime after it started after the range ended.
+
+    Parameters
+    ----------
+    lifetimes : np.recarray
+        Record array with int64 fields 'sid', 'start' and 'end', as returned
+        by ``AssetFinder._compute_asset_lifetimes``.
+    """
+    __slots__ = ('lifetimes', '_order', '_starts', '_ends', '_max_ends')
+
+    def __init__(self, lifetimes):
+        self.lifetimes = lifetimes
+        self._order = order = np.argsort(lifetimes.start, kind='mergesort')
+        self._starts = lifetimes.start[order]
+        self._ends = ends = lifetimes.end[order]
+        self._max_ends = np.maximum.accumulate(ends)
+
+    def alive(self, dates, include_start_date):
+        """
+        Find the assets that were alive on at least one of `dates`.
+
+        Parameters
+        ----------
+        dates : pd.DatetimeIndex
+            Sorted dates to check.
+        include_start_date : bool
+            Whether or not to count an asset as alive on its start_date.
+
+        Returns
+        -------
+        positions : np.ndarray[intp]
+            The sorted positions in ``lifetimes`` of the matching assets.
+        """
+        raw_dates = dates.asi8
+        if not len(raw_dates):
+            return np.array([], dtype=np.intp)
+
+        if include_start_date:
+            start_side, date_side = 'right', 'left'
+        else:
+            start_side, date_side = 'left', 'right'
+        lo = self._max_ends.searchsorted(raw_dates[0], 'left')
+        hi = self._starts.searchsorted(raw_dates[-1], start_side)
+        if hi <= lo:
+            return np.array([], dtype=np.intp)
+
+        # Lifetimes in the run overlap the range, but may fall entirely
+        # between two of `dates`, so check for a date during each of them.
+        next_date = raw_dates.searchsorted(self._starts[lo:hi], date_side)
+        has_next = next_date < len(raw_dates)
+        alive = has_next.copy()
+        alive[has_next] = (
+            raw_dates[next_date[has_next]] <= self._ends[lo:hi][has_next]
+        )
+        return np.sort(self._order[lo:hi][alive])
+
+
 class AssetFinder(object):
     """
     An AssetFinder is an interface to a database of Asset metadata written by
@@ -855,7 +920,7 @@ class AssetFinder(object):
             ('end', '<i8'),
         ])
 
-    def lifetimes(self, dates, include_start_date):
+    def lifetimes(self, dates, include_start_date, alive_dates=None):
         """
         Compute a DataFrame representing asset lifetimes for the specified date
         range.
@@ -872,6 +937,11 @@ class AssetFinder(object):
             this date?"  For many financial metrics, (e.g. daily close), data
             isn't available for an asset until the end of the asset's first
             day.
+        alive_dates : pd.DatetimeIndex, optional
+            If supplied, only assets that were alive on at least one of these
+            dates are included as columns.  These assets are found with a
+            sorted index of lifetimes, without building a mask for every
+            asset.  By default, every asset is included.
 
         Returns
         -------
@@ -892,8 +962,15 @@ class AssetFinder(object):
         # those new assets available.  Mutability is not my favorite
         # programming feature.
         if self._asset_lifetimes is None:
-            self._asset_lifetimes = self._compute_asset_lifetimes()
-        lifetimes = self._asset_lifetimes
+            self._asset_lifetimes = _LifetimeIndex(
+                self._compute_asset_lifetimes(),
+            )
+        index = self._asset_lifetimes
+        lifetimes = index.lifetimes
+        if alive_dates is not None:
+            lifetimes = lifetimes[
+                index.alive(alive_dates, include_start_date)
+            ]
 
         raw_dates = dates.asi8[:, None]
         if include_start_date:
@@ -150,7 +150,8 @@ cpdef _read_bcolz_data(ctable_t table,
     first_rows : ndarray[intp]
     last_rows : ndarray[intp]
     offsets : ndarray[intp
-        Arrays in the format returned by _compute_row_slices.
+        Arrays in the format returned by _compute_row_slices.  Assets whose
+        first row is after their last row aren't read, and are left as zeros.
 
     Returns
     -------
@@ -170,21 +171,38 @@ cpdef _read_bcolz_data(ctable_t table,
         intp_t first_row
         intp_t last_row
         intp_t offset
+        intp_t span_start = -1
+        intp_t span_end = -1
         list results = []
 
     nassets = shape[1]
     if not nassets== len(first_rows) == len(last_rows) == len(offsets):
         raise ValueError("Incompatible index arrays.")
 
+    # Assets are stored in contiguous blocks of rows, so every row we need
+    # lies in a single span of the table, which we can decompress with one
+    # slice rather than reading the whole column.
+    for asset in range(nassets):
+        first_row = first_rows[asset]
+        last_row = last_rows[asset]
+        if first_row > last_row:
+            continue
+        if span_start == -1 or first_row < span_start:
+            span_start = first_row
+        if last_row > span_end:
+            span_end = last_row
+
     for column_name in columns:
-        raw_data = table[column_name][:]
         outbuf = zeros(shape=shape, dtype=uint32)
-        for asset in range(nassets):
-            first_row = first_rows[asset]
-            last_row = last_rows[asset]
-            offset = offsets[asset]
-            for out_idx, raw_idx in enumerate(range(first_row, last_row + 1)):
-                outbuf[out_idx + offset, asset] = raw_data[raw_idx]
+        if span_start != -1:
+            raw_data = table[column_name][span_start:span_end + 1]
+            for asset in range(nassets):
+                first_row = first_rows[asset]
+                last_row = last_rows[asset]
+                offset = offsets[asset] - first_row
+                for raw_idx in range(first_row, last_row + 1):
+                    outbuf[raw_idx + offset, asset] = \
+                        raw_data[raw_idx - span_start]
 
         if column_name in {'open', 'high', 'low', 'close'}:
             where_nan = (outbuf == 0)
@@ -17,6 +17,7 @@ from collections import OrderedDict
 
 import logbook
 
+import numpy as np
 import pandas as pd
 from pandas.io.data import DataReader
 import pytz
@@ -31,10 +32,7 @@ from .paths import (
     data_root,
 )
 
-from zipline.utils.tradingcalendar import (
-    trading_day as trading_day_nyse,
-    trading_days as trading_days_nyse,
-)
+from zipline.utils import tradingcalendar
 
 logger = logbook.Logger('Loader')
 
@@ -50,6 +48,10 @@ INDEX_MAPPING = {
 
 ONE_HOUR = pd.Timedelta(hours=1)
 
+# Version of the layout written by ``write_binary_cache``.  Caches written with
+# a different version are treated as misses and rebuilt from the source csv.
+BINARY_CACHE_VERSION = 1
+
 
 def last_modified_time(path):
     """
@@ -84,6 +86,143 @@ def get_benchmark_filename(symbol):
     return "%s_benchmark.csv" % symbol
 
 
+def get_binary_cache_filepath(path):
+    """
+    Get the path of the binary cache for the csv stored at ``path``.
+    """
+    name = os.path.splitext(os.path.basename(path))[0]
+    return get_cache_filepath('%s.v%d.npz' % (name, BINARY_CACHE_VERSION))
+
+
+def write_binary_cache(path, data, source_mtime):
+    """
+    Write a Series or DataFrame indexed by a UTC DatetimeIndex to ``path`` as
+    an uncompressed npz archive.
+
+    Parameters
+    ----------
+    path : str
+        The path to write to.
+    data : pd.Series or pd.DataFrame
+        The data to cache.  Values must be coercible to float64.
+    source_mtime : float
+        The modification time of the file from which ``data`` was parsed.
+        Caches are only considered valid for sources with the same mtime.
+    """
+    is_frame = isinstance(data, pd.DataFrame)
+    arrays = {
+        'version': np.array(BINARY_CACHE_VERSION),
+        'source_mtime': np.array(source_mtime, dtype='float64'),
+        'index': data.index.asi8,
+        'values': data.values.astype('float64'),
+        'is_frame': np.array(is_frame),
+        'names': np.array(
+            [data.index.name or '', getattr(data, 'name', None) or ''],
+            dtype=str,
+        ),
+    }
+    if is_frame:
+        arrays['columns'] = np.array(list(map(str, data.columns)), dtype=str)
+
+    # Write to a temporary file and rename so that concurrent readers never
+    # observe a partially written cache.
+    tmp_path = '%s.%d.tmp' % (path, os.getpid())
+    with open(tmp_path, 'wb') as f:
+        np.savez(f, **arrays)
+    os.rename(tmp_path, path)
+
+
+def read_binary_cache(path, source_mtime):
+    """
+    Read data written by ``write_binary_cache``.
+
+    Parameters
+    ----------
+    path : str
+        The path to read from.
+    source_mtime : float
+        The current modification time of the source csv.
+
+    Returns
+    -------
+    data : pd.Series or pd.DataFrame or None
+        The cached data, or None if the cache is missing, was written by a
+        different version, or is stale with respect to ``source_mtime``.
+    """
+    if not os.path.exists(path):
+        return None
+
+    archive = np.load(path)
+    try:
+        if archive['version'] != BINARY_CACHE_VERSION:
+            return None
+        if archive['source_mtime'] != source_mtime:
+            return None
+
+        index_name, data_name = (name or None for name in archive['names'])
+        index = pd.DatetimeIndex(archive['index'], tz='UTC', name=index_name)
+        if archive['is_frame']:
+            return pd.DataFrame(
+                archive['values'],
+                index=index,
+                columns=archive['columns'].tolist(),
+            )
+        return pd.Series(archive['values'], index=index, name=data_name)
+    finally:
+        archive.close()
+
+
+def read_csv_with_binary_cache(path, read_csv):
+    """
+    Read the market data csv at ``path``, going through the binary cache.
+
+    The csv is only parsed with ``read_csv`` if there is no valid binary cache
+    for it, in which case the cache is (re)built from the parsed result.
+
+    Parameters
+    ----------
+    path : str
+        The path to the csv.
+    read_csv : callable[str -> pd.Series or pd.DataFrame]
+        Function used to parse the csv on a cache miss.
+
+    Returns
+    -------
+    data : pd.Series or pd.DataFrame
+        The parsed data.
+    """
+    source_mtime = os.path.getmtime(path)
+    cache_path = get_binary_cache_filepath(path)
+    try:
+        data = read_binary_cache(cache_path, source_mtime)
+    except (OSError, IOError, ValueError, KeyError) as e:
+        logger.info(
+            "Reading binary cache {path} failed with error [{error}].".format(
+                path=cache_path, error=e,
+            )
+        )
+        data = None
+
+    if data is None:
+        data = read_csv(path)
+        try:
+            write_binary_cache(cache_path, data, source_mtime)
+        except (OSError, IOError) as e:
+            logger.info(
+                "Writing binary cache {path} failed with error [{error}]."
+                .format(path=cache_path, error=e)
+            )
+    return data
+
+
+def _read_benchmark_csv(path):
+    return pd.Series.from_csv(path).tz_localize('UTC')
+
+
+def _read_treasury_csv(path):
+    return pd.DataFrame.from_csv(path).tz_localize('UTC')
+
+
 def has_data_for_dates(series_or_df, first_date, last_date):
     """
     Does `series_or_df` have data on or before first_date and on or after
@@ -96,8 +235,8 @@ def has_data_for_dates(series_or_df, first_date, last_date):
     return (first <= first_date) and (last >= last_date)
 
 
-def load_market_data(trading_day=trading_day_nyse,
-                     trading_days=trading_days_nyse,
+def load_market_data(trading_day=None,
+                     trading_days=None,
                      bm_symbol='^GSPC'):
     """
     Load benchmark returns and treasury yield curves for the given calendar and
@@ -137,6 +276,11 @@ def load_market_data(trading_day=trading_day_nyse,
     '1month', '3month', '6month',
     '1year','2year','3year','5year','7year','10year','20year','30year'
     """
+    if trading_day is None:
+        trading_day = tradingcalendar.trading_day
+    if trading_days is None:
+        trading_days = tradingcalendar.trading_days
+
     first_date = trading_days[0]
     now = pd.Timestamp.utcnow()
 
@@ -211,7 +355,7 @@ def ensure_benchmark_data(symbol, first_date, last_date, now, trading_day):
     # yet, so don't try to read from 'path'.
     if os.path.exists(path):
         try:
-            data = pd.Series.from_csv(path).tz_localize('UTC')
+            data = read_csv_with_binary_cache(path, _read_benchmark_csv)
             if has_data_for_dates(data, first_date, last_date):
                 return data
 
@@ -293,7 +437,7 @@ def ensure_treasury_data(bm_symbol, first_date, last_date, now):
     # yet, so don't try to read from 'path'.
     if os.path.exists(path):
         try:
-            data = pd.DataFrame.from_csv(path).tz_localize('UTC')
+            data = read_csv_with_binary_cache(path, _read_treasury_csv)
             if has_data_for_dates(data, first_date, last_date):
                 return data
 
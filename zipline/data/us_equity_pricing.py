@@ -18,7 +18,7 @@ from abc import (
 )
 from errno import ENOENT
 from os import remove
-from os.path import exists
+from os.path import abspath, exists, getmtime, join
 import sqlite3
 
 from bcolz import (
@@ -37,6 +37,7 @@ from numpy import (
     iinfo,
     integer,
     issubdtype,
+    maximum,
     nan,
     uint32,
 )
@@ -333,7 +334,26 @@ class DailyBarReader(with_metaclass(ABCMeta)):
     Reader for OHCLV pricing data at a daily frequency.
     """
     @abstractmethod
-    def load_raw_arrays(self, columns, start_date, end_date, assets):
+    def load_raw_arrays(self, columns, start_date, end_date, assets,
+                        mask=None):
+        """
+        Parameters
+        ----------
+        columns : list[BoundColumn]
+            The columns to load.
+        start_date, end_date : pd.Timestamp
+            The first and last dates to load.
+        assets : pd.Int64Index
+            The assets to load.
+        mask : np.ndarray[bool], optional
+            Array of shape (num_dates, len(assets)).  If supplied, values are
+            only required where it's True, and readers may skip the rest.
+
+        Returns
+        -------
+        arrays : list[np.ndarray]
+            A 2D array of shape (num_dates, len(assets)) for each column.
+        """
         pass
 
     @abstractmethod
@@ -432,7 +452,23 @@ class BcolzDailyBarReader(DailyBarReader):
 
         self.PRICE_ADJUSTMENT_FACTOR = 0.001
 
-    def _compute_slices(self, start_idx, end_idx, assets):
+    @property
+    def data_version(self):
+        """
+        A string identifying the data in our table, or None if the table
+        isn't stored on disk.
+        """
+        rootdir = self._table.rootdir
+        if rootdir is None:
+            return None
+        # Table attributes are written after the data, so their modification
+        # time changes whenever the table is rewritten.
+        attrs_path = join(rootdir, '__attrs__')
+        if not exists(attrs_path):
+            return None
+        return '%s@%r' % (abspath(rootdir), getmtime(attrs_path))
+
+    def _compute_slices(self, start_idx, end_idx, assets, mask=None):
         """
         Compute the raw row indices to load for each asset on a query for the
         given dates after applying a shift.
@@ -445,6 +481,11 @@ class BcolzDailyBarReader(DailyBarReader):
             Index of last date for which we want data.
         assets : pandas.Int64Index
             Assets for which we want to compute row indices
+        mask : np.ndarray[bool], optional
+            Array of shape (end_idx - start_idx + 1, len(assets)).  If
+            supplied, each asset's rows are clipped to the dates between the
+            first and last on which its mask is True, and assets whose mask
+            is never True get no rows.
 
         Returns
         -------
@@ -465,7 +506,7 @@ class BcolzDailyBarReader(DailyBarReader):
         """
         # The core implementation of the logic here is implemented in Cython
         # for efficiency.
-        return _compute_row_slices(
+        first_rows, last_rows, offsets = _compute_row_slices(
             self._first_rows,
             self._last_rows,
             self._calendar_offsets,
@@ -473,8 +514,24 @@ class BcolzDailyBarReader(DailyBarReader):
             end_idx,
             assets,
         )
-
-    def load_raw_arrays(self, columns, start_date, end_date, assets):
+        if mask is None:
+            return first_rows, last_rows, offsets
+
+        # Positions in the output of the first and last live dates.
+        live = mask.any(axis=0)
+        first_live = mask.argmax(axis=0)
+        last_live = len(mask) - 1 - mask[::-1].argmax(axis=0)
+
+        last_out = offsets + last_rows - first_rows
+        clipped_offsets = maximum(offsets, first_live)
+        first_rows = first_rows + clipped_offsets - offsets
+        last_rows = last_rows - maximum(last_out - last_live, 0)
+        # Empty the spans of assets that are never live.
+        last_rows[~live] = first_rows[~live] - 1
+        return first_rows, last_rows, clipped_offsets
+
+    def load_raw_arrays(self, columns, start_date, end_date, assets,
+                        mask=None):
         # Assumes that the given dates are actually in calendar.
         start_idx = self._calendar.get_loc(start_date)
         end_idx = self._calendar.get_loc(end_date)
@@ -482,6 +539,7 @@ class BcolzDailyBarReader(DailyBarReader):
             start_idx,
             end_idx,
             assets,
+            mask,
         )
         return _read_bcolz_data(
             self._table,
@@ -644,7 +702,8 @@ class PanelDailyBarReader(DailyBarReader):
     def last_available_dt(self):
         return self._calendar[-1]
 
-    def load_raw_arrays(self, columns, start_date, end_date, assets):
+    def load_raw_arrays(self, columns, start_date, end_date, assets,
+                        mask=None):
         col_names = [col.name for col in columns]
         cal = self._calendar
         index = cal[cal.slice_indexer(start_date, end_date)]
@@ -1099,6 +1158,17 @@ class SQLiteAdjustmentReader(object):
     def __init__(self, conn):
         self.conn = conn
 
+    @property
+    def data_version(self):
+        """
+        A string identifying the data in our database, or None if the
+        database isn't stored on disk.
+        """
+        _, _, path = self.conn.execute('PRAGMA database_list').fetchone()
+        if not path:
+            return None
+        return '%s@%r' % (abspath(path), getmtime(path))
+
     def load_adjustments(self, columns, dates, assets):
         return load_adjustments_from_sqlite(
             self.conn,
@@ -539,6 +539,16 @@ class NoSuchPipeline(ZiplineError, KeyError):
     )
 
 
+class DuplicatePipelineName(ZiplineError):
+    """
+    Raised when a user tries to attach two pipelines with the same name.
+    """
+    msg = (
+        "A pipeline named '{name}' has already been attached. "
+        "Each call to attach_pipeline() needs a different name."
+    )
+
+
 class UnsupportedDataType(ZiplineError):
     """
     Raised by CustomFactors with unsupported dtypes.
@@ -377,12 +377,13 @@ class PositionTracker(object):
 
                 if not np.isnan(last_sale_price):
                     position.last_sale_price = last_sale_price
-        else:
+        elif self.positions:
+            previous_minute = data_portal.env.previous_market_minute(dt)
             for asset, position in iteritems(self.positions):
                 last_sale_price = data_portal.get_adjusted_value(
                     asset,
                     'price',
-                    data_portal.env.previous_market_minute(dt),
+                    previous_minute,
                     dt,
                     self.data_frequency
                 )
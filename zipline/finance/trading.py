@@ -20,6 +20,7 @@ import datetime
 import pandas as pd
 import numpy as np
 from six import string_types
+from six.moves._thread import allocate_lock as Lock
 from sqlalchemy import create_engine
 
 from zipline.data.loader import load_market_data
@@ -57,6 +58,142 @@ log = logbook.Logger('Trading')
 # build a new TradingEnvironment object, then pass that TradingEnvironment as
 # the 'env' arg to your TradingAlgorithm.
 
+_NANOS_IN_MINUTE = 60000000000
+
+
+def _readonly(array):
+    array.setflags(write=False)
+    return array
+
+
+class CalendarCore(object):
+    """
+    Immutable calendar data for a trading calendar over a range of trading
+    days.
+
+    Building trading days, open/close tables and market minutes is expensive,
+    so cores are shared by every TradingEnvironment in the process that uses
+    the same calendar over the same range of days.  Use ``CalendarCore.get``
+    rather than constructing instances directly.
+
+    None of the attributes of a core may be mutated, since doing so would
+    affect every environment sharing it.
+
+    Parameters
+    ----------
+    trading_calendar : module
+        The trading calendar, e.g. ``zipline.utils.tradingcalendar``.
+    trading_days : pd.DatetimeIndex
+        The trading days covered by this core.
+    """
+    _cache = {}
+    _cache_lock = Lock()
+
+    def __init__(self, trading_calendar, trading_days):
+        self.trading_days = trading_days
+        self.first_trading_day = trading_days[0]
+        self.last_trading_day = trading_days[-1]
+
+        self.early_closes = trading_calendar.get_early_closes(
+            self.first_trading_day, self.last_trading_day,
+        )
+        self.open_and_closes = oc = trading_calendar.open_and_closes.loc[
+            trading_days
+        ]
+
+        self.market_opens_nanos = _readonly(
+            oc.market_open.values.astype('datetime64[ns]').astype(np.int64)
+        )
+        self.market_closes_nanos = _readonly(
+            oc.market_close.values.astype('datetime64[ns]').astype(np.int64)
+        )
+
+    @classmethod
+    def get(cls, trading_calendar, min_date=None, max_date=None):
+        """
+        Get the shared core for ``trading_calendar`` between ``min_date`` and
+        ``max_date``, building it if this is the first request for that
+        calendar and range.
+
+        Parameters
+        ----------
+        trading_calendar : module
+            The trading calendar to use.
+        min_date : pd.Timestamp, optional
+            The first date to include.  Defaults to the calendar's first day.
+        max_date : pd.Timestamp, optional
+            The last date to include.  Defaults to the calendar's last day.
+
+        Returns
+        -------
+        core : CalendarCore
+        """
+        all_days = trading_calendar.trading_days
+        start, stop, _ = all_days.slice_indexer(min_date, max_date).indices(
+            len(all_days),
+        )
+        key = (trading_calendar, start, stop)
+
+        with cls._cache_lock:
+            try:
+                return cls._cache[key]
+            except KeyError:
+                pass
+            cls._cache[key] = core = cls(
+                trading_calendar,
+                all_days[start:stop],
+            )
+        return core
+
+    @classmethod
+    def clear_cache(cls):
+        """
+        Drop all shared cores.
+        """
+        with cls._cache_lock:
+            cls._cache.clear()
+
+    @lazyval
+    def minutes_per_day(self):
+        """
+        The number of market minutes in each trading day.
+        """
+        return _readonly(
+            (self.market_closes_nanos - self.market_opens_nanos) //
+            _NANOS_IN_MINUTE + 1
+        )
+
+    @lazyval
+    def day_minute_offsets(self):
+        """
+        Index into ``market_minutes_nanos`` of the first minute of each
+        trading day.  Has one more entry than there are trading days; the last
+        entry is the total number of market minutes.
+        """
+        offsets = np.empty(len(self.trading_days) + 1, dtype=np.int64)
+        offsets[0] = 0
+        np.cumsum(self.minutes_per_day, out=offsets[1:])
+        return _readonly(offsets)
+
+    @lazyval
+    def market_minutes_nanos(self):
+        """
+        Every market minute covered by this core, as int64 nanoseconds since
+        the epoch in UTC.
+        """
+        minutes_per_day = self.minutes_per_day
+        day_starts = self.day_minute_offsets[:-1]
+        minutes = np.arange(self.day_minute_offsets[-1], dtype=np.int64)
+        minutes -= np.repeat(day_starts, minutes_per_day)
+        minutes *= _NANOS_IN_MINUTE
+        minutes += np.repeat(self.market_opens_nanos, minutes_per_day)
+        return _readonly(minutes)
+
+    @lazyval
+    def market_minutes(self):
+        return pd.DatetimeIndex(self.market_minutes_nanos, tz='UTC')
+
+
 class TradingEnvironment(object):
 
     # Token used as a substitute for pickling objects that contain a
@@ -80,34 +217,23 @@ class TradingEnvironment(object):
         """
         self.trading_day = env_trading_calendar.trading_day.copy()
 
-        # `tc_td` is short for "trading calendar trading days"
-        tc_td = env_trading_calendar.trading_days
-
-        self.trading_days = tc_td[tc_td.slice_indexer(min_date, max_date)]
-
-        self.first_trading_day = self.trading_days[0]
-        self.last_trading_day = self.trading_days[-1]
-
-        self.early_closes = env_trading_calendar.get_early_closes(
-            self.first_trading_day, self.last_trading_day)
-
-        self.open_and_closes = env_trading_calendar.open_and_closes.loc[
-            self.trading_days]
+        self.calendar_core = core = CalendarCore.get(
+            env_trading_calendar, min_date, max_date,
+        )
+        self.trading_days = core.trading_days
+        self.first_trading_day = core.first_trading_day
+        self.last_trading_day = core.last_trading_day
+        self.early_closes = core.early_closes
+        self.open_and_closes = core.open_and_closes
 
         self.bm_symbol = bm_symbol
         if not load:
             load = load_market_data
 
-        self.benchmark_returns, self.treasury_curves = \
-            load(self.trading_day, self.trading_days, self.bm_symbol)
-
-        if max_date:
-            tr_c = self.treasury_curves
-            # Mask the treasury curves down to the current date.
-            # In the case of live trading, the last date in the treasury
-            # curves would be the day before the date considered to be
-            # 'today'.
-            self.treasury_curves = tr_c[tr_c.index <= max_date]
+        # Benchmark returns and treasury curves are loaded on first access so
+        # that environments which never look at them don't pay for the load.
+        self._load = load
+        self._max_date = max_date
 
         self.exchange_tz = exchange_tz
 
@@ -124,9 +250,32 @@ class TradingEnvironment(object):
             self.asset_finder = None
 
     @lazyval
+    def _market_data(self):
+        benchmark_returns, treasury_curves = self._load(
+            self.trading_day, self.trading_days, self.bm_symbol,
+        )
+
+        if self._max_date:
+            tr_c = treasury_curves
+            # Mask the treasury curves down to the current date.
+            # In the case of live trading, the last date in the treasury
+            # curves would be the day before the date considered to be
+            # 'today'.
+            treasury_curves = tr_c[tr_c.index <= self._max_date]
+
+        return benchmark_returns, treasury_curves
+
+    @property
+    def benchmark_returns(self):
+        return self._market_data[0]
+
+    @property
+    def treasury_curves(self):
+        return self._market_data[1]
+
+    @property
     def market_minutes(self):
-        return self.minutes_for_days_in_range(self.first_trading_day,
-                                              self.last_trading_day)
+        return self.calendar_core.market_minutes
 
     def write_data(self,
                    engine=None,
@@ -323,25 +472,13 @@ class TradingEnvironment(object):
         start_date = self.normalize_date(start)
         end_date = self.normalize_date(end)
 
-        o_and_c = self.open_and_closes[
-            self.open_and_closes.index.slice_indexer(start_date, end_date)]
-
-        opens = o_and_c.market_open
-        closes = o_and_c.market_close
-
-        one_min = pd.Timedelta(1, unit='m')
-
-        all_minutes = []
-        for i in range(0, len(o_and_c.index)):
-            market_open = opens[i]
-            market_close = closes[i]
-            day_minutes = np.arange(market_open, market_close + one_min,
-                                    dtype='datetime64[m]')
-            all_minutes.append(day_minutes)
+        first_day = self.trading_days.searchsorted(start_date)
+        last_day = self.trading_days.searchsorted(end_date, side='right')
 
-        # Concatenate all minutes and truncate minutes before start/after end.
+        offsets = self.calendar_core.day_minute_offsets
         return pd.DatetimeIndex(
-            np.concatenate(all_minutes), copy=False, tz='UTC',
+            self.market_minutes_nanos[offsets[first_day]:offsets[last_day]],
+            tz='UTC',
         )
 
     def next_open_and_close(self, start_date):
@@ -373,23 +510,86 @@ class TradingEnvironment(object):
             )
         return self.get_open_and_close(previous)
 
+    @property
+    def market_minutes_nanos(self):
+        """
+        All market minutes in the environment, as a read-only array of int64
+        nanoseconds since the epoch in UTC.
+
+        Positions into this array are what the ``*_position`` methods below
+        accept and return, which lets callers navigate market minutes with
+        integer arithmetic instead of Timestamp arithmetic.
+        """
+        return self.calendar_core.market_minutes_nanos
+
+    def market_minute_position(self, dt, side='left'):
+        """
+        Get the position at which ``dt`` would be inserted into
+        ``market_minutes_nanos`` to maintain order.
+
+        Parameters
+        ----------
+        dt : datetime-like
+            The minute to look up.
+        side : {'left', 'right'}
+            As in numpy.searchsorted.  If ``dt`` is a market minute, 'left'
+            returns its position and 'right' returns its position plus one.
+
+        Returns
+        -------
+        pos : int
+        """
+        return self.market_minutes_nanos.searchsorted(
+            pd.Timestamp(dt).value, side=side,
+        )
+
+    def market_minute_at(self, pos):
+        """
+        Get the market minute at position ``pos`` as a Timestamp.
+        """
+        return pd.Timestamp(self.market_minutes_nanos[pos], tz='UTC')
+
+    def next_market_minute_position(self, start):
+        """
+        Get the position of the first market minute strictly after ``start``.
+
+        Raises
+        ------
+        NoFurtherDataError
+            If there are no market minutes after ``start``.
+        """
+        pos = self.market_minute_position(start, side='right')
+        if pos == len(self.market_minutes_nanos):
+            raise NoFurtherDataError(
+                msg=("Attempt to backtest beyond available history. "
+                     "Last known date: %s" % self.last_trading_day)
+            )
+        return pos
+
+    def previous_market_minute_position(self, start):
+        """
+        Get the position of the last market minute strictly before ``start``.
+
+        Raises
+        ------
+        NoFurtherDataError
+            If there are no market minutes before ``start``.
+        """
+        pos = self.market_minute_position(start, side='left') - 1
+        if pos < 0:
+            raise NoFurtherDataError(
+                msg=("Attempt to backtest beyond available history. "
+                     "First known date: %s" % self.first_trading_day)
+            )
+        return pos
+
     def next_market_minute(self, start):
         """
         Get the next market minute after @start. This is either the immediate
         next minute, the open of the same day if @start is before the market
         open on a trading day, or the open of the next market day after @start.
         """
-        if self.is_trading_day(start):
-            market_open, market_close = self.get_open_and_close(start)
-            # If start before market open on a trading day, return market open.
-            if start < market_open:
-                return market_open
-            # If start is during trading hours, then get the next minute.
-            elif start < market_close:
-                return start + datetime.timedelta(minutes=1)
-        # If start is not in a trading day, or is after the market close
-        # then return the open of the *next* trading day.
-        return self.next_open_and_close(start)[0]
+        return self.market_minute_at(self.next_market_minute_position(start))
 
     @remember_last
     def previous_market_minute(self, start):
@@ -398,17 +598,9 @@ class TradingEnvironment(object):
         previous minute, the close of the same day if @start is after the close
         on a trading day, or the close of the market day before @start.
         """
-        if self.is_trading_day(start):
-            market_open, market_close = self.get_open_and_close(start)
-            # If start after the market close, return market close.
-            if start > market_close:
-                return market_close
-            # If start is during trading hours, then get previous minute.
-            if start > market_open:
-                return start - datetime.timedelta(minutes=1)
-        # If start is not a trading day, or is before the market open
-        # then return the close of the *previous* trading day.
-        return self.previous_open_and_close(start)[1]
+        return self.market_minute_at(
+            self.previous_market_minute_position(start),
+        )
 
     def get_open_and_close(self, day):
         index = self.open_and_closes.index.get_loc(day.date())
@@ -416,8 +608,12 @@ class TradingEnvironment(object):
         return todays_minutes[0], todays_minutes[1]
 
     def market_minutes_for_day(self, stamp):
-        market_open, market_close = self.get_open_and_close(stamp)
-        return pd.date_range(market_open, market_close, freq='T')
+        day = self.open_and_closes.index.get_loc(stamp.date())
+        offsets = self.calendar_core.day_minute_offsets
+        return pd.DatetimeIndex(
+            self.market_minutes_nanos[offsets[day]:offsets[day + 1]],
+            tz='UTC',
+        )
 
     def open_close_window(self, start, count, offset=0, step=1):
         """
@@ -442,38 +638,53 @@ class TradingEnvironment(object):
             raise ValueError("market_minute_window starting at "
                              "non-market time {minute}".format(minute=start))
 
-        all_minutes = []
-
-        current_day_minutes = self.market_minutes_for_day(start)
-        first_minute_idx = current_day_minutes.searchsorted(start)
-        minutes_in_range = current_day_minutes[first_minute_idx::step]
+        minutes = self.market_minutes_nanos
+        pos = self.market_minute_position(start)
 
-        # Build up list of lists of days' market minutes until we have count
-        # minutes stored altogether.
-        while True:
+        if step == 1:
+            window = minutes[pos:pos + count]
+        elif step == -1:
+            window = minutes[max(pos - count + 1, 0):pos + 1][::-1]
+        else:
+            window = self._stepped_minute_window(pos, count, step)
 
-            if len(minutes_in_range) >= count:
-                # Truncate off extra minutes
-                minutes_in_range = minutes_in_range[:count]
+        if len(window) < count:
+            raise NoFurtherDataError(
+                msg=("Attempt to backtest beyond available history. "
+                     "Requested {count} minutes from {start}.".format(
+                         count=count, start=start,
+                     ))
+            )
+        return pd.DatetimeIndex(window, tz='UTC')
 
-            all_minutes.append(minutes_in_range)
-            count -= len(minutes_in_range)
-            if count <= 0:
-                break
+    def _stepped_minute_window(self, pos, count, step):
+        """
+        Gather ``count`` market minutes starting at position ``pos``, taking
+        every ``step``th minute of each day.  Each day after the first starts
+        again at its open (or close, for negative steps).
+        """
+        minutes = self.market_minutes_nanos
+        offsets = self.calendar_core.day_minute_offsets
+        day = offsets.searchsorted(pos, side='right') - 1
+        last_day = len(offsets) - 2
 
+        chunks = []
+        while count > 0 and 0 <= day <= last_day:
             if step > 0:
-                start, _ = self.next_open_and_close(start)
-                current_day_minutes = self.market_minutes_for_day(start)
+                indices = np.arange(pos, offsets[day + 1], step)
             else:
-                _, start = self.previous_open_and_close(start)
-                current_day_minutes = self.market_minutes_for_day(start)
-
-            minutes_in_range = current_day_minutes[::step]
-
-        # Concatenate all the accumulated minutes.
-        return pd.DatetimeIndex(
-            np.concatenate(all_minutes), copy=False, tz='UTC',
-        )
+                indices = np.arange(pos, offsets[day] - 1, step)
+            chunk = minutes[indices[:count]]
+            chunks.append(chunk)
+            count -= len(chunk)
+
+            day += 1 if step > 0 else -1
+            if 0 <= day <= last_day:
+                pos = offsets[day] if step > 0 else offsets[day + 1] - 1
+
+        if not chunks:
+            return minutes[:0]
+        return np.concatenate(chunks)
 
     def trading_day_distance(self, first_date, second_date):
         first_date = self.normalize_date(first_date)
@@ -33,7 +33,6 @@ cdef class MinuteSimulationClock:
     cdef object all_trading_days
     cdef bool minute_emission
     cdef np.int64_t[:] market_opens, market_closes
-    cdef public dict minutes_by_day, minutes_to_day
 
     def __init__(self,
                  trading_days,
@@ -46,7 +45,6 @@ cdef class MinuteSimulationClock:
         self.market_closes = market_closes
         self.trading_days = trading_days
         self.all_trading_days = all_trading_days
-        self.minutes_by_day = self.calc_minutes_by_day()
 
     @cython.boundscheck(False)
     @cython.wraparound(False)
@@ -59,22 +57,25 @@ cdef class MinuteSimulationClock:
                          market_closes[i] + _nanos_in_minute,
                          _nanos_in_minute)
 
+    cpdef day_minutes(self, np.intp_t i):
+        return pd.to_datetime(self.market_minutes(i), utc=True, box=True)
+
     cpdef calc_minutes_by_day(self):
         minutes_by_day = {}
         for day_idx, day in enumerate(self.trading_days):
-            minutes = pd.to_datetime(
-                self.market_minutes(day_idx), utc=True, box=True)
-            minutes_by_day[day] = minutes
+            minutes_by_day[day] = self.day_minutes(day_idx)
         return minutes_by_day
 
     def __iter__(self):
 
         minute_emission = self.minute_emission
 
-        for day in self.trading_days:
+        # Minutes are boxed one day at a time as the simulation reaches that
+        # day, rather than materializing an index for every day up front.
+        for day_idx, day in enumerate(self.trading_days):
             yield day, DAY_START
 
-            minutes = self.minutes_by_day[day]
+            minutes = self.day_minutes(day_idx)
 
             for minute in minutes:
                 yield minute, BAR
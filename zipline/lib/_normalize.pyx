@@ -0,0 +1,116 @@
+"""
+Compiled kernels for grouped row-wise normalizations.
+"""
+cimport cython
+from libc.math cimport sqrt
+from numpy cimport (
+    float64_t,
+    import_array,
+    int64_t,
+    intp_t,
+    ndarray,
+    NPY_MERGESORT,
+    PyArray_ArgSort,
+)
+
+
+import_array()
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cdef _grouped_rowwise_normalize(ndarray[float64_t, ndim=2] data,
+                                ndarray[int64_t, ndim=2] group_labels,
+                                ndarray[float64_t, ndim=2] out,
+                                bint scale):
+    """
+    Subtract the mean of each group from each row of ``data``, ignoring NaNs,
+    and divide by the group's standard deviation if ``scale`` is True.
+
+    Each row's labels are sorted once, after which every group is a
+    contiguous run of the sort order that we reduce over in place.
+    """
+    cdef:
+        Py_ssize_t nrows = data.shape[0]
+        Py_ssize_t ncols = data.shape[1]
+        Py_ssize_t i, k, start, stop, col
+        ndarray[intp_t, ndim=2] order
+        int64_t label
+        float64_t value, total, mean, deviation, denominator
+        Py_ssize_t count
+
+    order = PyArray_ArgSort(group_labels, 1, NPY_MERGESORT)
+
+    for i in range(nrows):
+        start = 0
+        while start < ncols:
+            label = group_labels[i, order[i, start]]
+            stop = start + 1
+            while stop < ncols and group_labels[i, order[i, stop]] == label:
+                stop += 1
+
+            total = 0.0
+            count = 0
+            for k in range(start, stop):
+                value = data[i, order[i, k]]
+                # NaN is the only value not equal to itself.
+                if value == value:
+                    total += value
+                    count += 1
+            # A group with no non-NaN values has a mean and standard deviation
+            # of 0.0 / 0 == NaN, as with nanmean and nanstd.
+            mean = total / count
+
+            denominator = 1.0
+            if scale:
+                total = 0.0
+                for k in range(start, stop):
+                    value = data[i, order[i, k]]
+                    if value == value:
+                        deviation = value - mean
+                        total += deviation * deviation
+                denominator = sqrt(total / count)
+
+            for k in range(start, stop):
+                col = order[i, k]
+                out[i, col] = (data[i, col] - mean) / denominator
+
+            start = stop
+
+    return out
+
+
+def grouped_rowwise_demean(ndarray data, ndarray group_labels, ndarray out):
+    """
+    Subtract from each entry of ``data`` the mean of the non-NaN entries in
+    its row sharing its label in ``group_labels``.
+
+    Equivalent to::
+
+        naive_grouped_rowwise_apply(
+            data, group_labels, lambda row: row - nanmean(row), out,
+        )
+
+    ``data`` and ``out`` must be float64, and ``group_labels`` must be int64.
+    """
+    return _grouped_rowwise_normalize(data, group_labels, out, False)
+
+
+def grouped_rowwise_zscore(ndarray data, ndarray group_labels, ndarray out):
+    """
+    Z-Score each entry of ``data`` against the non-NaN entries in its row
+    sharing its label in ``group_labels``.
+
+    Equivalent to::
+
+        naive_grouped_rowwise_apply(
+            data,
+            group_labels,
+            lambda row: (row - nanmean(row)) / nanstd(row),
+            out,
+        )
+
+    ``data`` and ``out`` must be float64, and ``group_labels`` must be int64.
+    """
+    return _grouped_rowwise_normalize(data, group_labels, out, True)
@@ -11,11 +11,24 @@ zipline.lib._floatwindow
 zipline.lib._intwindow
 zipline.lib._datewindow
 """
-from numpy cimport ndarray
+cimport cython
+from numpy cimport int8_t, int64_t, ndarray
 from numpy import asarray
+from numpy.lib.stride_tricks import as_strided
+
+from zipline.lib.adjustment import (
+    ADD,
+    CUSTOM,
+    MULTIPLY,
+    pack_adjustments,
+)
 
 ctypedef ctype[:, :] databuffer
 
+cdef int8_t _ADD = ADD
+cdef int8_t _CUSTOM = CUSTOM
+cdef int8_t _MULTIPLY = MULTIPLY
+
 
 cdef class AdjustedArrayWindow:
     """
@@ -24,9 +37,18 @@ cdef class AdjustedArrayWindow:
     Concrete subtypes should subclass this and provide a `data` attribute for
     specific types.
 
-    This object stores a copy of the data from the AdjustedArray over which
-    it's iterating.  At each step in the iteration, it mutates its copy to
-    allow us to show different data when looking back over the array.
+    At each step in the iteration, this object mutates the data over which
+    it's iterating to allow us to show different data when looking back over
+    the array.  If `copy_on_write` is True, `data` is never mutated: we view
+    it directly until the first adjustment needs to be applied, and then
+    switch to a private copy.  Windows over data without adjustments in range
+    therefore never copy it, and can share it with other windows.
+
+    `adjustments` may be a dict mapping rows to lists of adjustments, or the
+    result of passing such a dict to
+    ``zipline.lib.adjustment.pack_adjustments``.  Adjustments are stored as
+    parallel arrays and applied by a compiled loop that touches only the
+    affected region of each column.
 
     The arrays yielded by this iterator are always views over the underlying
     data.
@@ -36,38 +58,100 @@ cdef class AdjustedArrayWindow:
         databuffer data
         object viewtype
         readonly Py_ssize_t window_length
-        Py_ssize_t anchor, next_anchor, max_anchor, next_adj
-        dict adjustments
-        list adjustment_indices
+        Py_ssize_t anchor, next_anchor, max_anchor
+        # Index of the next adjustment to apply, and the number of
+        # adjustments.
+        Py_ssize_t next_adj, num_adjustments
+        int64_t[:] adj_anchors, adj_first_rows, adj_last_rows
+        int64_t[:] adj_first_cols, adj_last_cols
+        int8_t[:] adj_kinds
+        ctype[:] adj_values
+        list adj_objects
         ndarray last_out
+        # Whether self.data is shared with our creator, and must be copied
+        # before it's mutated.
+        readonly bint shares_data
 
     def __cinit__(self,
                   databuffer data not None,
                   object viewtype not None,
-                  dict adjustments not None,
+                  object adjustments not None,
                   Py_ssize_t offset,
-                  Py_ssize_t window_length):
+                  Py_ssize_t window_length,
+                  bint copy_on_write=False):
+
+        if isinstance(adjustments, dict):
+            adjustments = pack_adjustments(adjustments, asarray(data).dtype)
 
         self.data = data
+        self.shares_data = copy_on_write
         self.viewtype = viewtype
-        self.adjustments = adjustments
-        self.adjustment_indices = sorted(adjustments, reverse=True)
+        self.adj_anchors = adjustments.anchors
+        self.adj_first_rows = adjustments.first_rows
+        self.adj_last_rows = adjustments.last_rows
+        self.adj_first_cols = adjustments.first_cols
+        self.adj_last_cols = adjustments.last_cols
+        self.adj_kinds = adjustments.kinds
+        self.adj_values = adjustments.values
+        self.adj_objects = adjustments.objects
+        self.next_adj = 0
+        self.num_adjustments = len(adjustments.anchors)
         self.window_length = window_length
         self.anchor = window_length + offset
         self.next_anchor = self.anchor
         self.max_anchor = data.shape[0]
 
-        self.next_adj = self.pop_next_adj()
         self.last_out = None
 
-    cdef pop_next_adj(self):
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef apply_adjustments_before(self, Py_ssize_t anchor):
         """
-        Pop the index of the next adjustment to apply from self.adjustment_indices.
+        Apply any adjustments that occured before `anchor`.
         """
-        if len(self.adjustment_indices) > 0:
-            return self.adjustment_indices.pop()
-        else:
-            return self.max_anchor
+        cdef:
+            Py_ssize_t idx = self.next_adj
+            Py_ssize_t row, col, first_row, last_row
+            int8_t kind
+            ctype value
+            databuffer data
+
+        if idx == self.num_adjustments or self.adj_anchors[idx] >= anchor:
+            return
+
+        if self.shares_data:
+            self.data = self.data.copy()
+            self.shares_data = False
+        data = self.data
+
+        while idx < self.num_adjustments and self.adj_anchors[idx] < anchor:
+            kind = self.adj_kinds[idx]
+            if kind == _CUSTOM:
+                self.adj_objects[idx].mutate(data)
+                idx += 1
+                continue
+
+            value = self.adj_values[idx]
+            first_row = self.adj_first_rows[idx]
+            last_row = self.adj_last_rows[idx]
+            # last_col + 1 and last_row + 1 because the last column and row
+            # should also be affected.
+            for col in range(
+                self.adj_first_cols[idx],
+                self.adj_last_cols[idx] + 1,
+            ):
+                if kind == _MULTIPLY:
+                    for row in range(first_row, last_row + 1):
+                        data[row, col] *= value
+                elif kind == _ADD:
+                    for row in range(first_row, last_row + 1):
+                        data[row, col] += value
+                else:
+                    for row in range(first_row, last_row + 1):
+                        data[row, col] = value
+            idx += 1
+
+        self.next_adj = idx
 
     def __iter__(self):
         return self
@@ -75,7 +159,6 @@ cdef class AdjustedArrayWindow:
     def __next__(self):
         cdef:
             ndarray out
-            object adjustment
             Py_ssize_t start, anchor
 
         anchor = self.anchor = self.next_anchor
@@ -85,12 +168,7 @@ cdef class AdjustedArrayWindow:
         # Apply any adjustments that occured before our current anchor.
         # Equivalently, apply any adjustments known **on or before** the date
         # for which we're calculating a window.
-        while self.next_adj < anchor:
-
-            for adjustment in self.adjustments[self.next_adj]:
-                adjustment.mutate(self.data)
-
-            self.next_adj = self.pop_next_adj()
+        self.apply_adjustments_before(anchor)
 
         start = anchor - self.window_length
         out = asarray(self.data[start:self.anchor]).view(self.viewtype)
@@ -100,6 +178,78 @@ cdef class AdjustedArrayWindow:
         self.last_out = out
         return out
 
+    cpdef Py_ssize_t batch_length(self):
+        """
+        The number of consecutive windows, starting with the next window, that
+        can be viewed without applying any further adjustments.
+
+        This is the largest valid argument to ``next_batch``.
+        """
+        cdef:
+            Py_ssize_t anchor = self.next_anchor
+            Py_ssize_t boundary = self.max_anchor
+            Py_ssize_t idx = self.next_adj
+
+        if anchor > self.max_anchor:
+            return 0
+
+        # Adjustments occurring before `anchor` are applied when we advance to
+        # it, so the batch ends at the first adjustment at or after `anchor`.
+        while idx < self.num_adjustments:
+            if self.adj_anchors[idx] >= anchor:
+                boundary = self.adj_anchors[idx]
+                break
+            idx += 1
+
+        return min(boundary, self.max_anchor) - anchor + 1
+
+    def next_batch(self, Py_ssize_t num_windows):
+        """
+        Advance by ``num_windows`` windows at once.
+
+        Returns a read-only array of shape
+        ``(num_windows, window_length, ncols)`` whose ``i``th entry is the
+        window that ``next()`` would have produced on the ``i``th call.  The
+        result is a strided view over our data, so, like the windows produced
+        by ``next()``, it is only valid until the iterator is advanced again.
+
+        Parameters
+        ----------
+        num_windows : int
+            The number of windows to produce.  Must be positive and no larger
+            than ``self.batch_length()``.
+        """
+        cdef:
+            ndarray base, out
+            Py_ssize_t anchor, last
+
+        if num_windows < 1 or num_windows > self.batch_length():
+            raise ValueError(
+                "Can't produce a batch of %d windows; at most %d windows "
+                "are available without applying adjustments." % (
+                    num_windows, self.batch_length(),
+                )
+            )
+
+        anchor = self.next_anchor
+        self.apply_adjustments_before(anchor)
+
+        last = anchor + num_windows - 1
+        base = asarray(self.data[anchor - self.window_length:last]).view(
+            self.viewtype,
+        )
+        out = as_strided(
+            base,
+            shape=(num_windows, self.window_length, base.shape[1]),
+            strides=(base.strides[0], base.strides[0], base.strides[1]),
+        )
+        out.setflags(write=False)
+
+        self.anchor = last
+        self.next_anchor = last + 1
+        self.last_out = out[-1]
+        return out
+
     def seek(self, target_anchor):
         cdef:
             ndarray out
@@ -19,13 +19,17 @@ from zipline.errors import (
 )
 from zipline.utils.numpy_utils import (
     datetime64ns_dtype,
+    float32_dtype,
     float64_dtype,
     int64_dtype,
     uint8_dtype,
 )
 from zipline.utils.memoize import lazyval
 
+from .adjustment import pack_adjustments
+
 # These class names are all the same because of our bootleg templating system.
+from ._float32window import AdjustedArrayWindow as Float32Window
 from ._float64window import AdjustedArrayWindow as Float64Window
 from ._int64window import AdjustedArrayWindow as Int64Window
 from ._uint8window import AdjustedArrayWindow as UInt8Window
@@ -59,6 +63,7 @@ def can_represent_dtype(dtype):
 
 
 CONCRETE_WINDOW_TYPES = {
+    float32_dtype: Float32Window,
     float64_dtype: Float64Window,
     int64_dtype: Int64Window,
     uint8_dtype: UInt8Window,
@@ -71,7 +76,8 @@ def _normalize_array(data):
     representation, returning the coerced array and a numpy dtype object to use
     as a view type when providing public view into the data.
 
-    - float* data is coerced to float64 with viewtype float64.
+    - float32 data is kept as float32 with viewtype float32.
+    - other float* data is coerced to float64 with viewtype float64.
     - int32, int64, and uint32 are converted to int64 with viewtype int64.
     - datetime[*] data is coerced to int64 with a viewtype of datetime64[ns].
     - bool_ data is coerced to uint8 with a viewtype of bool_.
@@ -87,6 +93,8 @@ def _normalize_array(data):
     data_dtype = data.dtype
     if data_dtype == bool_:
         return data.astype(uint8), dtype(bool_)
+    elif data_dtype == float32:
+        return data.astype(float32), dtype(float32)
     elif data_dtype in FLOAT_DTYPES:
         return data.astype(float64), dtype(float64)
     elif data_dtype in INT_DTYPES:
@@ -167,6 +175,29 @@ class AdjustedArray(object):
         """
         return self._viewtype
 
+    def astype(self, dtype):
+        """
+        Return a copy of this array with its data cast to `dtype`, sharing
+        our adjustments.
+
+        Adjustments to float64 data also apply to float32 data, so float64
+        arrays can be stored at reduced precision with ``astype(float32)``.
+        """
+        return AdjustedArray(
+            self.data.astype(dtype),
+            NOMASK,
+            self.adjustments,
+            self.missing_value,
+        )
+
+    @lazyval
+    def _packed_adjustments(self):
+        """
+        Our adjustments, packed into arrays so that each traversal can apply
+        them without re-reading the adjustment objects.
+        """
+        return pack_adjustments(self.adjustments, self._data.dtype)
+
     @lazyval
     def _iterator_type(self):
         """
@@ -185,15 +216,23 @@ class AdjustedArray(object):
             The number of rows in each emitted window.
         offset : int, optional
             Number of rows to skip before the first window.
+
+        Notes
+        -----
+        The iterator views our data directly, and only copies it once it
+        reaches a row at which adjustments need to be applied.  Traversing an
+        array without adjustments, or only the rows before its first
+        adjustment, doesn't copy any data.
         """
-        data = self._data.copy()
+        data = self._data
         _check_window_params(data, window_length)
         return self._iterator_type(
             data,
             self._viewtype,
-            self.adjustments,
+            self._packed_adjustments,
             offset,
             window_length,
+            copy_on_write=True,
         )
 
     def inspect(self):
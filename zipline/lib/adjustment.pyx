@@ -1,9 +1,11 @@
 # cython: embedsignature=True
+from collections import namedtuple
+
 from cpython cimport Py_EQ
 
 from pandas import isnull, Timestamp
 from numpy cimport float64_t, uint8_t, int64_t
-from numpy import datetime64, float64
+from numpy import datetime64, empty, float32, float64, int8, int64, zeros
 # Purely for readability. There aren't C-level declarations for these types.
 ctypedef object Int64Index_t
 ctypedef object DatetimeIndex_t
@@ -536,3 +538,119 @@ cdef class Datetime64Overwrite(Datetime64Adjustment):
             # last_row + 1 because last_row should also be affected.
             for row in range(self.first_row, self.last_row + 1):
                 data[row, col] = self.value
+
+
+# Kind of packed adjustments that compiled windows don't know how to apply
+# themselves.  These are applied by calling their ``mutate`` method.
+CUSTOM = -1
+
+# Map from adjustment type -> (kind, dtypes of the data it applies to).
+# Float adjustments also apply to float32 data stored at reduced precision,
+# with their values rounded to float32.
+cdef dict _packed_adjustment_kinds = {
+    Float64Add: (ADD, (float64, float32)),
+    Float64Multiply: (MULTIPLY, (float64, float32)),
+    Float64Overwrite: (OVERWRITE, (float64, float32)),
+    Datetime64Overwrite: (OVERWRITE, (int64,)),
+}
+
+
+class PackedAdjustments(namedtuple('PackedAdjustments',
+                                   'anchors first_rows last_rows '
+                                   'first_cols last_cols kinds values '
+                                   'objects')):
+    """
+    Struct-of-arrays representation of a dict of adjustments, as produced by
+    ``pack_adjustments``.
+
+    Entry ``i`` of each array describes the ``i``th adjustment, ordered by
+    the row at which it should be applied.
+
+    Attributes
+    ----------
+    anchors : np.ndarray[int64]
+        The key under which each adjustment was stored.  An adjustment is
+        applied before producing any window ending after its anchor.
+    first_rows, last_rows, first_cols, last_cols : np.ndarray[int64]
+        The inclusive bounds of the region modified by each adjustment.
+    kinds : np.ndarray[int8]
+        The AdjustmentKind of each adjustment, or CUSTOM.
+    values : np.ndarray
+        The value of each adjustment, of the same dtype as the data to which
+        it applies.
+    objects : list
+        The Adjustment object for each adjustment of kind CUSTOM, and None
+        for every other adjustment.
+    """
+    __slots__ = ()
+
+
+def pack_adjustments(dict adjustments, object dtype):
+    """
+    Pack a dict of adjustments into a PackedAdjustments.
+
+    Parameters
+    ----------
+    adjustments : dict[int -> list[Adjustment]]
+        Map from anchor row to the adjustments to apply at that row, in
+        order.
+    dtype : np.dtype
+        The dtype of the data to which the adjustments will be applied.
+
+    Returns
+    -------
+    packed : PackedAdjustments
+        The adjustments, sorted by anchor.  Adjustments with the same anchor
+        keep their relative order.
+
+    Example
+    -------
+    >>> import numpy as np
+    >>> packed = pack_adjustments(
+    ...     {3: [Float64Multiply(0, 3, 1, 2, 0.5)]},
+    ...     np.dtype('float64'),
+    ... )
+    >>> packed.anchors, packed.first_cols, packed.last_cols, packed.values
+    (array([3]), array([1]), array([2]), array([ 0.5]))
+    """
+    cdef:
+        Py_ssize_t i = 0
+        Py_ssize_t count = sum(len(adjs) for adjs in adjustments.values())
+        object adjustment, kind_and_dtype
+
+    anchors = empty(count, dtype=int64)
+    first_rows = empty(count, dtype=int64)
+    last_rows = empty(count, dtype=int64)
+    first_cols = empty(count, dtype=int64)
+    last_cols = empty(count, dtype=int64)
+    kinds = empty(count, dtype=int8)
+    values = zeros(count, dtype=dtype)
+    objects = [None] * count
+
+    for anchor in sorted(adjustments):
+        for adjustment in adjustments[anchor]:
+            anchors[i] = anchor
+            first_rows[i] = adjustment.first_row
+            last_rows[i] = adjustment.last_row
+            first_cols[i] = adjustment.first_col
+            last_cols[i] = adjustment.last_col
+
+            kind_and_dtype = _packed_adjustment_kinds.get(type(adjustment))
+            if kind_and_dtype is not None and dtype in kind_and_dtype[1]:
+                kinds[i] = kind_and_dtype[0]
+                values[i] = adjustment.value
+            else:
+                kinds[i] = CUSTOM
+                objects[i] = adjustment
+            i += 1
+
+    return PackedAdjustments(
+        anchors,
+        first_rows,
+        last_rows,
+        first_cols,
+        last_cols,
+        kinds,
+        values,
+        objects,
+    )
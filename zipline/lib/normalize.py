@@ -1,5 +1,76 @@
 import numpy as np
 
+from zipline.utils.math_utils import nanmean, nanstd
+from ._normalize import grouped_rowwise_demean, grouped_rowwise_zscore
+
+
+def demean(row):
+    """
+    Subtract the mean of the non-NaN values in ``row`` from each value.
+    """
+    return row - nanmean(row)
+
+
+def zscore(row):
+    """
+    Z-Score ``row`` against the mean and standard deviation of its non-NaN
+    values.
+    """
+    return (row - nanmean(row)) / nanstd(row)
+
+
+# Compiled implementations of grouped_rowwise_apply for the functions above.
+_compiled_grouped_kernels = {
+    demean: grouped_rowwise_demean,
+    zscore: grouped_rowwise_zscore,
+}
+
+
+def grouped_rowwise_apply(data, group_labels, func, out=None):
+    """
+    Apply ``func`` to the pieces of each row of ``data`` sharing a label in
+    ``group_labels``.
+
+    Uses a compiled kernel when ``func`` is ``demean`` or ``zscore`` and the
+    inputs are float64 data with int64 labels, and falls back to
+    ``naive_grouped_rowwise_apply`` otherwise.
+
+    Parameters
+    ----------
+    data : ndarray[ndim=2]
+        Input array over which to apply a grouped function.
+    group_labels : ndarray[ndim=2, dtype=int64]
+        Labels to use to bucket inputs from array.
+        Should be the same shape as array.
+    func : function[ndarray[ndim=1]] -> function[ndarray[ndim=1]]
+        Function to apply to pieces of each row in array.
+    out : ndarray, optional
+        Array into which to write output.  If not supplied, a new array of the
+        same shape as ``data`` is allocated and returned.
+
+    Example
+    -------
+    >>> data = np.array([[1., 2., 3.],
+    ...                  [2., 3., 4.],
+    ...                  [5., 6., 7.]])
+    >>> labels = np.array([[0, 0, 1],
+    ...                    [0, 1, 0],
+    ...                    [1, 0, 2]])
+    >>> grouped_rowwise_apply(data, labels, demean)
+    array([[-0.5,  0.5,  0. ],
+           [-1. ,  0. ,  1. ],
+           [ 0. ,  0. ,  0. ]])
+    """
+    kernel = _compiled_grouped_kernels.get(func)
+    if (kernel is None or
+            data.dtype != np.float64 or
+            group_labels.dtype != np.int64):
+        return naive_grouped_rowwise_apply(data, group_labels, func, out)
+
+    if out is None:
+        out = np.empty_like(data)
+    return kernel(data, group_labels, out)
+
 
 def naive_grouped_rowwise_apply(data, group_labels, func, out=None):
     """
@@ -1,17 +1,170 @@
 """
 Algorithms for computing quantiles on numpy arrays.
 """
-from numpy.lib import apply_along_axis
-from pandas import qcut
+from numbers import Integral
+
+from numpy import (
+    arange,
+    asarray,
+    diff,
+    float64,
+    floor,
+    intp,
+    isnan,
+    linspace,
+    maximum,
+    minimum,
+    nan,
+    newaxis,
+    sort,
+    where,
+    zeros,
+)
+
+
+def rowwise_order_statistics(data, fractions):
+    """
+    Compute linearly-interpolated order statistics of each row of ``data``,
+    ignoring NaNs.
+
+    Each row is sorted once, after which every requested statistic of every
+    row is read off with a single vectorized gather.
+
+    Parameters
+    ----------
+    data : np.ndarray[float64, ndim=2]
+        The data from which to compute statistics.
+    fractions : array-like[float64]
+        Fractions in [0.0, 1.0] of the way through each row's sorted non-NaN
+        values at which to compute statistics.  0.0 is the minimum and 1.0 is
+        the maximum.
+
+    Returns
+    -------
+    statistics : np.ndarray[float64, ndim=2]
+        Array of shape ``(len(data), len(fractions))``.  Rows of ``data``
+        with no non-NaN values produce NaN.
+
+    Notes
+    -----
+    A statistic falling between the ``i``th and ``i + 1``th smallest values,
+    ``a`` and ``b``, is interpolated as ``a + (b - a) * weight``.  This is
+    the interpolation used by ``pandas.qcut``, and agrees with
+    ``numpy.nanpercentile`` up to rounding.
+
+    Example
+    -------
+    >>> import numpy as np
+    >>> data = np.array([[4., 1., 3., 2.],
+    ...                  [1., np.nan, 3., np.nan]])
+    >>> rowwise_order_statistics(data, [0.0, 0.5, 1.0])
+    array([[ 1. ,  2.5,  4. ],
+           [ 1. ,  2. ,  3. ]])
+    """
+    data = asarray(data, dtype=float64)
+    fractions = asarray(fractions, dtype=float64)
+    nrows = data.shape[0]
+
+    # NaNs sort to the end of each row.
+    sorted_data = sort(data, axis=1)
+    counts = data.shape[1] - isnan(data).sum(axis=1)
+    last = maximum(counts - 1, 0)[:, newaxis]
+
+    positions = fractions[newaxis, :] * last
+    below = floor(positions).astype(intp)
+    weights = positions - below
+    above = minimum(below + 1, last)
+
+    rows = arange(nrows)[:, newaxis]
+    lower = sorted_data[rows, below]
+    upper = sorted_data[rows, above]
+    # Use the lower value directly for exact positions, so that we don't
+    # compute inf - inf when the upper value is infinite.
+    result = where(weights == 0, lower, lower + (upper - lower) * weights)
+    result[counts == 0] = nan
+    return result
 
 
 def quantiles(data, nbins_or_partition_bounds):
     """
     Compute rowwise array quantiles on an input.
+
+    Equivalent to applying ``pandas.qcut(row, nbins_or_partition_bounds,
+    labels=False)`` to each row of ``data``, except that rows containing only
+    NaNs produce NaN instead of raising.
+
+    Parameters
+    ----------
+    data : np.ndarray[float64, ndim=2]
+        The data to bin.  NaNs are ignored when computing bin edges.
+    nbins_or_partition_bounds : int or array-like[float64]
+        The number of equally-sized bins into which to split each row, or the
+        fractions in [0.0, 1.0] at which bin edges should be placed.
+
+    Returns
+    -------
+    labels : np.ndarray[float64, ndim=2]
+        The index of the bin into which each value falls, or NaN for NaN
+        input values.
+
+    Raises
+    ------
+    ValueError
+        If two bin edges of a row are equal, as ``pandas.qcut`` does.
+    """
+    data = asarray(data, dtype=float64)
+    if isinstance(nbins_or_partition_bounds, Integral):
+        bounds = linspace(0, 1, nbins_or_partition_bounds + 1)
+    else:
+        bounds = asarray(nbins_or_partition_bounds, dtype=float64)
+
+    edges = rowwise_order_statistics(data, bounds)
+
+    has_values = ~isnan(edges[:, 0])
+    duplicates = (diff(edges, axis=1) == 0).any(axis=1) & has_values
+    if duplicates.any():
+        raise ValueError(
+            "Bin edges must be unique: %r" % edges[duplicates.argmax()]
+        )
+
+    # Bins are closed on the right, except for the first bin, which also
+    # includes the first edge.  The label of each value is therefore the
+    # number of edges strictly below it, less one, with the minimum mapped
+    # into the first bin.
+    labels = zeros(data.shape, dtype=float64)
+    for idx in range(1, edges.shape[1] - 1):
+        labels += data > edges[:, idx, newaxis]
+
+    nan_locs = isnan(data) | (data < edges[:, :1]) | (data > edges[:, -1:])
+    return where(nan_locs, nan, labels)
+
+
+def rowwise_percentile_mask(data, mask, min_percentile, max_percentile):
+    """
+    Compute a mask of the values in each row of ``data`` falling between
+    percentiles of the row.
+
+    Entries where ``mask`` is False, or ``data`` is NaN, are excluded from
+    the percentile computations, and never pass.
+
+    Parameters
+    ----------
+    data : np.ndarray[ndim=2]
+        The data to filter.
+    mask : np.ndarray[bool, ndim=2]
+        Mask of entries to consider.
+    min_percentile, max_percentile : float
+        The inclusive percentile bounds, between 0.0 and 100.0.
+
+    Returns
+    -------
+    passes : np.ndarray[bool, ndim=2]
+        Whether each value falls between the percentile bounds of its row.
     """
-    return apply_along_axis(
-        qcut,
-        1,
+    data = where(mask, data, nan)
+    bounds = rowwise_order_statistics(
         data,
-        q=nbins_or_partition_bounds, labels=False,
+        [min_percentile / 100.0, max_percentile / 100.0],
     )
+    # Comparisons with NaN are False, so NaN values and rows never pass.
+    return (bounds[:, :1] <= data) & (data <= bounds[:, 1:])
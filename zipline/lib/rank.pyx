@@ -14,7 +14,15 @@ from numpy cimport (
     PyArray_DIMS,
     PyArray_EMPTY,
 )
-from numpy import apply_along_axis, float64, isnan, nan
+from numpy import (
+    apply_along_axis,
+    float64,
+    isnan,
+    nan,
+    negative,
+    partition,
+    zeros,
+)
 from scipy.stats import rankdata
 
 from zipline.utils.numpy_utils import (
@@ -80,6 +88,60 @@ def masked_rankdata_2d(ndarray data,
     return result
 
 
+def masked_rank_le_2d(ndarray data,
+                      ndarray mask,
+                      object missing_value,
+                      Py_ssize_t n,
+                      bool ascending):
+    """
+    Compute a mask of the entries of each row of ``data`` whose ordinal rank
+    is at most ``n``.
+
+    Equivalent to::
+
+        ranks = masked_rankdata_2d(
+            data, mask, missing_value, 'ordinal', ascending,
+        )
+        ranks <= n
+
+    but selects the ``n`` smallest (or largest) entries of each row with a
+    partial sort, rather than sorting every row.
+    """
+    cdef str dtype_name = data.dtype.name
+    if dtype_name not in ('float64', 'int64', 'datetime64[ns]'):
+        raise TypeError(
+            "Can't compute rankdata on array of dtype %r." % dtype_name
+        )
+
+    cdef ndarray missing_locations = (~mask | ismissing(data, missing_value))
+
+    if n <= 0:
+        return zeros((data.shape[0], data.shape[1]), dtype=bool)
+    if n >= data.shape[1]:
+        return ~missing_locations
+
+    # Interpret the bytes of integral data as floats for sorting, exactly as
+    # in masked_rankdata_2d.
+    data = data.copy().view(float64)
+    data[missing_locations] = nan
+    if not ascending:
+        negative(data, out=data)
+
+    # The nth smallest value of each row.  NaNs are partitioned to the end of
+    # each row, so this is NaN for rows with fewer than n non-missing values.
+    kth = partition(data, n - 1, axis=1)[:, n - 1:n]
+
+    result = data < kth
+    # Ordinal ranks break ties by position, so values equal to the nth
+    # smallest value pass from left to right until n values have passed.
+    ties = data == kth
+    result |= ties & (
+        ties.cumsum(axis=1) <= n - result.sum(axis=1, keepdims=True)
+    )
+    result |= isnan(kth) & ~missing_locations
+    return result
+
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.embedsignature(True)
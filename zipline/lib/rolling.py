@@ -0,0 +1,182 @@
+"""
+Rolling-window reductions over consecutive trailing windows.
+
+``CustomTermMixin`` passes ``compute_batch`` the trailing windows for
+consecutive dates, so each window is the previous window advanced by one row.
+The functions in this module use that overlap to update each reduction in
+constant time per window, rather than reducing every window from scratch.
+"""
+from numpy import (
+    arange,
+    concatenate,
+    cumsum,
+    empty,
+    errstate,
+    float64,
+    isfinite,
+    isnan,
+    nansum,
+    where,
+)
+from numpy.lib.stride_tricks import as_strided
+
+
+def window_rows(windows):
+    """
+    Recover the rows spanned by an array of consecutive trailing windows.
+
+    Parameters
+    ----------
+    windows : np.ndarray[ndim=3]
+        Array of shape ``(nwindows, window_length, ncols)`` such that each
+        window is the previous window advanced by one row.
+
+    Returns
+    -------
+    rows : np.ndarray[ndim=2]
+        Array of shape ``(nwindows + window_length - 1, ncols)`` such that
+        ``windows[i]`` is ``rows[i:i + window_length]``.
+    """
+    return concatenate([windows[0], windows[1:, -1]])
+
+
+def rolling_windows(rows, window_length):
+    """
+    Build a read-only view of each trailing window of ``window_length`` rows
+    of ``rows``.
+
+    This is the inverse of ``window_rows``.
+    """
+    nrows, ncols = rows.shape
+    row_stride, col_stride = rows.strides
+    out = as_strided(
+        rows,
+        shape=(nrows - window_length + 1, window_length, ncols),
+        strides=(row_stride, row_stride, col_stride),
+    )
+    out.setflags(write=False)
+    return out
+
+
+def rolling_sum(rows, window_length):
+    """
+    Compute the sum of each trailing window of ``window_length`` rows of
+    ``rows``.
+
+    Each sum is the difference of two running totals, so ``rows`` must not
+    contain NaNs or infinities.
+
+    Returns
+    -------
+    sums : np.ndarray[float64, ndim=2]
+        Array of shape ``(len(rows) - window_length + 1, ncols)``.
+
+    Example
+    -------
+    >>> import numpy as np
+    >>> rolling_sum(np.arange(10.).reshape(5, 2), 3)
+    array([[  6.,   9.],
+           [ 12.,  15.],
+           [ 18.,  21.]])
+    """
+    totals = empty((len(rows) + 1,) + rows.shape[1:], dtype=float64)
+    totals[0] = 0.0
+    cumsum(rows, axis=0, out=totals[1:])
+    return totals[window_length:] - totals[:-window_length]
+
+
+def rolling_nansum(rows, window_length):
+    """
+    Compute the sum and the count of the non-NaN values in each trailing
+    window of ``window_length`` rows of ``rows``.
+
+    Equivalent to::
+
+        windows = rolling_windows(rows, window_length)
+        nansum(windows, axis=1), (~isnan(windows)).sum(axis=1)
+
+    up to rounding.
+
+    Returns
+    -------
+    sums : np.ndarray[float64, ndim=2]
+    counts : np.ndarray[float64, ndim=2]
+    """
+    nans = isnan(rows)
+    counts = rolling_sum(~nans, window_length)
+
+    finite = isfinite(rows)
+    sums = rolling_sum(where(finite, rows, 0.0), window_length)
+    if not (finite | nans).all():
+        # Infinities never cancel out of a running total, so they're left out
+        # of it, and the windows containing them are summed directly.
+        bad = rolling_sum(~(finite | nans), window_length) > 0
+        bad_windows = rolling_windows(rows, window_length).transpose(0, 2, 1)
+        sums[bad] = nansum(bad_windows[bad], axis=1)
+
+    return sums, counts
+
+
+def rolling_nanmean(rows, window_length):
+    """
+    Compute the mean of the non-NaN values in each trailing window of
+    ``window_length`` rows of ``rows``.
+
+    Windows containing only NaNs produce NaN.
+    """
+    sums, counts = rolling_nansum(rows, window_length)
+    with errstate(invalid='ignore'):
+        return sums / counts
+
+
+def rolling_exponential_sum(rows, window_length, decay_rate):
+    """
+    Compute an exponentially-weighted sum of each trailing window of
+    ``window_length`` rows of ``rows``.
+
+    The newest row of each window has a weight of 1.0, and each older row has
+    ``decay_rate`` times the weight of the row after it.  Each sum is derived
+    from the sum for the previous window, so ``rows`` must not contain NaNs or
+    infinities.
+
+    Returns
+    -------
+    sums : np.ndarray[float64, ndim=2]
+        Array of shape ``(len(rows) - window_length + 1, ncols)``.
+
+    Example
+    -------
+    >>> import numpy as np
+    >>> rolling_exponential_sum(np.array([[1.], [2.], [3.], [4.]]), 2, 0.5)
+    array([[ 2.5],
+           [ 4. ],
+           [ 5.5]])
+    """
+    nwindows = len(rows) - window_length + 1
+    out = empty((nwindows,) + rows.shape[1:], dtype=float64)
+    weights = decay_rate ** arange(window_length - 1, -1, -1, dtype=float64)
+    out[0] = weights.dot(rows[:window_length])
+
+    # Sliding forward by one row decays every weight, drops the oldest row,
+    # and adds the new row with a weight of 1.0.
+    oldest_weight = decay_rate ** window_length
+    for i in range(1, nwindows):
+        out[i] = (
+            decay_rate * out[i - 1] -
+            oldest_weight * rows[i - 1] +
+            rows[i + window_length - 1]
+        )
+    return out
+
+
+def rolling_exponential_average(rows, window_length, decay_rate):
+    """
+    Compute an exponentially-weighted average of each trailing window of
+    ``window_length`` rows of ``rows``.
+
+    Weights are as in ``rolling_exponential_sum``, which see.
+    """
+    total_weight = (decay_rate ** arange(window_length, dtype=float64)).sum()
+    out = rolling_exponential_sum(rows, window_length, decay_rate)
+    out /= total_weight
+    return out
@@ -0,0 +1,423 @@
+"""
+On-disk cache of computed Pipeline term results.
+
+Repeated research sessions and parameter sweeps often compute identical terms
+over identical dates and assets.  A ``TermResultCache`` stores the result of
+each computed term in a file named by a hash of everything the result depends
+on:
+
+- The term's fingerprint, which covers its type (including the code of its
+  methods and the values of its other class attributes), its parameters,
+  and, recursively, the fingerprints of its inputs and mask.  The token of a
+  function covers its code, its default arguments, the values in its closure,
+  and the globals it refers to, including the code of global functions.
+- The dates and assets being computed, and the values of the root mask.
+- A data version token from the loader of every column the term depends on.
+
+Results are stored as ``.npy`` files and loaded as memory maps, so hits are
+cheap even for large arrays.
+
+Classes and modules referred to by a term's code are only identified by name,
+objects without a stable representation by their type, and unhashable class
+attributes are ignored.  Terms whose results depend on such things, or on
+files they read, can add a class attribute like ``cache_version = 2`` and
+change it whenever their results change.
+"""
+from hashlib import sha1
+import os
+from types import FunctionType, ModuleType
+
+from numpy import ascontiguousarray, dtype as dtype_class, load, ndarray, save
+from pandas import DataFrame, Index, Series
+from six.moves._thread import allocate_lock as Lock
+
+# Version of the cache's key and file layout.  Bump this whenever either
+# changes, so that stale entries are never read.
+CACHE_VERSION = 2
+
+DEFAULT_MAX_BYTES = 2 ** 32
+
+
+class Uncacheable(Exception):
+    """
+    Raised when a term can't be fingerprinted.
+    """
+
+
+def _code_token(code):
+    """
+    A string identifying the behavior of a code object.
+    """
+    consts = []
+    for const in code.co_consts:
+        if hasattr(const, 'co_code'):
+            consts.append(_code_token(const))
+        elif isinstance(const, frozenset):
+            # Set iteration order can vary between sessions.
+            consts.append(repr(sorted(const, key=repr)))
+        else:
+            consts.append(repr(const))
+    return '%s|%s|%s' % (
+        sha1(code.co_code).hexdigest(),
+        ','.join(consts),
+        ','.join(code.co_names),
+    )
+
+
+def _global_names(code):
+    """
+    The names that ``code``, or any code object nested in it, may look up as
+    globals.
+    """
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if hasattr(const, 'co_code'):
+            names |= _global_names(const)
+    return names
+
+
+def _qualified_name(obj):
+    return '%s.%s' % (
+        getattr(obj, '__module__', None),
+        getattr(obj, '__name__', type(obj).__name__),
+    )
+
+
+def _function_token(func, memo):
+    """
+    A string identifying the behavior of a function: its code, its default
+    arguments, the values in its closure, and the globals it refers to.
+    """
+    key = ('function', func)
+    try:
+        return memo[key]
+    except KeyError:
+        pass
+    # Recursive functions refer to themselves by name.
+    memo[key] = name = _qualified_name(func)
+
+    try:
+        globals_ = func.__globals__
+        referenced = [
+            '%s=%s' % (
+                global_name,
+                _reference_token(globals_[global_name], memo),
+            )
+            for global_name in sorted(_global_names(func.__code__))
+            if global_name in globals_
+        ]
+        cells = [
+            _reference_token(cell.cell_contents, memo)
+            for cell in func.__closure__ or ()
+        ]
+        token = '%s:%s|%s|%s|%s|%s' % (
+            name,
+            _code_token(func.__code__),
+            _token(func.__defaults__ or (), memo),
+            _token(getattr(func, '__kwdefaults__', None) or {}, memo),
+            ','.join(cells),
+            ','.join(referenced),
+        )
+    except BaseException:
+        del memo[key]
+        raise
+    memo[key] = token
+    return token
+
+
+def _reference_token(obj, memo):
+    """
+    A string identifying a global or closure value referred to by a function.
+
+    Functions are identified by their tokens, and modules, classes and other
+    callables by their names.  Anything else is identified by its value, or
+    by its type if it has no stable representation, like a logger or a lock.
+    """
+    from .term import Term
+
+    if isinstance(obj, FunctionType):
+        return _function_token(obj, memo)
+    if isinstance(obj, ModuleType):
+        return 'module:%s' % obj.__name__
+    if isinstance(obj, type) or (callable(obj) and
+                                 not isinstance(obj, Term)):
+        return _qualified_name(obj)
+    try:
+        return _token(obj, memo)
+    except Uncacheable:
+        return 'object:%s' % _qualified_name(type(obj))
+
+
+def _type_token(type_, memo):
+    """
+    A string identifying a type, the functions it defines or inherits, and the
+    values of its other attributes.
+    """
+    parts = []
+    for klass in type_.__mro__:
+        if klass is object:
+            continue
+        parts.append('%s.%s' % (klass.__module__, klass.__name__))
+        for name, value in sorted(vars(klass).items()):
+            if name.startswith('__') or name in _IGNORED_CLASS_ATTRIBUTES:
+                continue
+            value = getattr(value, '__func__', value)
+            if isinstance(value, property):
+                value = (value.fget, value.fset, value.fdel)
+            if isinstance(value, FunctionType):
+                parts.append('%s=%s' % (name, _function_token(value, memo)))
+                continue
+            try:
+                hash(value)
+            except TypeError:
+                # Unhashable attributes, like caches, are ignored.
+                continue
+            parts.append('%s=%s' % (name, _reference_token(value, memo)))
+    return '{%s}' % ';'.join(parts)
+
+
+# Class attributes of terms holding caches and bookkeeping, which don't affect
+# computed values.
+_IGNORED_CLASS_ATTRIBUTES = frozenset(['_term_cache'])
+
+
+def _data_token(obj):
+    """
+    A string identifying the contents of an array or a pandas object.
+    """
+    if isinstance(obj, ndarray):
+        return 'array:' + array_token(obj)
+    if isinstance(obj, Index):
+        return 'index:' + array_token(obj.values)
+    if isinstance(obj, Series):
+        return 'series:%s|%s' % (
+            array_token(obj.values),
+            _data_token(obj.index),
+        )
+    return 'frame:%s|%s|%s' % (
+        array_token(obj.values),
+        _data_token(obj.index),
+        _data_token(obj.columns),
+    )
+
+
+def _token(obj, memo):
+    from .term import Term
+
+    if isinstance(obj, Term):
+        return term_fingerprint(obj, memo)
+    if isinstance(obj, type):
+        return _type_token(obj, memo)
+    if isinstance(obj, FunctionType):
+        return _function_token(obj, memo)
+    if isinstance(obj, (ndarray, Index, Series, DataFrame)):
+        # Reprs of large arrays and frames are truncated.
+        return _data_token(obj)
+    if isinstance(obj, (tuple, list)):
+        return '(%s)' % ','.join(_token(item, memo) for item in obj)
+    if isinstance(obj, dict):
+        return '{%s}' % ','.join(
+            '%s:%s' % (_token(k, memo), _token(v, memo))
+            for k, v in sorted(obj.items())
+        )
+    if isinstance(obj, dtype_class):
+        return obj.str
+
+    token = repr(obj)
+    if ' at 0x' in token:
+        # Default reprs contain addresses, which could be reused by an
+        # unrelated object in another session.
+        raise Uncacheable(token)
+    return token
+
+
+def term_fingerprint(term, memo=None):
+    """
+    Compute a hash identifying ``term`` that is stable across sessions.
+
+    Parameters
+    ----------
+    term : zipline.pipeline.term.Term
+        The term to fingerprint.
+    memo : dict, optional
+        Map from term to already-computed fingerprints.
+
+    Returns
+    -------
+    fingerprint : str
+        A hex digest.
+
+    Raises
+    ------
+    Uncacheable
+        If the identity of ``term`` contains an object without a stable
+        representation.
+    """
+    if memo is None:
+        memo = {}
+    try:
+        return memo[term]
+    except KeyError:
+        pass
+
+    token = _token(term._identity, memo)
+    fingerprint = memo[term] = sha1(token.encode('utf-8')).hexdigest()
+    return fingerprint
+
+
+def array_token(*arrays):
+    """
+    Hash the contents of ``arrays``.
+    """
+    digest = sha1()
+    for array in arrays:
+        array = ascontiguousarray(array)
+        digest.update(array.dtype.str.encode('utf-8'))
+        digest.update(repr(array.shape).encode('utf-8'))
+        digest.update(array.tobytes())
+    return digest.hexdigest()
+
+
+class TermResultCache(object):
+    """
+    A size-limited directory of computed Pipeline term results.
+
+    Parameters
+    ----------
+    path : str, optional
+        Directory in which to store results.  Defaults to ``pipeline_cache``
+        in the zipline data root.
+    max_bytes : int, optional
+        Limit on the total size of stored results.  When a write exceeds it,
+        the least recently used results are deleted.
+
+    See Also
+    --------
+    zipline.pipeline.engine.SimplePipelineEngine
+    """
+    def __init__(self, path=None, max_bytes=DEFAULT_MAX_BYTES):
+        if path is None:
+            from zipline.data.paths import data_root
+            path = os.path.join(data_root(), 'pipeline_cache')
+        self.path = path
+        self.max_bytes = max_bytes
+        self._eviction_lock = Lock()
+
+    @staticmethod
+    def key(fingerprint, chunk_token, data_versions):
+        """
+        Build the key for a term's result.
+
+        Parameters
+        ----------
+        fingerprint : str
+            The term's fingerprint.
+        chunk_token : str
+            Token identifying the rows, columns and root mask being computed.
+        data_versions : iterable[str]
+            Data versions of the loaders the term depends on.
+        """
+        parts = [str(CACHE_VERSION), fingerprint, chunk_token]
+        parts.extend(sorted(data_versions))
+        return sha1('|'.join(parts).encode('utf-8')).hexdigest()
+
+    def _file(self, key):
+        return os.path.join(self.path, key + '.npy')
+
+    def get(self, key):
+        """
+        Load the result stored under ``key``.
+
+        Returns
+        -------
+        result : np.ndarray or None
+            A copy-on-write memory map of the stored result, or None if there
+            is no such result.
+        """
+        path = self._file(key)
+        try:
+            result = load(path, mmap_mode='c')
+            # Mark the entry as recently used.
+            os.utime(path, None)
+        except (IOError, OSError, ValueError):
+            return None
+        return result
+
+    def put(self, key, result):
+        """
+        Store ``result`` under ``key``, then evict old results if we're over
+        our size limit.
+
+        Failures to write are never fatal.
+        """
+        if not isinstance(result, ndarray) or result.dtype.hasobject:
+            return
+
+        path = self._file(key)
+        # Write to a temporary file and rename so that concurrent readers never
+        # observe a partially written result.
+        tmp_path = '%s.%d.%d.tmp' % (path, os.getpid(), id(result))
+        try:
+            if not os.path.exists(self.path):
+                os.makedirs(self.path)
+            with open(tmp_path, 'wb') as f:
+                save(f, result)
+            os.rename(tmp_path, path)
+        except (IOError, OSError):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+
+        self._evict()
+
+    def _entries(self):
+        """
+        List the (mtime, size, path) of each stored result.
+        """
+        entries = []
+        if not os.path.exists(self.path):
+            return entries
+        for name in os.listdir(self.path):
+            if not name.endswith('.npy'):
+                continue
+            path = os.path.join(self.path, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                # Deleted concurrently.
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    @property
+    def nbytes(self):
+        """
+        The total size of the stored results.
+        """
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self):
+        with self._eviction_lock:
+            entries = sorted(self._entries())
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                total -= size
+
+    def clear(self):
+        """
+        Delete every stored result.
+        """
+        with self._eviction_lock:
+            for _, _, path in self._entries():
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
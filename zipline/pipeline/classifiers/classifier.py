@@ -95,6 +95,7 @@ class Everything(Classifier):
     window_length = 0
     inputs = ()
     missing_value = -1
+    columnwise = True
 
     def _compute(self, arrays, dates, assets, mask):
         return where(
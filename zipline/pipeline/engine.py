@@ -5,14 +5,25 @@ from abc import (
     ABCMeta,
     abstractmethod,
 )
+from collections import defaultdict, namedtuple
+from functools import partial
+from multiprocessing import Pool
+from multiprocessing.pool import ThreadPool
+import sys
 from uuid import uuid4
 
 from six import (
     iteritems,
+    itervalues,
+    reraise,
     with_metaclass,
 )
-from numpy import array
+from six.moves import zip
+from six.moves._thread import allocate_lock as Lock
+from six.moves.queue import Queue
+from numpy import array, concatenate, flatnonzero, full, zeros
 from pandas import (
+    concat,
     DataFrame,
     date_range,
     MultiIndex,
@@ -25,9 +36,218 @@ from zipline.errors import NoFurtherDataError
 from zipline.utils.numpy_utils import repeat_first_axis, repeat_last_axis
 from zipline.utils.pandas_utils import explode
 
+from .cache import array_token, term_fingerprint, Uncacheable
+from .graph import TermGraph
+from .incremental import IncrementalPipeline
+from .precision import compact_results, restore_input
 from .term import AssetExists, LoadableTerm
 
 
+OUTPUT_FORMATS = frozenset(['frame', 'dense', 'columnar'])
+
+
+class DensePipelineResult(namedtuple('DensePipelineResult',
+                                     'dates sids mask columns')):
+    """
+    Pipeline results as 2D arrays with a row per date and a column per asset.
+
+    Attributes
+    ----------
+    dates : pd.DatetimeIndex
+        Row labels for `mask` and `columns`.
+    sids : pd.Int64Index
+        Column labels for `mask` and `columns`.
+    mask : np.ndarray[bool, ndim=2]
+        Whether each asset passed the pipeline's screen on each date.
+    columns : dict[str -> np.ndarray[ndim=2]]
+        Map from column name to computed values.  Values where `mask` is
+        False are unspecified.
+    """
+    __slots__ = ()
+
+
+class ColumnarPipelineResult(namedtuple('ColumnarPipelineResult',
+                                        'dates sids columns')):
+    """
+    Pipeline results as 1D arrays with an entry per (date, asset) pair that
+    passed the pipeline's screen, sorted by date and then by sid.
+
+    This holds the same values as the frame returned by ``run_pipeline``
+    without building an index of Asset objects.
+
+    Attributes
+    ----------
+    dates : np.ndarray[datetime64[ns]]
+        The UTC date of each entry.
+    sids : np.ndarray[int64]
+        The sid of each entry.
+    columns : dict[str -> np.ndarray[ndim=1]]
+        Map from column name to computed values.
+    """
+    __slots__ = ()
+
+
+# Engines and graphs being computed by ``run_chunked_pipeline``, keyed by a
+# unique token.  Worker processes are forked after an entry is added, so they
+# inherit the engine and its loaders instead of receiving pickled copies.
+_chunked_pipeline_state = {}
+
+
+def _nbytes(value):
+    """
+    The number of bytes in a workspace entry.
+    """
+    return ensure_ndarray(value).nbytes
+
+
+def _storage_versions(token, term, storage):
+    """
+    The versions to add to those of `term` if it's stored at reduced
+    precision, where `token` identifies `term`.
+    """
+    dtype = storage.get(term)
+    if dtype is None:
+        return frozenset()
+    return frozenset(['storage:%s:%s' % (token, dtype.str)])
+
+
+def _needed_terms(graph, workspace, targets=None):
+    """
+    Find the terms that must be in the workspace to compute `targets`, given
+    the terms already in `workspace`.  `targets` defaults to the outputs of
+    `graph`.
+    """
+    if targets is None:
+        targets = itervalues(graph.outputs)
+    needed = set()
+    stack = list(targets)
+    while stack:
+        term = stack.pop()
+        if term in needed:
+            continue
+        needed.add(term)
+        if term not in workspace:
+            stack.extend(graph.predecessors(term))
+    return needed
+
+
+def _full_width_terms(graph, screens):
+    """
+    Find the terms in `graph` that must be computed over every asset, even
+    when only the assets passing one of `screens` are of interest: the
+    screens themselves, every term that isn't ``columnwise``, and everything
+    they depend on.
+    """
+    full_width = set()
+    stack = list(screens)
+    stack.extend(term for term in graph if not term.columnwise)
+    while stack:
+        term = stack.pop()
+        if term in full_width:
+            continue
+        full_width.add(term)
+        stack.extend(graph.predecessors(term))
+    return full_width
+
+
+class _WorkspaceRefcounts(object):
+    """
+    Evicts entries from a pipeline workspace as soon as every term depending
+    on them has been computed, unless they're outputs of the graph, and tracks
+    the total size of the workspace.
+
+    Parameters
+    ----------
+    graph : zipline.pipeline.graph.TermGraph
+        The graph being computed.
+    workspace : dict
+        Map from term -> output, which is mutated in place.
+    needed : set[Term], optional
+        The terms that will be in the workspace at some point, as computed by
+        ``_needed_terms``.  Defaults to every term in `graph`.
+    retained : set[Term], optional
+        The terms that are never evicted.  Defaults to the outputs of `graph`.
+
+    Attributes
+    ----------
+    nbytes : int
+        The current total size in bytes of the arrays in the workspace.
+        Arrays sharing memory are counted separately.
+    peak_nbytes : int
+        The largest value of ``nbytes`` seen so far.
+    """
+    def __init__(self, graph, workspace, needed=None, retained=None):
+        if needed is None:
+            needed = set(graph)
+        if retained is None:
+            retained = set(itervalues(graph.outputs))
+        self._graph = graph
+        self._workspace = workspace
+        self._retained = retained
+        # Terms that still need to be computed.
+        self._pending = pending = {
+            term for term in needed if term not in workspace
+        }
+        self._consumers = {
+            term: sum(1 for s in graph.successors(term) if s in pending)
+            for term in graph
+        }
+        self._nbytes = {
+            term: _nbytes(value) for term, value in iteritems(workspace)
+        }
+        self.nbytes = self.peak_nbytes = sum(itervalues(self._nbytes))
+
+        for term in list(workspace):
+            self._evict_if_unused(term)
+
+    def _evict_if_unused(self, term):
+        if self._consumers.get(term) or term in self._retained:
+            return
+        del self._workspace[term]
+        self.nbytes -= self._nbytes.pop(term)
+
+    def store(self, job, results):
+        """
+        Store the results of computing the terms in `job`, then evict any of
+        their dependencies that are no longer needed.
+        """
+        sizes = self._nbytes
+        for term, value in iteritems(results):
+            self.nbytes += _nbytes(value) - sizes.get(term, 0)
+            sizes[term] = _nbytes(value)
+        self._workspace.update(results)
+        self.peak_nbytes = max(self.peak_nbytes, self.nbytes)
+
+        # Loaders may produce terms that nothing needs, along with those that
+        # are needed.
+        for term in results:
+            self._evict_if_unused(term)
+
+        consumers = self._consumers
+        for term in job:
+            if term not in self._pending:
+                continue
+            self._pending.remove(term)
+            for dependency in self._graph.predecessors(term):
+                consumers[dependency] -= 1
+                self._evict_if_unused(dependency)
+
+
+def _compute_shard(args):
+    """
+    Compute one shard of a chunked pipeline in a worker process.
+    """
+    token, dates, assets, root_mask_values = args
+    engine, graph, screen_name = _chunked_pipeline_state[token]
+    return engine._compute_screened_chunk(
+        graph,
+        [screen_name],
+        dates,
+        assets,
+        root_mask_values,
+    )
+
+
 class PipelineEngine(with_metaclass(ABCMeta)):
 
     @abstractmethod
@@ -62,6 +282,62 @@ class PipelineEngine(with_metaclass(ABCMeta)):
         """
         raise NotImplementedError("run_pipeline")
 
+    def run_pipelines(self, pipelines, start_date, end_date):
+        """
+        Compute values for each of `pipelines` between `start_date` and
+        `end_date`.
+
+        The default implementation runs each pipeline separately.
+
+        Parameters
+        ----------
+        pipelines : dict[str -> zipline.pipeline.Pipeline]
+            The pipelines to run, by name.
+        start_date : pd.Timestamp
+            Start date of the computed matrices.
+        end_date : pd.Timestamp
+            End date of the computed matrices.
+
+        Returns
+        -------
+        results : dict[str -> pd.DataFrame]
+            Map from the name of each pipeline to the frame returned by
+            ``run_pipeline`` for it.
+        """
+        return {
+            name: self.run_pipeline(pipeline, start_date, end_date)
+            for name, pipeline in iteritems(pipelines)
+        }
+
+    @abstractmethod
+    def incremental_pipeline(self,
+                             pipeline,
+                             start_date,
+                             end_date,
+                             chunksize=126):
+        """
+        Prepare to compute `pipeline` one date at a time, for each date
+        between `start_date` and `end_date`.
+
+        Parameters
+        ----------
+        pipeline : zipline.pipeline.Pipeline
+            The pipeline to run.
+        start_date : pd.Timestamp
+            The first date to compute.
+        end_date : pd.Timestamp
+            The last date to compute.
+        chunksize : int, optional
+            The number of dates of raw data to load at once.
+
+        Returns
+        -------
+        incremental : object
+            An object whose ``compute(date)`` method returns a frame of the
+            results for `date`, in the format returned by ``run_pipeline``.
+        """
+        raise NotImplementedError("incremental_pipeline")
+
 
 class NoOpPipelineEngine(PipelineEngine):
     """
@@ -75,6 +351,25 @@ class NoOpPipelineEngine(PipelineEngine):
             columns=sorted(pipeline.columns.keys()),
         )
 
+    def incremental_pipeline(self,
+                             pipeline,
+                             start_date,
+                             end_date,
+                             chunksize=126):
+        return _NoOpIncrementalPipeline(self, pipeline)
+
+
+class _NoOpIncrementalPipeline(object):
+    """
+    Incremental pipeline for a NoOpPipelineEngine, producing empty frames.
+    """
+    def __init__(self, engine, pipeline):
+        self._engine = engine
+        self._pipeline = pipeline
+
+    def compute(self, date):
+        return self._engine.run_pipeline(self._pipeline, date, date)
+
 
 class SimplePipelineEngine(object):
     """
@@ -91,22 +386,91 @@ class SimplePipelineEngine(object):
     asset_finder : zipline.assets.AssetFinder
         An AssetFinder instance.  We depend on the AssetFinder to determine
         which assets are in the top-level universe at any point in time.
+    num_threads : int, optional
+        Number of threads to use when computing terms.  If greater than 1,
+        each term is computed on a thread pool as soon as all of its inputs
+        are available, so that independent terms are computed concurrently.
+        The default of 1 computes terms serially in a deterministic order,
+        which is easier to debug.
+    term_cache : zipline.pipeline.cache.TermResultCache, optional
+        A cache in which to store the results of computed terms, and from
+        which to load them when the same terms are computed again over the
+        same dates and assets.  By default, nothing is cached.
+    screen_pushdown : bool, optional
+        Whether ``run_pipeline`` should compute the screen first and skip
+        assets that never pass it when computing the pipeline's other
+        columns.  Terms that look across assets, like ranks and z-scores, are
+        always computed over every asset, so this doesn't change results.
+        Default is True.
+    profiler : zipline.pipeline.profiler.PipelineProfiler, optional
+        A profiler with which to record the time spent and memory allocated
+        by each term computed and each loader call made by this engine.  By
+        default, nothing is recorded.
+    precision : zipline.pipeline.precision.PrecisionPolicy, optional
+        A policy for storing term results at reduced precision, such as
+        float64 factors as float32, which shrinks the memory used to compute
+        a pipeline.  Pipeline outputs are returned at the stored dtypes.  By
+        default, every term is stored at its declared dtype.
     """
     __slots__ = (
         '_get_loader',
         '_calendar',
         '_finder',
         '_root_mask_term',
+        '_num_threads',
+        '_peak_workspace_nbytes',
+        '_term_cache',
+        '_screen_pushdown',
+        '_profiler',
+        '_precision',
         '__weakref__',
     )
 
-    def __init__(self, get_loader, calendar, asset_finder):
+    def __init__(self,
+                 get_loader,
+                 calendar,
+                 asset_finder,
+                 num_threads=1,
+                 term_cache=None,
+                 screen_pushdown=True,
+                 profiler=None,
+                 precision=None):
+        if num_threads < 1:
+            raise ValueError(
+                "num_threads must be at least 1, got %d." % num_threads
+            )
         self._get_loader = get_loader
         self._calendar = calendar
         self._finder = asset_finder
         self._root_mask_term = AssetExists()
+        self._num_threads = num_threads
+        self._peak_workspace_nbytes = None
+        self._term_cache = term_cache
+        self._screen_pushdown = screen_pushdown
+        self._profiler = profiler
+        self._precision = precision
 
-    def run_pipeline(self, pipeline, start_date, end_date):
+    @property
+    def profiler(self):
+        """
+        The PipelineProfiler recording the jobs run by this engine, or None.
+        """
+        return self._profiler
+
+    @property
+    def peak_workspace_nbytes(self):
+        """
+        The largest total size in bytes of the arrays held in the workspace
+        during the most recently computed chunk, or None if no chunk has been
+        computed.
+
+        Intermediate results are evicted from the workspace as soon as all
+        the terms depending on them have been computed, so this is usually
+        much smaller than the total size of every term in the graph.
+        """
+        return self._peak_workspace_nbytes
+
+    def run_pipeline(self, pipeline, start_date, end_date, output='frame'):
         """
         Compute a pipeline.
 
@@ -118,6 +482,13 @@ class SimplePipelineEngine(object):
             Start date of the computed matrix.
         end_date : pd.Timestamp
             End date of the computed matrix.
+        output : {'frame', 'dense', 'columnar'}, optional
+            The format of the result.  'frame', the default, returns a
+            DataFrame indexed by (date, Asset) pairs.  'dense' returns a
+            ``DensePipelineResult`` and 'columnar' returns a
+            ``ColumnarPipelineResult``, neither of which needs to look up
+            Asset objects or build a MultiIndex, which makes them much cheaper
+            to build for large results.
 
         The algorithm implemented here can be broken down into the following
         stages:
@@ -132,7 +503,9 @@ class SimplePipelineEngine(object):
 
         2. Compute each term in the dependency order determined in (0), caching
            the results in a a dictionary to that they can be fed into future
-           terms.
+           terms.  If `pipeline` has a screen, terms that don't look across
+           assets are only computed for assets that pass the screen on at
+           least one date.
 
         3. For each date, determine the number of assets passing
            pipeline.screen.  The sum, N, of all these values is the total
@@ -146,41 +519,315 @@ class SimplePipelineEngine(object):
 
         Step 0 is performed by ``Pipeline.to_graph``.
         Step 1 is performed in ``SimplePipelineEngine._compute_root_mask``.
-        Step 2 is performed in ``SimplePipelineEngine.compute_chunk``.
-        Steps 3, 4, and 5 are performed in ``SimplePiplineEngine._to_narrow``.
+        Step 2 is performed in ``SimplePipelineEngine.compute_chunk``, or in
+        ``SimplePipelineEngine._compute_screened_chunk`` for screened
+        pipelines.
+        Steps 3, 4, and 5 are performed in ``SimplePiplineEngine._to_narrow``,
+        and are skipped for dense results.
 
         See Also
         --------
         PipelineEngine.run_pipeline
         """
-        if end_date < start_date:
-            raise ValueError(
-                "start_date must be before or equal to end_date \n"
-                "start_date=%s, end_date=%s" % (start_date, end_date)
-            )
+        return self.run_pipelines(
+            {'pipeline': pipeline}, start_date, end_date, output,
+        )['pipeline']
+
+    def run_pipelines(self, pipelines, start_date, end_date, output='frame'):
+        """
+        Compute values for several pipelines between `start_date` and
+        `end_date`.
+
+        The pipelines are compiled into a single TermGraph, so a term used by
+        more than one of them is loaded and computed only once.  The results
+        for each pipeline are the same as those of ``run_pipeline``.
+
+        Parameters
+        ----------
+        pipelines : dict[str -> zipline.pipeline.Pipeline]
+            The pipelines to run, by name.
+        start_date : pd.Timestamp
+            Start date of the computed matrices.
+        end_date : pd.Timestamp
+            End date of the computed matrices.
+        output : {'frame', 'dense', 'columnar'}, optional
+            The format of each result.  See ``run_pipeline``.
+
+        Returns
+        -------
+        results : dict[str -> pd.DataFrame]
+            Map from the name of each pipeline to its results, in the format
+            given by `output`.
+
+        See Also
+        --------
+        SimplePipelineEngine.run_pipeline
+        """
+        self._validate_date_range(start_date, end_date)
+        self._validate_output_format(output)
 
         screen_name = uuid4().hex
-        graph = pipeline.to_graph(screen_name, self._root_mask_term)
+        graph = self._merged_graph(pipelines, screen_name)
         extra_rows = graph.extra_rows[self._root_mask_term]
         root_mask = self._compute_root_mask(start_date, end_date, extra_rows)
         dates, assets, root_mask_values = explode(root_mask)
 
-        outputs = self.compute_chunk(
+        outputs = self._compute_screened_chunk(
             graph,
+            [(name, screen_name) for name in pipelines],
             dates,
             assets,
-            initial_workspace={self._root_mask_term: root_mask_values},
+            root_mask_values,
         )
 
+        by_pipeline = {name: {} for name in pipelines}
+        for (name, column), values in iteritems(outputs):
+            by_pipeline[name][column] = values
+
         out_dates = dates[extra_rows:]
-        screen_values = outputs.pop(screen_name)
+        return {
+            name: self._format_results(
+                output,
+                columns,
+                columns.pop(screen_name),
+                out_dates,
+                assets,
+            )
+            for name, columns in iteritems(by_pipeline)
+        }
+
+    def _merged_graph(self, pipelines, screen_name):
+        """
+        Compile `pipelines` into a single TermGraph whose outputs are keyed by
+        (pipeline name, column name) pairs.  The screen of each pipeline is
+        stored under `screen_name`.
+        """
+        terms = {}
+        for name, pipeline in iteritems(pipelines):
+            for column, term in iteritems(pipeline.columns):
+                terms[name, column] = term
+            screen = pipeline.screen
+            if screen is None:
+                screen = self._root_mask_term
+            terms[name, screen_name] = screen
+        return TermGraph(terms)
+
+    def run_chunked_pipeline(self,
+                             pipeline,
+                             start_date,
+                             end_date,
+                             chunksize,
+                             processes=1,
+                             output='frame'):
+        """
+        Compute a pipeline in shards of at most `chunksize` dates.
 
-        return self._to_narrow(outputs, screen_values, out_dates, assets)
+        Each shard is computed independently with enough extra rows of
+        lookback to serve every windowed term, so the result is the same as
+        ``run_pipeline(pipeline, start_date, end_date)``, but only one
+        shard's intermediate results need to be held in memory at a time per
+        process.
+
+        Parameters
+        ----------
+        pipeline : zipline.pipeline.Pipeline
+            The pipeline to run.
+        start_date : pd.Timestamp
+            Start date of the computed matrix.
+        end_date : pd.Timestamp
+            End date of the computed matrix.
+        chunksize : int
+            The maximum number of dates in each shard.
+        processes : int, optional
+            Number of worker processes used to compute shards.  Workers are
+            forked from the calling process and share its loaders, so values
+            greater than 1 require a platform supporting ``fork``.  The
+            default of 1 computes shards serially in the calling process.
+        output : {'frame', 'dense', 'columnar'}, optional
+            The format of the result.  See ``run_pipeline``.
+
+        Returns
+        -------
+        result : pd.DataFrame, DensePipelineResult or ColumnarPipelineResult
+            The computed results, in the format given by `output`.
+
+        See Also
+        --------
+        PipelineEngine.run_pipeline
+        """
+        self._validate_date_range(start_date, end_date)
+        self._validate_output_format(output)
+        if chunksize < 1:
+            raise ValueError(
+                "chunksize must be at least 1, got %d." % chunksize
+            )
+
+        screen_name = uuid4().hex
+        graph = pipeline.to_graph(screen_name, self._root_mask_term)
+        extra_rows = graph.extra_rows[self._root_mask_term]
+
+        start_idx, end_idx = self._session_locs(start_date, end_date)
+        shard_starts = range(start_idx, end_idx, chunksize)
+
+        token = uuid4().hex
+        shards = []
+        for shard_start in shard_starts:
+            shard_end = min(shard_start + chunksize, end_idx) - 1
+            shards.append((token,) + explode(self._compute_root_mask(
+                self._calendar[shard_start],
+                self._calendar[shard_end],
+                extra_rows,
+            )))
+
+        _chunked_pipeline_state[token] = (self, graph, screen_name)
+        pool = Pool(processes) if processes > 1 else None
+        try:
+            if pool is None:
+                outputs = (_compute_shard(shard) for shard in shards)
+            else:
+                outputs = pool.imap(_compute_shard, shards)
+
+            results = []
+            for (_, dates, assets, _), shard_outputs in zip(shards, outputs):
+                screen_values = shard_outputs.pop(screen_name)
+                results.append(self._format_results(
+                    output,
+                    shard_outputs,
+                    screen_values,
+                    dates[extra_rows:],
+                    assets,
+                ))
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+            del _chunked_pipeline_state[token]
+
+        if output == 'dense':
+            return self._concat_dense(results, graph)
+        if output == 'columnar':
+            return ColumnarPipelineResult(
+                concatenate([r.dates for r in results]),
+                concatenate([r.sids for r in results]),
+                {
+                    name: concatenate([r.columns[name] for r in results])
+                    for name in results[0].columns
+                },
+            )
+        # Drop empty shards, which don't have a tz-aware date level.
+        return concat([frame for frame in results if len(frame)] or results)
+
+    def incremental_pipeline(self,
+                             pipeline,
+                             start_date,
+                             end_date,
+                             chunksize=126,
+                             output='frame'):
+        """
+        Prepare to compute a pipeline one date at a time.
+
+        Parameters
+        ----------
+        pipeline : zipline.pipeline.Pipeline
+            The pipeline to run.
+        start_date : pd.Timestamp
+            The first date to compute.
+        end_date : pd.Timestamp
+            The last date to compute.
+        chunksize : int, optional
+            The number of dates of raw data to load at once.
+        output : {'frame', 'dense', 'columnar'}, optional
+            The format of the results for each date.  See ``run_pipeline``.
+
+        Returns
+        -------
+        incremental : zipline.pipeline.incremental.IncrementalPipeline
+            An object whose ``compute`` method returns the results for each
+            date in turn.
+        """
+        return IncrementalPipeline(
+            self,
+            pipeline,
+            start_date,
+            end_date,
+            chunksize=chunksize,
+            output=output,
+        )
+
+    @staticmethod
+    def _concat_dense(results, graph):
+        """
+        Concatenate ``DensePipelineResult`` objects for consecutive shards,
+        aligning them on the union of their sids.
+        """
+        sids = results[0].sids
+        for result in results[1:]:
+            sids = sids.union(result.sids)
+
+        dates = results[0].dates
+        for result in results[1:]:
+            dates = dates.append(result.dates)
+
+        shape = len(dates), len(sids)
+        mask = full(shape, False, dtype=bool)
+        # Use the dtypes of the shards, which may be stored at reduced
+        # precision.
+        first_columns = results[0].columns
+        columns = {
+            name: full(
+                shape,
+                term.missing_value,
+                dtype=first_columns[name].dtype,
+            )
+            for name, term in iteritems(graph.outputs)
+            if name in first_columns
+        }
+
+        start = 0
+        for result in results:
+            stop = start + len(result.dates)
+            positions = sids.get_indexer(result.sids)
+            mask[start:stop, positions] = result.mask
+            for name, values in iteritems(result.columns):
+                columns[name][start:stop, positions] = values
+            start = stop
+
+        return DensePipelineResult(dates, sids, mask, columns)
+
+    @staticmethod
+    def _validate_output_format(output):
+        if output not in OUTPUT_FORMATS:
+            raise ValueError(
+                "output must be one of %s, got %r." % (
+                    sorted(OUTPUT_FORMATS), output,
+                )
+            )
+
+    def _validate_date_range(self, start_date, end_date):
+        if end_date < start_date:
+            raise ValueError(
+                "start_date must be before or equal to end_date \n"
+                "start_date=%s, end_date=%s" % (start_date, end_date)
+            )
+
+    def _session_locs(self, start_date, end_date):
+        """
+        The positions in our calendar of the first date on or after
+        `start_date`, and of the date after the last one on or before
+        `end_date`.  Raises a ValueError if there are no dates between them.
+        """
+        start_idx, end_idx = self._calendar.slice_locs(start_date, end_date)
+        if start_idx >= end_idx:
+            raise ValueError(
+                "No trading days between start_date and end_date \n"
+                "start_date=%s, end_date=%s" % (start_date, end_date)
+            )
+        return start_idx, end_idx
 
     def _compute_root_mask(self, start_date, end_date, extra_rows):
         """
-        Compute a lifetimes matrix from our AssetFinder, then drop columns that
-        didn't exist at all during the query dates.
+        Compute a lifetimes matrix from our AssetFinder for the assets that
+        existed at some point during the query dates.
 
         Parameters
         ----------
@@ -204,7 +851,7 @@ class SimplePipelineEngine(object):
         """
         calendar = self._calendar
         finder = self._finder
-        start_idx, end_idx = self._calendar.slice_locs(start_date, end_date)
+        start_idx, end_idx = self._session_locs(start_date, end_date)
         if start_idx < extra_rows:
             raise NoFurtherDataError(
                 msg="Insufficient data to compute Pipeline mask: "
@@ -216,10 +863,12 @@ class SimplePipelineEngine(object):
             )
 
         # Build lifetimes matrix reaching back to `extra_rows` days before
-        # `start_date.`
+        # `start_date`, only for the assets that existed between the requested
+        # start and end dates.
         lifetimes = finder.lifetimes(
             calendar[start_idx - extra_rows:end_idx],
-            include_start_date=False
+            include_start_date=False,
+            alive_dates=calendar[start_idx:end_idx],
         )
 
         assert lifetimes.index[extra_rows] == start_date
@@ -229,13 +878,9 @@ class SimplePipelineEngine(object):
             duplicated = columns[columns.duplicated()].unique()
             raise AssertionError("Duplicated sids: %d" % duplicated)
 
-        # Filter out columns that didn't exist between the requested start and
-        # end dates.
-        existed = lifetimes.iloc[extra_rows:].any()
-        ret = lifetimes.loc[:, existed]
-        shape = ret.shape
+        shape = lifetimes.shape
         assert shape[0] * shape[1] != 0, 'root mask cannot be empty'
-        return ret
+        return lifetimes
 
     def _mask_and_dates_for_term(self, term, workspace, graph, all_dates):
         """
@@ -253,13 +898,17 @@ class SimplePipelineEngine(object):
         return workspace[mask][mask_offset:], all_dates[dates_offset:]
 
     @staticmethod
-    def _inputs_for_term(term, workspace, graph):
+    def _inputs_for_term(term, workspace, graph, storage=None):
         """
         Compute inputs for the given term.
 
         This is mostly complicated by the fact that for each input we store as
         many rows as will be necessary to serve **any** computation requiring
         that input.
+
+        `storage` maps inputs stored at reduced precision to their stored
+        dtypes.  Windowed terms are given windows of the stored dtype, and
+        other terms are given arrays of each input's declared dtype.
         """
         offsets = graph.offset
         if term.windowed:
@@ -283,6 +932,8 @@ class SimplePipelineEngine(object):
             # offset is zero.
             if offset:
                 input_data = input_data[offset:]
+            if storage:
+                input_data = restore_input(input_data, input_, storage)
             out.append(input_data)
         return out
 
@@ -313,49 +964,223 @@ class SimplePipelineEngine(object):
             Dictionary mapping requested results to outputs.
         """
         self._validate_compute_chunk_params(dates, assets, initial_workspace)
-        get_loader = self.get_loader
 
         # Copy the supplied initial workspace so we don't mutate it in place.
         workspace = initial_workspace.copy()
+        refcounts = self._compute_terms(
+            graph,
+            dates,
+            assets,
+            workspace,
+            set(itervalues(graph.outputs)),
+        )
+        self._peak_workspace_nbytes = refcounts.peak_nbytes
+        return self._outputs_from_workspace(graph, workspace)
+
+    def _compute_screened_chunk(self,
+                                graph,
+                                screen_names,
+                                dates,
+                                assets,
+                                root_mask_values):
+        """
+        Compute the outputs of `graph`, skipping work for assets that never
+        pass any of the screens named in `screen_names`.
+
+        The screens, and every term that isn't ``columnwise`` along with its
+        dependencies, are computed over all of `assets`, so that terms like
+        ranks and z-scores see the same mask they would in
+        ``compute_chunk``.  Every other term is then computed only over the
+        assets passing at least one screen on at least one date.  Outputs
+        computed this way hold ``missing_value`` for the remaining assets,
+        which are excluded by every screen on every date.
+
+        Returns
+        -------
+        results : dict
+            Dictionary mapping requested results to outputs, as returned by
+            ``compute_chunk``.
+        """
+        root = self._root_mask_term
+        initial_workspace = {root: root_mask_values}
+        screens = [graph.outputs[name] for name in screen_names]
+        if not self._screen_pushdown or root in screens:
+            return self.compute_chunk(graph, dates, assets, initial_workspace)
+
+        self._validate_compute_chunk_params(dates, assets, initial_workspace)
+
+        outputs = set(itervalues(graph.outputs))
+        full_width = _full_width_terms(graph, screens)
+        narrow_outputs = outputs - full_width
+
+        def feeds_narrow_terms(term):
+            return any(s not in full_width for s in graph.successors(term))
+
+        full_width_targets = {
+            term for term in full_width
+            if term in outputs or feeds_narrow_terms(term)
+        }
+
+        # Data versions of the terms we compute, which stay valid when
+        # they're narrowed to fewer assets.
+        versions = {}
+        workspace = initial_workspace.copy()
+        refcounts = self._compute_terms(
+            graph, dates, assets, workspace, full_width_targets, versions,
+        )
+        peak_nbytes = refcounts.peak_nbytes
 
-        # If loadable terms share the same loader and extra_rows, load them all
-        # together.
-        loader_group_key = juxt(get_loader, getitem(graph.extra_rows))
-        loader_groups = groupby(loader_group_key, graph.loadable_terms)
+        passes_any = zeros(len(assets), dtype=bool)
+        for screen in screens:
+            screen_values = workspace[screen][graph.extra_rows[screen]:]
+            passes_any |= screen_values.any(axis=0)
+        survivors = flatnonzero(passes_any)
 
-        for term in graph.ordered():
-            # `term` may have been supplied in `initial_workspace`, and in the
-            # future we may pre-compute loadable terms coming from the same
-            # dataset.  In either case, we will already have an entry for this
-            # term, which we shouldn't re-compute.
-            if term in workspace:
-                continue
+        if len(survivors) == len(assets):
+            # Nothing to skip, so compute the rest as usual.
+            refcounts = self._compute_terms(
+                graph, dates, assets, workspace, outputs, versions,
+            )
+            peak_nbytes = max(peak_nbytes, refcounts.peak_nbytes)
+        elif narrow_outputs:
+            # Loaded data can't be narrowed, since adjustments are keyed by
+            # column, so narrow terms load their inputs again for just the
+            # surviving assets.
+            narrow_workspace = {}
+            for term in full_width_targets:
+                if term in outputs:
+                    value = workspace[term]
+                else:
+                    value = workspace.pop(term)
+                if (feeds_narrow_terms(term) and
+                        not isinstance(term, LoadableTerm)):
+                    narrow_workspace[term] = value[:, survivors]
+            narrow_workspace[root] = root_mask_values[:, survivors]
+            if len(survivors):
+                narrow_refcounts = self._compute_terms(
+                    graph,
+                    dates,
+                    assets[survivors],
+                    narrow_workspace,
+                    narrow_outputs,
+                    versions,
+                )
+                peak_nbytes = max(
+                    peak_nbytes,
+                    sum(_nbytes(v) for v in itervalues(workspace)) +
+                    narrow_refcounts.peak_nbytes,
+                )
+
+            num_rows = len(dates) - graph.extra_rows[root]
+            storage = self._storage_dtypes(graph)
+            for term in narrow_outputs:
+                out = full(
+                    (num_rows + graph.extra_rows[term], len(assets)),
+                    term.missing_value,
+                    dtype=storage.get(term, term.dtype),
+                )
+                if len(survivors):
+                    out[:, survivors] = narrow_workspace[term]
+                workspace[term] = out
+
+        self._peak_workspace_nbytes = peak_nbytes
+        return self._outputs_from_workspace(graph, workspace)
+
+    def _compute_terms(self,
+                       graph,
+                       dates,
+                       assets,
+                       workspace,
+                       targets,
+                       versions=None):
+        """
+        Compute the terms in `targets`, and any terms they depend on, storing
+        the results in `workspace`.  Intermediate results are evicted from
+        `workspace` as soon as they're no longer needed.
 
-            # Asset labels are always the same, but date labels vary by how
-            # many extra rows are needed.
-            mask, mask_dates = self._mask_and_dates_for_term(
-                term, workspace, graph, dates
+        `versions` is passed to ``_populate_from_cache`` if we have a term
+        cache.
+
+        Returns
+        -------
+        refcounts : _WorkspaceRefcounts
+            The object used to track the contents of `workspace`.
+        """
+        storage = self._storage_dtypes(graph)
+        term_cache = self._term_cache
+        if term_cache is not None:
+            cache_keys = self._populate_from_cache(
+                graph,
+                dates,
+                assets,
+                workspace,
+                targets,
+                {} if versions is None else versions,
+                storage,
             )
+        else:
+            cache_keys = {}
+
+        # Terms whose dependents were all found in the cache don't need to be
+        # computed at all.
+        needed = _needed_terms(graph, workspace, targets)
+        refcounts = _WorkspaceRefcounts(graph, workspace, needed, targets)
 
+        # If loadable terms share the same loader and extra_rows, load them all
+        # together.
+        loader_group_key = juxt(self.get_loader, getitem(graph.extra_rows))
+        loader_groups = groupby(loader_group_key, graph.loadable_terms)
+
+        def job_for_term(term):
+            """
+            The tuple of terms that are produced together with `term`.
+            """
             if isinstance(term, LoadableTerm):
-                to_load = sorted(
+                return tuple(sorted(
                     loader_groups[loader_group_key(term)],
                     key=lambda t: t.dataset
-                )
-                loader = get_loader(term)
-                loaded = loader.load_adjusted_array(
-                    to_load, mask_dates, assets, mask,
-                )
-                workspace.update(loaded)
-            else:
-                workspace[term] = term._compute(
-                    self._inputs_for_term(term, workspace, graph),
-                    mask_dates,
+                ))
+            return (term,)
+
+        def compute_job(job):
+            results = self._run_profiled(
+                job,
+                partial(
+                    self._compute_job,
+                    job,
+                    graph,
+                    dates,
                     assets,
-                    mask,
-                )
-                assert(workspace[term].shape == mask.shape)
+                    workspace,
+                    storage,
+                ),
+            )
+            for term, value in iteritems(results):
+                key = cache_keys.get(term)
+                if key is not None:
+                    term_cache.put(key, value)
+            return results
 
+        if self._num_threads > 1:
+            self._compute_jobs_concurrently(
+                graph, workspace, needed, job_for_term, compute_job, refcounts,
+            )
+        else:
+            for term in graph.ordered():
+                # `term` may have been supplied in `initial_workspace`, found
+                # in our term cache, or loaded along with another term from the
+                # same loader.  In any case, we will already have an entry for
+                # this term, which we shouldn't re-compute.
+                if term in workspace or term not in needed:
+                    continue
+
+                job = job_for_term(term)
+                refcounts.store(job, compute_job(job))
+
+        return refcounts
+
+    @staticmethod
+    def _outputs_from_workspace(graph, workspace):
         out = {}
         graph_extra_rows = graph.extra_rows
         for name, term in iteritems(graph.outputs):
@@ -363,6 +1188,264 @@ class SimplePipelineEngine(object):
             out[name] = workspace[term][graph_extra_rows[term]:]
         return out
 
+    def _populate_from_cache(self,
+                             graph,
+                             dates,
+                             assets,
+                             workspace,
+                             targets,
+                             versions,
+                             storage):
+        """
+        Load results for the computed terms in `graph` on which `targets`
+        depend from our term cache into `workspace`.
+
+        A term is cacheable if it can be fingerprinted, and if every loader it
+        depends on reports a data version.  Terms depending on values supplied
+        in the initial workspace, other than the root mask, are never cached,
+        since we can't know where those values came from.
+
+        `versions` maps terms to the frozenset of the data versions of the
+        loaders on which they depend, or to None if they can't be cached.  It's
+        updated in place, and may be pre-populated with the versions of terms
+        already in `workspace`.  The dtypes given by `storage` for each term
+        and its dependencies are included in its versions, since a term
+        computed from inputs stored at reduced precision may differ from one
+        computed at full precision, even if its own dtype is the same.
+
+        Returns
+        -------
+        cache_keys : dict[Term -> str]
+            Map from each cacheable term that wasn't found to the key under
+            which it should be stored once it's computed.
+        """
+        term_cache = self._term_cache
+        root = self._root_mask_term
+        chunk_token = array_token(
+            dates.values.astype('datetime64[ns]'),
+            assets,
+            workspace[root],
+        )
+        num_root_rows = graph.extra_rows[root]
+        relevant = _needed_terms(graph, {}, targets)
+        fingerprints = {}
+
+        versions.setdefault(root, frozenset())
+        cache_keys = {}
+        for term in graph.ordered():
+            if term in versions or term not in relevant:
+                continue
+            if term in workspace:
+                versions[term] = None
+                continue
+            if isinstance(term, LoadableTerm):
+                version = self.get_loader(term).data_version
+                if version is None:
+                    versions[term] = None
+                else:
+                    versions[term] = frozenset([version]).union(
+                        _storage_versions(
+                            getattr(term, 'qualname', repr(term)),
+                            term,
+                            storage,
+                        ),
+                    )
+                continue
+
+            dependency_versions = [
+                versions[dep] for dep in graph.predecessors(term)
+            ]
+            if any(v is None for v in dependency_versions):
+                versions[term] = None
+                continue
+            try:
+                fingerprint = term_fingerprint(term, fingerprints)
+            except Uncacheable:
+                versions[term] = None
+                continue
+            versions[term] = term_versions = frozenset().union(
+                _storage_versions(fingerprint, term, storage),
+                *dependency_versions
+            )
+
+            extra_rows = graph.extra_rows[term]
+            key = term_cache.key(
+                fingerprint,
+                '%s:%d' % (chunk_token, extra_rows),
+                term_versions,
+            )
+            shape = (len(dates) - num_root_rows + extra_rows, len(assets))
+            cached = term_cache.get(key)
+            if (cached is not None and
+                    cached.shape == shape and
+                    cached.dtype == storage.get(term, term.dtype)):
+                workspace[term] = cached
+            else:
+                cache_keys[term] = key
+
+        return cache_keys
+
+    def _compute_job(self, job, graph, dates, assets, workspace, storage):
+        """
+        Compute a job: either a single computed term, or a group of loadable
+        terms sharing a loader and a number of extra rows.
+
+        Returns
+        -------
+        results : dict
+            Map from each term in `job` to its computed or loaded value,
+            converted to the dtypes given by `storage`.
+        """
+        term = job[0]
+
+        # Asset labels are always the same, but date labels vary by how many
+        # extra rows are needed.
+        mask, mask_dates = self._mask_and_dates_for_term(
+            term, workspace, graph, dates
+        )
+
+        if isinstance(term, LoadableTerm):
+            loader = self.get_loader(term)
+            return compact_results(
+                loader.load_adjusted_array(job, mask_dates, assets, mask),
+                storage,
+            )
+
+        result = term._compute(
+            self._inputs_for_term(term, workspace, graph, storage),
+            mask_dates,
+            assets,
+            mask,
+        )
+        assert(result.shape == mask.shape)
+        return compact_results({term: result}, storage)
+
+    def _storage_dtypes(self, graph):
+        """
+        Map from each term in `graph` stored at reduced precision by our
+        precision policy to the dtype in which it's stored.
+        """
+        precision = self._precision
+        if precision is None:
+            return {}
+        return precision.storage_dtypes(graph)
+
+    def _run_profiled(self, job, compute):
+        """
+        Call `compute` to produce the results of `job`, recording it with our
+        profiler if we have one.
+        """
+        profiler = self._profiler
+        if profiler is None:
+            return compute()
+        term = job[0]
+        if isinstance(term, LoadableTerm):
+            loader = self.get_loader(term)
+        else:
+            loader = None
+        return profiler.run(job, loader, compute)
+
+    def _compute_jobs_concurrently(self,
+                                   graph,
+                                   workspace,
+                                   needed,
+                                   job_for_term,
+                                   compute_job,
+                                   refcounts):
+        """
+        Compute every term in `needed` by running jobs on a thread pool as soon
+        as all of their dependencies are in `workspace`.  Results are stored
+        with `refcounts`.
+
+        Only this thread writes to `workspace`.  Jobs sharing a loader are
+        never run at the same time, since loaders aren't required to be
+        thread-safe.
+        """
+        waiting_on = {}
+        dependents = defaultdict(list)
+        for term in graph.ordered():
+            if term in workspace or term not in needed:
+                continue
+            job = job_for_term(term)
+            if job in waiting_on:
+                continue
+            waiting_on[job] = deps = {
+                dep
+                for member in job
+                for dep in graph.predecessors(member)
+                if dep not in workspace
+            }
+            for dep in deps:
+                dependents[dep].append(job)
+
+        loader_locks = {
+            self.get_loader(job[0]): Lock()
+            for job in waiting_on
+            if isinstance(job[0], LoadableTerm)
+        }
+
+        finished = Queue()
+
+        def run(job):
+            try:
+                term = job[0]
+                if isinstance(term, LoadableTerm):
+                    with loader_locks[self.get_loader(term)]:
+                        result = compute_job(job)
+                else:
+                    result = compute_job(job)
+            except BaseException:
+                finished.put((job, None, sys.exc_info()))
+            else:
+                finished.put((job, result, None))
+
+        pool = ThreadPool(self._num_threads)
+        try:
+            for job, deps in iteritems(waiting_on):
+                if not deps:
+                    pool.apply_async(run, (job,))
+
+            for _ in range(len(waiting_on)):
+                job, result, exc_info = finished.get()
+                if exc_info is not None:
+                    reraise(*exc_info)
+
+                refcounts.store(job, result)
+                for term in job:
+                    for dependent in dependents.pop(term, ()):
+                        deps = waiting_on[dependent]
+                        deps.discard(term)
+                        if not deps:
+                            pool.apply_async(run, (dependent,))
+        finally:
+            pool.terminate()
+            pool.join()
+
+    def _format_results(self, output, data, mask, dates, assets):
+        """
+        Convert raw computed pipeline results into the format requested by
+        `output`.
+        """
+        if output == 'dense':
+            return DensePipelineResult(dates, assets, mask, data)
+        if output == 'columnar':
+            return self._to_columnar(data, mask, dates, assets)
+        return self._to_narrow(data, mask, dates, assets)
+
+    @staticmethod
+    def _to_columnar(data, mask, dates, assets):
+        """
+        Convert raw computed pipeline results into a ColumnarPipelineResult.
+
+        See ``_to_narrow`` for a description of the parameters.
+        """
+        rows, columns = mask.nonzero()
+        return ColumnarPipelineResult(
+            dates.values.astype('datetime64[ns]')[rows],
+            assets.values[columns],
+            {name: arr[mask] for name, arr in iteritems(data)},
+        )
+
     def _to_narrow(self, data, mask, dates, assets):
         """
         Convert raw computed pipeline results into a DataFrame for public APIs.
@@ -9,7 +9,7 @@ from numpy import inf, where
 from toolz import curry
 
 from zipline.errors import UnknownRankMethod
-from zipline.lib.normalize import naive_grouped_rowwise_apply
+from zipline.lib import normalize
 from zipline.lib.rank import masked_rankdata_2d
 from zipline.pipeline.classifiers import Classifier, Everything, Quantiles
 from zipline.pipeline.mixins import (
@@ -41,9 +41,9 @@ from zipline.pipeline.filters import (
     NumExprFilter,
     PercentileFilter,
     NullFilter,
+    RankLimitFilter,
 )
 from zipline.utils.input_validation import expect_types
-from zipline.utils.math_utils import nanmean, nanstd
 from zipline.utils.numpy_utils import (
     bool_dtype,
     coerce_to_dtype,
@@ -576,13 +576,8 @@ class Factor(RestrictedDTypeMixin, ComputableTerm):
         --------
         :meth:`pandas.DataFrame.groupby`
         """
-        # This is a named function so that it has a __name__ for use in the
-        # graph repr of GroupedRowTransform.
-        def demean(row):
-            return row - nanmean(row)
-
         return GroupedRowTransform(
-            transform=demean,
+            transform=normalize.demean,
             factor=self,
             mask=mask,
             groupby=groupby,
@@ -642,13 +637,8 @@ class Factor(RestrictedDTypeMixin, ComputableTerm):
         --------
         :meth:`pandas.DataFrame.groupby`
         """
-        # This is a named function so that it has a __name__ for use in the
-        # graph repr of GroupedRowTransform.
-        def zscore(row):
-            return (row - nanmean(row)) / nanstd(row)
-
         return GroupedRowTransform(
-            transform=zscore,
+            transform=normalize.zscore,
             factor=self,
             mask=mask,
             groupby=groupby,
@@ -809,9 +799,9 @@ class Factor(RestrictedDTypeMixin, ComputableTerm):
 
         Returns
         -------
-        filter : zipline.pipeline.filters.Filter
+        filter : zipline.pipeline.filters.RankLimitFilter
         """
-        return self.rank(ascending=False, mask=mask) <= N
+        return RankLimitFilter(self, N=N, ascending=False, mask=mask)
 
     def bottom(self, N, mask=NotSpecified):
         """
@@ -828,9 +818,9 @@ class Factor(RestrictedDTypeMixin, ComputableTerm):
 
         Returns
         -------
-        filter : zipline.pipeline.Filter
+        filter : zipline.pipeline.filters.RankLimitFilter
         """
-        return self.rank(ascending=True, mask=mask) <= N
+        return RankLimitFilter(self, N=N, ascending=True, mask=mask)
 
     def percentile_between(self,
                            min_percentile,
@@ -1024,7 +1014,7 @@ class GroupedRowTransform(Factor):
 
         return where(
             group_labels != null_group_value,
-            naive_grouped_rowwise_apply(
+            normalize.grouped_rowwise_apply(
                 data=data,
                 group_labels=group_labels,
                 func=self._transform,
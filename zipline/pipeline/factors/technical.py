@@ -9,18 +9,30 @@ from numpy import (
     average,
     clip,
     diff,
+    errstate,
     exp,
     fmax,
     full,
     inf,
+    isfinite,
     isnan,
     log,
+    maximum,
+    newaxis,
     NINF,
     sqrt,
     sum as np_sum,
+    where,
 )
 from numexpr import evaluate
 
+from zipline.lib.rolling import (
+    rolling_exponential_average,
+    rolling_nanmean,
+    rolling_nansum,
+    rolling_sum,
+    window_rows,
+)
 from zipline.pipeline.data import USEquityPricing
 from zipline.pipeline.mixins import SingleInputMixin
 from zipline.utils.numpy_utils import ignore_nanwarnings
@@ -41,10 +53,14 @@ class Returns(CustomFactor):
     **Default Inputs**: [USEquityPricing.close]
     """
     inputs = [USEquityPricing.close]
+    rolling_compute_batch = True
 
     def compute(self, today, assets, out, close):
         out[:] = (close[-1] - close[0]) / close[0]
 
+    def compute_batch(self, dates, assets, out, close):
+        out[:] = (close[:, -1] - close[:, 0]) / close[:, 0]
+
 
 class RSI(CustomFactor, SingleInputMixin):
     """
@@ -58,9 +74,16 @@ class RSI(CustomFactor, SingleInputMixin):
     inputs = (USEquityPricing.close,)
 
     def compute(self, today, assets, out, closes):
-        diffs = diff(closes, axis=0)
-        ups = nanmean(clip(diffs, 0, inf), axis=0)
-        downs = abs(nanmean(clip(diffs, -inf, 0), axis=0))
+        self._rsi(out, closes, axis=0)
+
+    def compute_batch(self, dates, assets, out, closes):
+        self._rsi(out, closes, axis=1)
+
+    @staticmethod
+    def _rsi(out, closes, axis):
+        diffs = diff(closes, axis=axis)
+        ups = nanmean(clip(diffs, 0, inf), axis=axis)
+        downs = abs(nanmean(clip(diffs, -inf, 0), axis=axis))
         return evaluate(
             "100 - (100 / (1 + (ups / downs)))",
             local_dict={'ups': ups, 'downs': downs},
@@ -81,10 +104,14 @@ class SimpleMovingAverage(CustomFactor, SingleInputMixin):
     # nans, but they still returns the desired value (nan), so we ignore the
     # warning.
     ctx = ignore_nanwarnings()
+    rolling_compute_batch = True
 
     def compute(self, today, assets, out, data):
         out[:] = nanmean(data, axis=0)
 
+    def compute_batch(self, dates, assets, out, data):
+        out[:] = rolling_nanmean(window_rows(data), data.shape[1])
+
 
 class WeightedAverageValue(CustomFactor):
     """
@@ -94,9 +121,22 @@ class WeightedAverageValue(CustomFactor):
 
     **Default Window Length:** None
     """
+    rolling_compute_batch = True
+
     def compute(self, today, assets, out, base, weight):
         out[:] = nansum(base * weight, axis=0) / nansum(weight, axis=0)
 
+    def compute_batch(self, dates, assets, out, base, weight):
+        window_length = base.shape[1]
+        weight_rows = window_rows(weight)
+        totals, _ = rolling_nansum(
+            window_rows(base) * weight_rows,
+            window_length,
+        )
+        weights, _ = rolling_nansum(weight_rows, window_length)
+        with errstate(invalid='ignore'):
+            out[:] = totals / weights
+
 
 class VWAP(WeightedAverageValue):
     """
@@ -129,6 +169,21 @@ class MaxDrawdown(CustomFactor, SingleInputMixin):
             peak = nanmax(data[:end + 1, i])
             out[i] = (peak - data[end, i]) / data[end, i]
 
+    def compute_batch(self, dates, assets, out, data):
+        # The peak preceding each drawdown is the running maximum at the
+        # drawdown's end, so we can gather peaks and troughs for every date and
+        # asset at once instead of looping over assets.
+        peaks = fmax.accumulate(data, axis=1)
+        drawdowns = peaks - data
+        drawdowns[isnan(drawdowns)] = NINF
+        drawdown_ends = nanargmax(drawdowns, axis=1)
+
+        rows = arange(len(data))[:, newaxis]
+        columns = arange(data.shape[2])
+        peak = peaks[rows, drawdown_ends, columns]
+        trough = data[rows, drawdown_ends, columns]
+        out[:] = (peak - trough) / trough
+
 
 class AverageDollarVolume(CustomFactor):
     """
@@ -139,10 +194,17 @@ class AverageDollarVolume(CustomFactor):
     **Default Window Length:** None
     """
     inputs = [USEquityPricing.close, USEquityPricing.volume]
+    rolling_compute_batch = True
 
     def compute(self, today, assets, out, close, volume):
         out[:] = nanmean(close * volume, axis=0)
 
+    def compute_batch(self, dates, assets, out, close, volume):
+        out[:] = rolling_nanmean(
+            window_rows(close) * window_rows(volume),
+            close.shape[1],
+        )
+
 
 class _ExponentialWeightedFactor(SingleInputMixin, CustomFactor):
     """
@@ -174,6 +236,7 @@ class _ExponentialWeightedFactor(SingleInputMixin, CustomFactor):
     from_center_of_mass
     """
     params = ('decay_rate',)
+    rolling_compute_batch = True
 
     @staticmethod
     def weights(length, decay_rate):
@@ -183,6 +246,18 @@ class _ExponentialWeightedFactor(SingleInputMixin, CustomFactor):
         """
         return full(length, decay_rate, float) ** arange(length + 1, 1, -1)
 
+    @staticmethod
+    def _finite_window_rows(windows):
+        """
+        Recover the rows spanned by consecutive `windows`, with non-finite
+        values replaced by 0.0, along with a mask of the windows containing
+        non-finite values.
+        """
+        rows = window_rows(windows)
+        finite = isfinite(rows)
+        nonfinite = rolling_sum(~finite, windows.shape[1]) > 0
+        return where(finite, rows, 0.0), nonfinite
+
     @classmethod
     @expect_types(span=Number)
     def from_span(cls, inputs, window_length, span):
@@ -348,6 +423,20 @@ class ExponentialWeightedMovingAverage(_ExponentialWeightedFactor):
             weights=self.weights(len(data), decay_rate),
         )
 
+    def compute_batch(self, dates, assets, out, data, decay_rate):
+        window_length = data.shape[1]
+        rows, nonfinite = self._finite_window_rows(data)
+        out[:] = rolling_exponential_average(rows, window_length, decay_rate)
+
+        # Windows containing NaNs or infinities are averaged directly, so
+        # that those values propagate exactly as they would through average.
+        if nonfinite.any():
+            out[nonfinite] = average(
+                data.transpose(0, 2, 1)[nonfinite],
+                axis=1,
+                weights=self.weights(window_length, decay_rate),
+            )
+
 
 class ExponentialWeightedMovingStdDev(_ExponentialWeightedFactor):
     """
@@ -379,6 +468,8 @@ class ExponentialWeightedMovingStdDev(_ExponentialWeightedFactor):
     --------
     :func:`pandas.ewmstd`
     """
+    # Variances computed from float32 windows lose too much to cancellation.
+    preserve_dtype = True
 
     def compute(self, today, assets, out, data, decay_rate):
         weights = self.weights(len(data), decay_rate)
@@ -386,11 +477,37 @@ class ExponentialWeightedMovingStdDev(_ExponentialWeightedFactor):
         mean = average(data, axis=0, weights=weights)
         variance = average((data - mean) ** 2, axis=0, weights=weights)
 
-        squared_weight_sum = (np_sum(weights) ** 2)
-        bias_correction = (
-            squared_weight_sum / (squared_weight_sum - np_sum(weights ** 2))
+        out[:] = sqrt(variance * self._bias_correction(weights))
+
+    def compute_batch(self, dates, assets, out, data, decay_rate):
+        window_length = data.shape[1]
+        weights = self.weights(window_length, decay_rate)
+        rows, nonfinite = self._finite_window_rows(data)
+
+        # Variance is invariant under shifts, so center each column on its
+        # first value to limit cancellation in ``E[x ** 2] - E[x] ** 2``.
+        rows = rows - rows[0]
+        mean = rolling_exponential_average(rows, window_length, decay_rate)
+        variance = rolling_exponential_average(
+            rows ** 2, window_length, decay_rate,
+        ) - mean ** 2
+
+        out[:] = sqrt(
+            maximum(variance, 0.0) * self._bias_correction(weights)
         )
-        out[:] = sqrt(variance * bias_correction)
+
+        if nonfinite.any():
+            windows = data.transpose(0, 2, 1)[nonfinite]
+            mean = average(windows, axis=1, weights=weights)[:, newaxis]
+            variance = average(
+                (windows - mean) ** 2, axis=1, weights=weights,
+            )
+            out[nonfinite] = sqrt(variance * self._bias_correction(weights))
+
+    @staticmethod
+    def _bias_correction(weights):
+        squared_weight_sum = (np_sum(weights) ** 2)
+        return squared_weight_sum / (squared_weight_sum - np_sum(weights ** 2))
 
 
 # Convenience aliases.
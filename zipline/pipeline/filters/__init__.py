@@ -5,6 +5,7 @@ from .filter import (
     NullFilter,
     NumExprFilter,
     PercentileFilter,
+    RankLimitFilter,
 )
 
 __all__ = [
@@ -14,4 +15,5 @@ __all__ = [
     'NullFilter',
     'NumExprFilter',
     'PercentileFilter',
+    'RankLimitFilter',
 ]
@@ -1,11 +1,6 @@
 """
 filter.py
 """
-from numpy import (
-    float64,
-    nan,
-    nanpercentile,
-)
 from itertools import chain
 from operator import attrgetter
 
@@ -13,7 +8,8 @@ from zipline.errors import (
     BadPercentileBounds,
     UnsupportedDataType,
 )
-from zipline.lib.rank import ismissing
+from zipline.lib.quantiles import rowwise_percentile_mask
+from zipline.lib.rank import ismissing, masked_rank_le_2d
 from zipline.pipeline.mixins import (
     CustomTermMixin,
     LatestMixin,
@@ -232,6 +228,7 @@ class NullFilter(SingleInputMixin, Filter):
         The factor to compare against its missing_value.
     """
     window_length = 0
+    columnwise = True
 
     def __new__(cls, factor):
         return super(NullFilter, cls).__new__(
@@ -296,28 +293,66 @@ class PercentileFilter(SingleInputMixin, Filter):
         For each row in the input, compute a mask of all values falling between
         the given percentiles.
         """
-        # TODO: Review whether there's a better way of handling small numbers
-        # of columns.
-        data = arrays[0].copy().astype(float64)
-        data[~mask] = nan
-
-        # FIXME: np.nanpercentile **should** support computing multiple bounds
-        # at once, but there's a bug in the logic for multiple bounds in numpy
-        # 1.9.2.  It will be fixed in 1.10.
-        # c.f. https://github.com/numpy/numpy/pull/5981
-        lower_bounds = nanpercentile(
-            data,
+        return rowwise_percentile_mask(
+            arrays[0],
+            mask,
             self._min_percentile,
-            axis=1,
-            keepdims=True,
-        )
-        upper_bounds = nanpercentile(
-            data,
             self._max_percentile,
-            axis=1,
-            keepdims=True,
         )
-        return (lower_bounds <= data) & (data <= upper_bounds)
+
+
+class RankLimitFilter(SingleInputMixin, Filter):
+    """
+    A Filter matching the N highest or lowest values of a Factor each day.
+
+    Equivalent to comparing the Factor's ordinal rank to N, but computed with
+    a partial sort of each row rather than a full ranking.
+
+    Parameters
+    ----------
+    factor : zipline.pipeline.factor.Factor
+        The factor whose values should be selected.
+    N : int
+        The maximum number of assets passing the filter each day.
+    ascending : bool
+        Whether to select the lowest values (True) or the highest (False).
+    """
+    window_length = 0
+
+    def __new__(cls, factor, N, ascending, mask):
+        return super(RankLimitFilter, cls).__new__(
+            cls,
+            inputs=(factor,),
+            mask=mask,
+            N=N,
+            ascending=ascending,
+        )
+
+    def _init(self, N, ascending, *args, **kwargs):
+        self._N = N
+        self._ascending = ascending
+        return super(RankLimitFilter, self)._init(*args, **kwargs)
+
+    @classmethod
+    def static_identity(cls, N, ascending, *args, **kwargs):
+        return (
+            super(RankLimitFilter, cls).static_identity(*args, **kwargs),
+            N,
+            ascending,
+        )
+
+    def _compute(self, arrays, dates, assets, mask):
+        """
+        For each row in the input, compute a mask of the N lowest or highest
+        values, breaking ties in favor of the leftmost asset.
+        """
+        return masked_rank_le_2d(
+            arrays[0],
+            mask,
+            self.inputs[0].missing_value,
+            self._N,
+            self._ascending,
+        )
 
 
 class CustomFilter(PositiveWindowLengthMixin, CustomTermMixin, Filter):
@@ -7,7 +7,6 @@ from networkx import (
 )
 from six import itervalues, iteritems
 from zipline.utils.memoize import lazyval
-from zipline.pipeline.visualize import display_graph
 
 from .term import LoadableTerm
 
@@ -206,14 +205,17 @@ class TermGraph(DiGraph):
 
     @lazyval
     def jpeg(self):
+        from zipline.pipeline.visualize import display_graph
         return display_graph(self, 'jpeg')
 
     @lazyval
     def png(self):
+        from zipline.pipeline.visualize import display_graph
         return display_graph(self, 'png')
 
     @lazyval
     def svg(self):
+        from zipline.pipeline.visualize import display_graph
         return display_graph(self, 'svg')
 
     def _repr_png_(self):
@@ -0,0 +1,269 @@
+"""
+Day-by-day computation of Pipelines.
+"""
+from functools import partial
+from uuid import uuid4
+
+from six import iteritems
+from toolz import groupby, juxt
+from toolz.curried.operator import getitem
+
+from zipline.lib.adjusted_array import ensure_ndarray
+from zipline.utils.pandas_utils import explode
+
+from .precision import compact_results, restore_input
+from .term import LoadableTerm
+
+
+def _load_terms(loader, job, dates, assets, mask, storage):
+    return compact_results(
+        loader.load_adjusted_array(job, dates, assets, mask),
+        storage,
+    )
+
+
+def _compute_term(term, inputs, dates, assets, workspace, storage):
+    return compact_results(
+        {term: term._compute(inputs, dates, assets, workspace[term.mask])},
+        storage,
+    )
+
+
+class IncrementalPipeline(object):
+    """
+    Computes a pipeline one date at a time, carrying the trailing windows of
+    each windowed term from one date to the next.
+
+    ``SimplePipelineEngine.run_pipeline`` computes every term over a range of
+    dates at once, reloading each term's full lookback window for every
+    range.  An IncrementalPipeline instead loads raw data in chunks of
+    `chunksize` dates and keeps an iterator over the inputs of each windowed
+    term.  Each date advances those iterators by one row, applying
+    adjustments as they become known, and computes a single row of each term.
+    Results for a date are therefore available as soon as it's reached, and
+    memory use doesn't depend on the number of dates computed.
+
+    The results for each date are the same as those produced by
+    ``run_pipeline``, and terms are stored at the dtypes chosen by the
+    engine's precision policy.
+
+    Parameters
+    ----------
+    engine : zipline.pipeline.engine.SimplePipelineEngine
+        The engine whose loaders and asset finder should be used.
+    pipeline : zipline.pipeline.Pipeline
+        The pipeline to compute.
+    start_date : pd.Timestamp
+        The first date to compute.
+    end_date : pd.Timestamp
+        The last date to compute.  Results are computed for every asset that
+        existed at some point between `start_date` and `end_date`.
+    chunksize : int, optional
+        The number of dates of raw data to load at once.
+    output : {'frame', 'dense', 'columnar'}, optional
+        The format of the result for each date.  See
+        ``SimplePipelineEngine.run_pipeline``.
+
+    See Also
+    --------
+    zipline.pipeline.engine.SimplePipelineEngine.incremental_pipeline
+    """
+    def __init__(self,
+                 engine,
+                 pipeline,
+                 start_date,
+                 end_date,
+                 chunksize=126,
+                 output='frame'):
+        engine._validate_date_range(start_date, end_date)
+        engine._validate_output_format(output)
+        if chunksize < 1:
+            raise ValueError(
+                "chunksize must be at least 1, got %d." % chunksize
+            )
+
+        self._engine = engine
+        self._screen_name = uuid4().hex
+        self._root = root = engine._root_mask_term
+        self._graph = graph = pipeline.to_graph(self._screen_name, root)
+        for term in graph:
+            if term is root or isinstance(term, LoadableTerm):
+                continue
+            if graph.extra_rows[term]:
+                raise ValueError(
+                    "Can't compute %r incrementally, since %d trailing rows "
+                    "of it are needed." % (term, graph.extra_rows[term])
+                )
+
+        extra_rows = graph.extra_rows[root]
+        self._dates, self._assets, self._root_mask_values = explode(
+            engine._compute_root_mask(start_date, end_date, extra_rows),
+        )
+        self._chunksize = chunksize
+        self._output = output
+        self._storage = engine._storage_dtypes(graph)
+
+        # Index into self._dates of the first date to compute, and of the
+        # next date to compute.
+        self._first_idx = self._next_idx = extra_rows
+        # Index into self._dates of the first date not covered by the chunk
+        # of data we've loaded.
+        self._loaded_until = extra_rows
+        # Map from loadable term -> (AdjustedArray, index into self._dates of
+        # its first row) for the current chunk.
+        self._loaded = {}
+        # Map from (windowed term, input) -> window iterator.
+        self._windows = {}
+        self._last_result = None
+
+    @property
+    def next_date(self):
+        """
+        The next date that will be computed, or None if every date has been
+        computed.
+        """
+        if self._next_idx == len(self._dates):
+            return None
+        return self._dates[self._next_idx]
+
+    def compute(self, date):
+        """
+        Compute results for `date`, first advancing through any earlier dates
+        that haven't been computed.
+
+        Dates must be requested in non-decreasing order.  Requesting the most
+        recently computed date again returns the same results.
+
+        Parameters
+        ----------
+        date : pd.Timestamp
+            The date for which to compute results.
+
+        Returns
+        -------
+        result : pd.DataFrame, DensePipelineResult or ColumnarPipelineResult
+            The results for `date`, in the format given by our `output`.
+        """
+        last = self._last_result
+        if last is not None and last[0] == date:
+            return last[1]
+
+        dates = self._dates
+        idx = dates.searchsorted(date)
+        if idx < self._first_idx or idx == len(dates) or dates[idx] != date:
+            raise ValueError(
+                "%s isn't a trading date between %s and %s." % (
+                    date, dates[self._first_idx], dates[-1],
+                )
+            )
+        if idx < self._next_idx:
+            raise ValueError(
+                "Can't compute %s after computing %s." % (date, last[0])
+            )
+
+        while self._next_idx <= idx:
+            result = self._step()
+        self._last_result = date, result
+        return result
+
+    def _load_chunk(self):
+        """
+        Load a chunk of data for every loadable term, starting with enough
+        trailing rows to serve the next date, and build iterators over the
+        windows of that data needed by each windowed term.
+        """
+        graph = self._graph
+        get_loader = self._engine.get_loader
+        start = self._next_idx
+        stop = min(start + self._chunksize, len(self._dates))
+
+        # Load terms sharing a loader and a number of extra rows together, as
+        # in SimplePipelineEngine.compute_chunk.
+        loader_groups = groupby(
+            juxt(get_loader, getitem(graph.extra_rows)),
+            graph.loadable_terms,
+        )
+        loaded = {}
+        for (loader, extra_rows), terms in iteritems(loader_groups):
+            first_row = start - extra_rows
+            job = tuple(sorted(terms, key=lambda t: t.dataset))
+            arrays = self._engine._run_profiled(
+                job,
+                partial(
+                    _load_terms,
+                    loader,
+                    job,
+                    self._dates[first_row:stop],
+                    self._assets,
+                    self._root_mask_values[first_row:stop],
+                    self._storage,
+                ),
+            )
+            for term in terms:
+                loaded[term] = arrays[term], first_row
+
+        self._loaded = loaded
+        self._windows = {
+            (term, input_): loaded[input_][0].traverse(
+                window_length=term.window_length,
+                offset=graph.offset[term, input_],
+            )
+            for term in graph
+            if term.windowed
+            for input_ in term.inputs
+        }
+        self._loaded_until = stop
+
+    def _step(self):
+        """
+        Compute results for the next date.
+        """
+        idx = self._next_idx
+        if idx == self._loaded_until:
+            self._load_chunk()
+
+        graph = self._graph
+        storage = self._storage
+        dates = self._dates[idx:idx + 1]
+        assets = self._assets
+        workspace = {self._root: self._root_mask_values[idx:idx + 1]}
+        for term in graph.ordered():
+            if term in workspace:
+                continue
+
+            if isinstance(term, LoadableTerm):
+                array, first_row = self._loaded[term]
+                row = idx - first_row
+                workspace[term] = ensure_ndarray(array)[row:row + 1]
+                continue
+
+            if term.windowed:
+                # Each window iterator advances by one row per call.
+                inputs = [self._windows[term, i] for i in term.inputs]
+            else:
+                inputs = [
+                    restore_input(workspace[i], i, storage)
+                    for i in term.inputs
+                ]
+            workspace.update(self._engine._run_profiled(
+                (term,),
+                partial(
+                    _compute_term,
+                    term,
+                    inputs,
+                    dates,
+                    assets,
+                    workspace,
+                    storage,
+                ),
+            ))
+
+        self._next_idx += 1
+
+        outputs = {
+            name: workspace[term] for name, term in iteritems(graph.outputs)
+        }
+        screen_values = outputs.pop(self._screen_name)
+        return self._engine._format_results(
+            self._output, outputs, screen_values, dates, assets,
+        )
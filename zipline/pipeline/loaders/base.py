@@ -19,3 +19,15 @@ class PipelineLoader(with_metaclass(ABCMeta)):
     @abstractmethod
     def load_adjusted_array(self, columns, dates, assets, mask):
         pass
+
+    @property
+    def data_version(self):
+        """
+        A string identifying the data served by this loader, or None if it's
+        unknown.
+
+        Results computed from this loader's data are only stored in a
+        ``zipline.pipeline.cache.TermResultCache`` if this is not None.  Two
+        loaders with equal data versions must serve the same data.
+        """
+        return None
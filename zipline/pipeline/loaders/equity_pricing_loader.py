@@ -11,10 +11,16 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from collections import namedtuple
+
 from numpy import (
+    empty,
     iinfo,
     uint32,
 )
+from six import iteritems
+from six.moves._thread import allocate_lock as Lock
+from toolz import groupby
 
 from zipline.data.us_equity_pricing import (
     BcolzDailyBarReader,
@@ -33,17 +39,33 @@ class USEquityPricingLoader(PipelineLoader):
     PipelineLoader for US Equity Pricing data
 
     Delegates loading of baselines and adjustments.
+
+    Parameters
+    ----------
+    raw_price_loader : BcolzDailyBarReader
+        Reader providing raw prices.
+    adjustments_loader : SQLiteAdjustmentReader
+        Reader providing price/volume adjustments.
+    cache : bool, optional
+        Whether to keep the raw data and adjustments most recently loaded for
+        each column, so that a later query overlapping them only reads the
+        dates and assets it doesn't share with them.  Pipelines run in
+        successive chunks, as by TradingAlgorithm, re-query the lookback window
+        of each chunk as part of the next one.  Default is False.
     """
 
-    def __init__(self, raw_price_loader, adjustments_loader):
+    def __init__(self, raw_price_loader, adjustments_loader, cache=False):
         self.raw_price_loader = raw_price_loader
         # HACK: Pull the calendar off our raw_price_loader so that we can
         # backshift dates.
         self._calendar = self.raw_price_loader._calendar
         self.adjustments_loader = adjustments_loader
+        self._cache = cache
+        self._blocks = {}
+        self._blocks_lock = Lock()
 
     @classmethod
-    def from_files(cls, pricing_path, adjustments_path):
+    def from_files(cls, pricing_path, adjustments_path, cache=False):
         """
         Create a loader from a bcolz equity pricing dir and a SQLite
         adjustments path.
@@ -54,11 +76,36 @@ class USEquityPricingLoader(PipelineLoader):
             Path to a bcolz directory written by a BcolzDailyBarWriter.
         adjusments_path : str
             Path to an adjusments db written by a SQLiteAdjustmentWriter.
+        cache : bool, optional
+            Whether to cache the most recently loaded data.  See
+            USEquityPricingLoader.
         """
         return cls(
             BcolzDailyBarReader(pricing_path),
-            SQLiteAdjustmentReader(adjustments_path)
+            SQLiteAdjustmentReader(adjustments_path),
+            cache=cache,
+        )
+
+    def clear_cache(self):
+        """
+        Discard any data cached by previous calls to load_adjusted_array.
+        """
+        with self._blocks_lock:
+            self._blocks = {}
+
+    @property
+    def data_version(self):
+        """
+        The data versions of our pricing and adjustment readers, if both are
+        known.
+        """
+        versions = (
+            getattr(self.raw_price_loader, 'data_version', None),
+            getattr(self.adjustments_loader, 'data_version', None),
         )
+        if None in versions:
+            return None
+        return 'USEquityPricingLoader:%s|%s' % versions
 
     def load_adjusted_array(self, columns, dates, assets, mask):
         # load_adjusted_array is called with dates on which the user's algo
@@ -69,12 +116,20 @@ class USEquityPricingLoader(PipelineLoader):
         start_date, end_date = _shift_dates(
             self._calendar, dates[0], dates[-1], shift=1,
         )
+        if self._cache:
+            start = self._calendar.get_loc(dates[0])
+            end = self._calendar.get_loc(dates[-1])
+            # The cache addresses dates by their position in our calendar, so
+            # it can only serve queries for contiguous runs of its dates.
+            if end - start + 1 == len(dates):
+                return self._load_cached(columns, start, end, assets, mask)
 
         raw_arrays = self.raw_price_loader.load_raw_arrays(
             columns,
             start_date,
             end_date,
             assets,
+            mask=mask,
         )
         adjustments = self.adjustments_loader.load_adjustments(
             columns,
@@ -92,6 +147,271 @@ class USEquityPricingLoader(PipelineLoader):
             )
         return out
 
+    def _load_cached(self, columns, start, end, assets, mask):
+        """
+        Implementation of load_adjusted_array reusing cached data.
+
+        Parameters
+        ----------
+        columns : list[BoundColumn]
+            The columns to load.
+        start, end : int
+            The positions in our calendar of the first and last query dates.
+        assets : pd.Int64Index
+            The assets to load.
+        mask : np.ndarray[bool]
+            Mask to pass to each AdjustedArray.
+        """
+        with self._blocks_lock:
+            groups = groupby(self._blocks.get, columns)
+
+        new_blocks = {}
+        out = {}
+        for block, group in iteritems(groups):
+            if block is not None and block.start <= start <= block.end:
+                new_block = self._extend_block(
+                    block, group, start, end, assets, mask,
+                )
+            else:
+                new_block = self._read_block(
+                    group, start, end, assets, mask,
+                )
+
+            for c in group:
+                new_blocks[c] = new_block
+                out[c] = AdjustedArray(
+                    new_block.arrays[c].astype(c.dtype),
+                    mask,
+                    new_block.adjustments_for(c),
+                    c.missing_value,
+                )
+
+        with self._blocks_lock:
+            self._blocks.update(new_blocks)
+        return out
+
+    def _read_raw(self, columns, start, end, assets, mask):
+        # Query dates are shown the data from the previous trading day.
+        calendar = self._calendar
+        return self.raw_price_loader.load_raw_arrays(
+            columns,
+            calendar[start - 1],
+            calendar[end - 1],
+            assets,
+            mask=mask,
+        )
+
+    def _read_adjustments(self, columns, start, end, assets):
+        # Adjustments are keyed by the position of their effective date
+        # relative to `start`, counting dates strictly before it, so they're
+        # rebased to absolute calendar positions before they're cached.
+        adjustments = self.adjustments_loader.load_adjustments(
+            columns,
+            self._calendar[start:end + 1],
+            assets,
+        )
+        return [
+            [
+                _CachedAdjustment(
+                    start + loc, assets[adj.first_col], adj, start,
+                )
+                for loc, adjs in iteritems(column_adjustments)
+                for adj in adjs
+            ]
+            for column_adjustments in adjustments
+        ]
+
+    def _read_block(self, columns, start, end, assets, mask):
+        """
+        Read `columns` for the query dates between calendar positions
+        `start` and `end` without consulting the cache.
+        """
+        return _Block(
+            start,
+            end,
+            assets,
+            dict(
+                zip(
+                    columns,
+                    self._read_raw(columns, start, end, assets, mask),
+                )
+            ),
+            dict(
+                zip(
+                    columns,
+                    self._read_adjustments(columns, start, end, assets),
+                )
+            ),
+        )
+
+    def _extend_block(self, block, columns, start, end, assets, mask):
+        """
+        Build a block for the query dates between calendar positions `start`
+        and `end` from the parts of `block` overlapping them, reading the
+        dates after `block.end` and the assets missing from `block`.
+        """
+        overlap_end = min(end, block.end)
+        num_overlapping = overlap_end - start + 1
+        old_rows = slice(start - block.start, overlap_end - block.start + 1)
+
+        indexer = block.assets.get_indexer(assets)
+        known = indexer >= 0
+        unknown = ~known
+        known_ixs = indexer[known]
+        new_assets = assets[unknown]
+        num_new_assets = len(new_assets)
+        keep_sids = set(assets)
+
+        arrays = {}
+        adjustments = {}
+        for c in columns:
+            cached = block.arrays[c]
+            array = arrays[c] = empty(
+                (end - start + 1, len(assets)),
+                dtype=cached.dtype,
+            )
+            array[:num_overlapping, known] = cached[old_rows][:, known_ixs]
+            adjustments[c] = [
+                adj for adj in block.adjustments[c]
+                if start <= adj.position <= overlap_end and
+                adj.sid in keep_sids
+            ]
+
+        if start > block.start:
+            # Adjustments at `start` were cached along with those effective
+            # on the non-trading days before it, which a query starting at
+            # `start` doesn't see, so re-read the ones effective on `start`.
+            if any(adj.position == start
+                   for c in columns
+                   for adj in adjustments[c]):
+                boundary = self._read_adjustments(
+                    columns,
+                    start,
+                    start,
+                    assets[known],
+                )
+                for c, boundary_adjs in zip(columns, boundary):
+                    adjustments[c] = boundary_adjs + [
+                        adj for adj in adjustments[c]
+                        if adj.position != start
+                    ]
+
+        if num_new_assets:
+            raw = self._read_raw(
+                columns,
+                start,
+                overlap_end,
+                new_assets,
+                mask[:num_overlapping, unknown],
+            )
+            new_adjustments = self._read_adjustments(
+                columns,
+                start,
+                overlap_end,
+                new_assets,
+            )
+            for c, c_raw, c_adjs in zip(columns, raw, new_adjustments):
+                arrays[c][:num_overlapping, unknown] = c_raw
+                adjustments[c].extend(c_adjs)
+
+        if end > block.end:
+            raw = self._read_raw(
+                columns,
+                block.end + 1,
+                end,
+                assets,
+                mask[num_overlapping:],
+            )
+            # Query from `block.end` so that we see adjustments effective on
+            # the non-trading days after it.  Those effective on `block.end`
+            # itself are already cached.
+            new_adjustments = self._read_adjustments(
+                columns,
+                block.end,
+                end,
+                assets,
+            )
+            for c, c_raw, c_adjs in zip(columns, raw, new_adjustments):
+                arrays[c][num_overlapping:] = c_raw
+                adjustments[c].extend(
+                    adj for adj in c_adjs if adj.position > block.end
+                )
+
+        return _Block(start, end, assets, arrays, adjustments)
+
+
+class _CachedAdjustment(namedtuple('_CachedAdjustment', ['position',
+                                                         'sid',
+                                                         'adjustment',
+                                                         'base'])):
+    """
+    An adjustment to a single asset read for an earlier query.
+
+    Attributes
+    ----------
+    position : int
+        The calendar position of the query date at which the adjustment is
+        applied.
+    sid : int
+        The asset adjusted.
+    adjustment : zipline.lib.adjustment.Adjustment
+        The adjustment as read, with rows relative to the calendar position
+        `base`.
+    base : int
+        The calendar position of the first date of the query that read the
+        adjustment.
+    """
+    __slots__ = ()
+
+    def rebase(self, start, column):
+        """
+        Get the adjustment for a query starting at calendar position `start`,
+        in which its asset is at index `column`.
+        """
+        adj = self.adjustment
+        if start == self.base and column == adj.first_col:
+            return adj
+        shift = self.base - start
+        # An adjustment starting at the first row read covers every row
+        # before it, however many rows the new query has.
+        first_row = max(adj.first_row + shift, 0) if adj.first_row else 0
+        return type(adj)(
+            first_row,
+            adj.last_row + shift,
+            column,
+            column,
+            adj.value,
+        )
+
+
+class _Block(object):
+    """
+    The raw data and adjustments of a group of columns loaded together for
+    the query dates between the calendar positions `start` and `end`.
+    """
+    __slots__ = ('start', 'end', 'assets', 'arrays', 'adjustments')
+
+    def __init__(self, start, end, assets, arrays, adjustments):
+        self.start = start
+        self.end = end
+        self.assets = assets
+        self.arrays = arrays
+        self.adjustments = adjustments
+
+    def adjustments_for(self, column):
+        """
+        Get the adjustments for `column`, in the format expected by
+        AdjustedArray.
+        """
+        start = self.start
+        columns = {sid: i for i, sid in enumerate(self.assets)}
+        out = {}
+        for adj in self.adjustments[column]:
+            out.setdefault(adj.position - start, []).append(
+                adj.rebase(start, columns[adj.sid]),
+            )
+        return out
+
 
 def _shift_dates(dates, start_date, end_date, shift):
     try:
@@ -2,6 +2,7 @@
 PipelineLoader accepting a DataFrame as input.
 """
 from functools import partial
+from hashlib import sha1
 
 from numpy import (
     ix_,
@@ -15,7 +16,9 @@ from pandas import (
 )
 from zipline.lib.adjusted_array import AdjustedArray
 from zipline.lib.adjustment import make_adjustment_from_labels
+from zipline.utils.memoize import lazyval
 from zipline.utils.pandas_utils import sort_values
+from ..cache import array_token
 from .base import PipelineLoader
 
 ADJUSTMENT_COLUMNS = Index([
@@ -79,6 +82,21 @@ class DataFrameLoader(PipelineLoader):
         self.adjustment_end_dates = DatetimeIndex(adjustments.end_date)
         self.adjustment_sids = Int64Index(adjustments.sid)
 
+    @lazyval
+    def data_version(self):
+        """
+        A hash of our baseline and adjustments.
+        """
+        adjustments = repr(self.adjustments.values.tolist()).encode('utf-8')
+        return 'DataFrameLoader:%s:%s' % (
+            array_token(
+                self.baseline,
+                self.dates.values.astype('datetime64[ns]'),
+                self.assets,
+            ),
+            sha1(adjustments).hexdigest(),
+        )
+
     def format_adjustments(self, dates, assets):
         """
         Build a dict of Adjustment objects in the format expected by
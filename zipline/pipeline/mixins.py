@@ -56,6 +56,25 @@ class RestrictedDTypeMixin(object):
             )
 
 
+def _uses_compute_batch(cls):
+    """
+    Should instances of ``cls`` be computed with ``compute_batch``?
+
+    A class opts in to the batched protocol by defining ``compute_batch``.  A
+    subclass that overrides only ``compute`` opts back out, so that its
+    ``compute`` is never silently ignored.
+    """
+    for klass in cls.__mro__:
+        if klass is CustomTermMixin:
+            break
+        namespace = vars(klass)
+        if 'compute_batch' in namespace:
+            return True
+        if 'compute' in namespace:
+            return False
+    return False
+
+
 class CustomTermMixin(object):
     """
     Mixin for user-defined rolling-window Terms.
@@ -63,10 +82,36 @@ class CustomTermMixin(object):
     Implements `_compute` in terms of a user-defined `compute` function, which
     is mapped over the input windows.
 
+    Subclasses may instead define a ``compute_batch`` method with the
+    signature::
+
+        compute_batch(self, dates, assets, out, *arrays, **params)
+
+    which is called with many dates at once.  ``out`` has one row per entry in
+    ``dates``, and each entry in ``arrays`` is a read-only 3D array of shape
+    ``(len(dates), window_length, len(assets))`` holding the trailing window
+    for each date.  Within a call, each window is the previous window advanced
+    by one row, so rolling reductions can be updated incrementally (see
+    ``zipline.lib.rolling``).  Unlike ``compute``, ``compute_batch`` receives
+    every column in ``assets``, and entries excluded by the term's mask are
+    overwritten with ``missing_value`` afterwards, so it must compute each
+    column independently of the others.
+
     Used by CustomFactor, CustomFilter, CustomClassifier, etc.
     """
     ctx = nullctx()
 
+    # Upper bound on the number of input elements passed to a single call to
+    # ``compute_batch``.  This bounds the size of temporaries built from the
+    # 3D windows.
+    max_batch_elements = 2 ** 22
+
+    # Set to True by terms whose ``compute_batch`` only builds temporaries the
+    # size of the rows spanned by its windows, rather than the size of the
+    # windows themselves.  Those terms are passed batches bounded by their
+    # number of rows, rather than by their number of window elements.
+    rolling_compute_batch = False
+
     def __new__(cls,
                 inputs=NotSpecified,
                 window_length=NotSpecified,
@@ -95,6 +140,12 @@ class CustomTermMixin(object):
             **kwargs
         )
 
+    @property
+    def columnwise(self):
+        # ``compute`` may look across the assets it's given, but
+        # ``compute_batch`` is required to treat each column independently.
+        return _uses_compute_batch(type(self))
+
     def compute(self, today, assets, out, *arrays):
         """
         Override this method with a function that writes a value into `out`.
@@ -106,6 +157,9 @@ class CustomTermMixin(object):
         Call the user's `compute` function on each window with a pre-built
         output array.
         """
+        if _uses_compute_batch(type(self)):
+            return self._compute_batched(windows, dates, assets, mask)
+
         compute = self.compute
         missing_value = self.missing_value
         params = self.params
@@ -128,6 +182,41 @@ class CustomTermMixin(object):
                 out[idx][col_mask] = masked_out
         return out
 
+    def _compute_batched(self, windows, dates, assets, mask):
+        """
+        Call the user's `compute_batch` function on blocks of consecutive
+        windows with a pre-built output array.
+        """
+        compute_batch = self.compute_batch
+        missing_value = self.missing_value
+        params = self.params
+        out = full_like(mask, missing_value, dtype=self.dtype)
+        batch_rows = 1 if self.rolling_compute_batch else self.window_length
+        max_windows = max(
+            1,
+            self.max_batch_elements // (batch_rows * len(assets) or 1),
+        )
+        with self.ctx:
+            start = 0
+            while start < len(dates):
+                # Each input yields consecutive windows as a single view until
+                # it reaches an adjustment, so batch up to the nearest one.
+                size = min(
+                    [max_windows, len(dates) - start] +
+                    [w.batch_length() for w in windows]
+                )
+                stop = start + size
+                compute_batch(
+                    dates[start:stop],
+                    assets,
+                    out[start:stop],
+                    *(w.next_batch(size) for w in windows),
+                    **params
+                )
+                start = stop
+        out[~mask] = missing_value
+        return out
+
     def short_repr(self):
         return type(self).__name__ + '(%d)' % self.window_length
 
@@ -141,6 +230,9 @@ class LatestMixin(SingleInputMixin):
     def compute(self, today, assets, out, data):
         out[:] = data[-1]
 
+    def compute_batch(self, dates, assets, out, data):
+        out[:] = data[:, -1]
+
     def _validate(self):
         super(LatestMixin, self)._validate()
         if self.inputs[0].dtype != self.dtype:
@@ -146,7 +146,7 @@ class Pipeline(object):
 
         return TermGraph(columns)
 
-    def show_graph(self, format='svg'):
+    def show_graph(self, format='svg', profiler=None):
         """
         Render this Pipeline as a DAG.
 
@@ -154,8 +154,17 @@ class Pipeline(object):
         ----------
         format : {'svg', 'png', 'jpeg'}
             Image format to render with.  Default is 'svg'.
+        profiler : zipline.pipeline.profiler.PipelineProfiler, optional
+            A profiler that recorded a run of this Pipeline.  If supplied,
+            each term is labelled with the time spent and memory allocated
+            producing it.
         """
         g = self.to_graph('', AssetExists())
+        if profiler is not None:
+            if format not in ('svg', 'png', 'jpeg'):
+                raise ValueError("Unknown graph format %r." % format)
+            from zipline.pipeline.visualize import display_graph
+            return display_graph(g, format, profiler=profiler)
         if format == 'svg':
             return g.svg
         elif format == 'png':
@@ -0,0 +1,184 @@
+"""
+Reduced-precision storage of Pipeline term results.
+
+Factors and most loaded columns are float64, and classifiers are int64, but
+few signals need that much precision.  Running an engine with a
+``PrecisionPolicy`` stores those results at a smaller dtype, which halves the
+memory used by the engine's workspace and by the data loaded for each chunk,
+and halves the memory bandwidth used by windowed computations.
+"""
+from networkx import ancestors
+from numpy import dtype as dtype_class, iinfo
+from six import iteritems
+
+from zipline.lib.adjusted_array import AdjustedArray, ensure_ndarray
+from zipline.utils.numpy_utils import (
+    float32_dtype,
+    float64_dtype,
+    int8_dtype,
+    int16_dtype,
+    int32_dtype,
+    int64_dtype,
+)
+
+from .classifiers import Classifier
+
+FLOAT_STORAGE_DTYPES = frozenset([float32_dtype, float64_dtype])
+CLASSIFIER_STORAGE_DTYPES = frozenset([
+    int8_dtype,
+    int16_dtype,
+    int32_dtype,
+    int64_dtype,
+])
+
+
+class PrecisionPolicy(object):
+    """
+    Policy for storing the results of Pipeline terms at reduced precision.
+
+    Pass an instance as the ``precision`` argument to SimplePipelineEngine to
+    store float64 terms, including loaded columns like USEquityPricing.volume,
+    as `float_dtype`, and classifier codes as `classifier_dtype`.
+
+    Terms keep their declared dtypes.  Windowed terms are given windows of
+    the stored dtype, while other terms are given their inputs converted back
+    to their declared dtypes, since many of them are implemented by compiled
+    kernels specialized for those dtypes.  Pipeline outputs are returned at
+    the stored dtype.
+
+    Terms that are sensitive to rounding can opt out by setting
+    ``preserve_dtype = True``, or by being passed in `preserve`.  Preserved
+    terms, and every term on which they depend, are stored at full precision.
+
+    Parameters
+    ----------
+    float_dtype : np.dtype, optional
+        The dtype in which to store float64 terms.  Default is float32.
+    classifier_dtype : np.dtype, optional
+        The signed integer dtype in which to store the codes of classifiers.
+        Default is int32.  Computing a classifier whose codes don't fit in
+        this dtype raises a ValueError.
+    preserve : iterable[Term], optional
+        Terms to store at full precision, in addition to those whose
+        ``preserve_dtype`` is True.
+    """
+    def __init__(self,
+                 float_dtype=float32_dtype,
+                 classifier_dtype=int32_dtype,
+                 preserve=()):
+        float_dtype = dtype_class(float_dtype)
+        if float_dtype not in FLOAT_STORAGE_DTYPES:
+            raise ValueError(
+                "float_dtype must be float32 or float64, got %s." % float_dtype
+            )
+        classifier_dtype = dtype_class(classifier_dtype)
+        if classifier_dtype not in CLASSIFIER_STORAGE_DTYPES:
+            raise ValueError(
+                "classifier_dtype must be a signed integer dtype, got %s." %
+                classifier_dtype
+            )
+        self.float_dtype = float_dtype
+        self.classifier_dtype = classifier_dtype
+        self.preserve = frozenset(preserve)
+
+    def __repr__(self):
+        return "%s(float_dtype=%s, classifier_dtype=%s)" % (
+            type(self).__name__,
+            self.float_dtype,
+            self.classifier_dtype,
+        )
+
+    def storage_dtype(self, term):
+        """
+        The dtype in which to store `term` if nothing requires it to keep its
+        full precision, or None if it should always keep its declared dtype.
+        """
+        if term.dtype == float64_dtype:
+            return self.float_dtype
+        if isinstance(term, Classifier) and term.dtype == int64_dtype:
+            return self.classifier_dtype
+        return None
+
+    def storage_dtypes(self, graph):
+        """
+        Choose the dtypes in which to store the terms in `graph`.
+
+        Parameters
+        ----------
+        graph : zipline.pipeline.graph.TermGraph
+            The graph being computed.
+
+        Returns
+        -------
+        storage : dict[Term -> np.dtype]
+            Map from each term to be stored at reduced precision to the dtype
+            in which it should be stored.
+        """
+        preserved = set()
+        for term in graph:
+            if term.preserve_dtype or term in self.preserve:
+                preserved.add(term)
+                preserved.update(ancestors(graph, term))
+
+        storage = {}
+        for term in graph:
+            if term in preserved:
+                continue
+            dtype = self.storage_dtype(term)
+            if dtype is not None and dtype != term.dtype:
+                storage[term] = dtype
+        return storage
+
+
+def compact_results(results, storage):
+    """
+    Convert the results of a job to the dtypes in which they're stored.
+
+    Parameters
+    ----------
+    results : dict[Term -> np.ndarray or AdjustedArray]
+        The computed or loaded results of a job.
+    storage : dict[Term -> np.dtype]
+        The dtypes returned by ``PrecisionPolicy.storage_dtypes``.
+
+    Returns
+    -------
+    compacted : dict[Term -> np.ndarray or AdjustedArray]
+        `results`, with each term in `storage` converted to its dtype.
+    """
+    if not storage:
+        return results
+    out = {}
+    for term, value in iteritems(results):
+        dtype = storage.get(term)
+        if dtype is None or value.dtype == dtype:
+            out[term] = value
+        elif isinstance(value, AdjustedArray):
+            out[term] = value.astype(dtype)
+        else:
+            if dtype.kind == 'i':
+                _check_codes_fit(term, value, dtype)
+            out[term] = value.astype(dtype)
+    return out
+
+
+def restore_input(value, term, storage):
+    """
+    Convert the stored value of `term` to an array of its declared dtype.
+    """
+    array = ensure_ndarray(value)
+    if term in storage:
+        return array.astype(term.dtype)
+    return array
+
+
+def _check_codes_fit(term, codes, dtype):
+    if not codes.size:
+        return
+    info = iinfo(dtype)
+    low, high = codes.min(), codes.max()
+    if low < info.min or high > info.max:
+        raise ValueError(
+            "Can't store codes between {low} and {high} computed by {term} "
+            "as {dtype}.".format(low=low, high=high, term=term, dtype=dtype)
+        )
@@ -0,0 +1,256 @@
+"""
+Instrumentation for the jobs run by SimplePipelineEngine.
+"""
+from collections import namedtuple, OrderedDict
+from operator import itemgetter
+from timeit import default_timer
+
+from pandas import DataFrame
+from six import iteritems
+from six.moves._thread import allocate_lock as Lock
+
+from zipline.lib.adjusted_array import ensure_ndarray
+
+
+class JobProfile(namedtuple('JobProfile', ['terms',
+                                           'loader',
+                                           'seconds',
+                                           'rows',
+                                           'columns',
+                                           'nbytes'])):
+    """
+    Measurements of a single job run by a SimplePipelineEngine: either the
+    computation of one term, or one call to a loader producing a group of
+    loadable terms.
+
+    Attributes
+    ----------
+    terms : tuple[zipline.pipeline.term.Term]
+        The terms produced by the job.
+    loader : zipline.pipeline.loaders.base.PipelineLoader or None
+        The loader called by the job, or None if the job computed a term.
+    seconds : float
+        Wall time spent running the job.
+    rows : int
+        The number of dates produced, including extra rows of lookback.
+    columns : int
+        The number of assets produced.
+    nbytes : tuple[int]
+        The size in bytes of the result for each entry in `terms`.
+    """
+    __slots__ = ()
+
+    @property
+    def kind(self):
+        """
+        'load' if the job called a loader, or 'compute' otherwise.
+        """
+        return 'compute' if self.loader is None else 'load'
+
+
+class PipelineProfiler(object):
+    """
+    Records the wall time, memory allocated, and rows produced by each job
+    run by a SimplePipelineEngine.
+
+    Pass an instance as the ``profiler`` argument to SimplePipelineEngine to
+    record a JobProfile in ``jobs`` for every term computed and every loader
+    call made by the engine, then summarize them with ``report`` and
+    ``loader_report``, or pass the profiler to
+    ``zipline.pipeline.visualize.display_graph`` to annotate a graph with
+    its measurements.
+
+    Jobs run in worker processes by ``run_chunked_pipeline`` aren't recorded.
+
+    Attributes
+    ----------
+    jobs : list[JobProfile]
+        The jobs recorded since the profiler was created or last reset.
+    """
+    def __init__(self):
+        self._lock = Lock()
+        self.jobs = []
+
+    def reset(self):
+        """
+        Discard every recorded job.
+        """
+        with self._lock:
+            self.jobs = []
+
+    def run(self, job, loader, compute):
+        """
+        Call `compute` to run `job`, recording how long it took and what it
+        produced.
+
+        Parameters
+        ----------
+        job : tuple[zipline.pipeline.term.Term]
+            The terms to be computed or loaded.
+        loader : zipline.pipeline.loaders.base.PipelineLoader or None
+            The loader called by `compute`, if any.
+        compute : callable
+            Function of no arguments returning a map from term to result.
+
+        Returns
+        -------
+        results : dict
+            The results of calling `compute`.
+        """
+        start = default_timer()
+        results = compute()
+        seconds = default_timer() - start
+
+        # Loaders may produce terms beyond those requested, which are still
+        # part of the work done by the job.
+        terms = [t for t in job if t in results]
+        terms.extend(t for t in results if t not in job)
+        arrays = [ensure_ndarray(results[t]) for t in terms]
+        rows, columns = arrays[0].shape if arrays else (0, 0)
+        profile = JobProfile(
+            terms=tuple(terms),
+            loader=loader,
+            seconds=seconds,
+            rows=rows,
+            columns=columns,
+            nbytes=tuple(array.nbytes for array in arrays),
+        )
+        with self._lock:
+            self.jobs.append(profile)
+        return results
+
+    def term_totals(self):
+        """
+        Total the measurements of the recorded jobs by term.
+
+        Returns
+        -------
+        totals : OrderedDict[Term -> dict]
+            Map from each recorded term to a dict of the columns described in
+            ``report``, ordered by decreasing time spent.
+        """
+        totals = {}
+        for job in self.jobs:
+            for term, nbytes in zip(job.terms, job.nbytes):
+                entry = totals.get(term)
+                if entry is None:
+                    entry = totals[term] = {
+                        'kind': job.kind,
+                        'loader': _loader_name(job.loader),
+                        'calls': 0,
+                        'seconds': 0.0,
+                        'rows': 0,
+                        'nbytes': 0,
+                        'group_size': 0,
+                    }
+                entry['calls'] += 1
+                entry['seconds'] += job.seconds
+                entry['rows'] += job.rows
+                entry['nbytes'] += nbytes
+                entry['group_size'] += len(job.terms)
+
+        for entry in totals.values():
+            entry['group_size'] = float(entry['group_size']) / entry['calls']
+        return OrderedDict(
+            sorted(
+                iteritems(totals),
+                key=lambda item: item[1]['seconds'],
+                reverse=True,
+            )
+        )
+
+    def report(self):
+        """
+        Summarize the recorded jobs by term.
+
+        Returns
+        -------
+        report : pd.DataFrame
+            Frame indexed by term, ordered by decreasing time spent, with
+            columns:
+
+            kind : {'load', 'compute'}
+                Whether the term was loaded or computed.
+            loader : str
+                The type of the term's loader, or '' for computed terms.
+            calls : int
+                The number of jobs producing the term.
+            seconds : float
+                The total wall time of those jobs.  Loadable terms produced by
+                the same loader call are each charged the time of the call.
+            rows : int
+                The total number of dates produced, including extra rows.
+            nbytes : int
+                The total size in bytes of the term's results.
+            group_size : float
+                The mean number of terms produced by each job producing the
+                term, which shows how well loads are being batched.
+        """
+        totals = self.term_totals()
+        return DataFrame(
+            list(totals.values()),
+            index=list(totals),
+            columns=_REPORT_COLUMNS,
+        )
+
+    def loader_report(self):
+        """
+        Summarize the recorded loader calls by loader.
+
+        Returns
+        -------
+        report : pd.DataFrame
+            Frame indexed by loader, ordered by decreasing time spent, with
+            columns:
+
+            calls : int
+                The number of calls made to the loader.
+            seconds : float
+                The total wall time of those calls.
+            terms : int
+                The total number of terms produced by those calls.
+            rows : int
+                The total number of dates produced by those calls.
+            nbytes : int
+                The total size in bytes of the results of those calls.
+        """
+        totals = OrderedDict()
+        for job in self.jobs:
+            if job.loader is None:
+                continue
+            entry = totals.setdefault(
+                job.loader,
+                {'calls': 0, 'seconds': 0.0, 'terms': 0, 'rows': 0,
+                 'nbytes': 0},
+            )
+            entry['calls'] += 1
+            entry['seconds'] += job.seconds
+            entry['terms'] += len(job.terms)
+            entry['rows'] += job.rows
+            entry['nbytes'] += sum(job.nbytes)
+
+        ordered = sorted(
+            iteritems(totals),
+            key=lambda item: item[1]['seconds'],
+            reverse=True,
+        )
+        return DataFrame(
+            list(map(itemgetter(1), ordered)),
+            index=list(map(itemgetter(0), ordered)),
+            columns=['calls', 'seconds', 'terms', 'rows', 'nbytes'],
+        )
+
+
+_REPORT_COLUMNS = [
+    'kind',
+    'loader',
+    'calls',
+    'seconds',
+    'rows',
+    'nbytes',
+    'group_size',
+]
+
+
+def _loader_name(loader):
+    return '' if loader is None else type(loader).__name__
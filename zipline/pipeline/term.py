@@ -44,6 +44,19 @@ class Term(with_metaclass(ABCMeta, object)):
     # no params.
     params = ()
 
+    # Whether each column of this term's output depends only on the same
+    # column of its inputs and mask.  Such terms can be computed over any
+    # subset of assets without changing their values, which lets the engine
+    # skip assets that can never pass a pipeline's screen.  Terms that look
+    # across assets, like ranks and normalizations, must leave this False.
+    columnwise = False
+
+    # Whether this term's results, and the inputs from which it's computed,
+    # must keep their full precision when an engine runs with a
+    # ``zipline.pipeline.precision.PrecisionPolicy``.  Terms whose results
+    # are sensitive to rounding in their inputs should set this to True.
+    preserve_dtype = False
+
     _term_cache = WeakValueDictionary()
 
     def __new__(cls,
@@ -98,6 +111,9 @@ class Term(with_metaclass(ABCMeta, object)):
                     params=params,
                     *args, **kwargs
                 )
+            # Keep the identity so that it can be fingerprinted later.  See
+            # zipline.pipeline.cache.term_fingerprint.
+            new_instance._identity = identity
             return new_instance
 
     @classmethod
@@ -323,6 +339,7 @@ class AssetExists(Term):
     dependencies = {}
     mask = None
     windowed = False
+    columnwise = True
 
     def __repr__(self):
         return "AssetExists()"
@@ -335,6 +352,7 @@ class LoadableTerm(Term):
     This is the base class for :class:`zipline.pipeline.data.BoundColumn`.
     """
     windowed = False
+    columnwise = True
 
     @lazyval
     def dependencies(self):
@@ -81,7 +81,7 @@ def filter_nodes(include_asset_exists, nodes):
     return filter(lambda n: n is not AssetExists(), nodes)
 
 
-def _render(g, out, format_, include_asset_exists=False):
+def _render(g, out, format_, include_asset_exists=False, profiler=None):
     """
     Draw `g` as a graph to `out`, in format `format`.
 
@@ -94,12 +94,17 @@ def _render(g, out, format_, include_asset_exists=False):
         Output format.
     include_asset_exists : bool
         Whether to filter out `AssetExists()` nodes.
+    profiler : zipline.pipeline.profiler.PipelineProfiler, optional
+        Profiler whose measurements should be added to the label of each
+        node.
     """
     graph_attrs = {'rankdir': 'TB', 'splines': 'ortho'}
     cluster_attrs = {'style': 'filled', 'color': 'lightgoldenrod1'}
 
     in_nodes = g.loadable_terms
     out_nodes = list(g.outputs.values())
+    totals = {} if profiler is None else profiler.term_totals()
+    add_node = partial(add_term_node, totals=totals)
 
     f = BytesIO()
     with graph(f, "G", **graph_attrs):
@@ -107,18 +112,18 @@ def _render(g, out, format_, include_asset_exists=False):
         # Write outputs cluster.
         with cluster(f, 'Output', labelloc='b', **cluster_attrs):
             for term in filter_nodes(include_asset_exists, out_nodes):
-                add_term_node(f, term)
+                add_node(f, term)
 
         # Write inputs cluster.
         with cluster(f, 'Input', **cluster_attrs):
             for term in filter_nodes(include_asset_exists, in_nodes):
-                add_term_node(f, term)
+                add_node(f, term)
 
         # Write intermediate results.
         for term in filter_nodes(include_asset_exists, topological_sort(g)):
             if term in in_nodes or term in out_nodes:
                 continue
-            add_term_node(f, term)
+            add_node(f, term)
 
         # Write edges
         for source, dest in g.edges():
@@ -148,9 +153,12 @@ def _render(g, out, format_, include_asset_exists=False):
     out.write(proc_stdout)
 
 
-def display_graph(g, format='svg', include_asset_exists=False):
+def display_graph(g, format='svg', include_asset_exists=False, profiler=None):
     """
     Display a TermGraph interactively from within IPython.
+
+    If `profiler` is given, each node is labelled with the total time spent
+    and memory allocated producing its term, as recorded by the profiler.
     """
     try:
         import IPython.display as display
@@ -163,7 +171,13 @@ def display_graph(g, format='svg', include_asset_exists=False):
         display_cls = partial(display.Image, format=format, embed=True)
 
     out = BytesIO()
-    _render(g, out, format, include_asset_exists=include_asset_exists)
+    _render(
+        g,
+        out,
+        format,
+        include_asset_exists=include_asset_exists,
+        profiler=profiler,
+    )
     return display_cls(data=out.getvalue())
 
 
@@ -182,8 +196,23 @@ def fmt(obj):
     return '"%s"' % r
 
 
-def add_term_node(f, term):
-    declare_node(f, id(term), attrs_for_node(term))
+def add_term_node(f, term, totals=None):
+    attrs = attrs_for_node(term)
+    if totals and term in totals:
+        attrs['label'] = profile_label(term, totals[term])
+    declare_node(f, id(term), attrs)
+
+
+def profile_label(term, entry):
+    """
+    Build a node label showing the measurements in `entry`, a value of
+    ``PipelineProfiler.term_totals()``, below the usual label for `term`.
+    """
+    return '"%s\\n%.1f ms, %.1f MiB"' % (
+        fmt(term)[1:-1],
+        entry['seconds'] * 1000.0,
+        entry['nbytes'] / float(2 ** 20),
+    )
 
 
 def declare_node(f, name, attributes):
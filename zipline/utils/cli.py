@@ -20,15 +20,6 @@ from copy import copy
 
 from six import print_
 from six.moves import configparser
-import pandas as pd
-
-try:
-    from pygments import highlight
-    from pygments.lexers import PythonLexer
-    from pygments.formatters import TerminalFormatter
-    PYGMENTS = True
-except:
-    PYGMENTS = False
 
 import zipline
 from zipline.errors import NoSourceError, PipelineDateError
@@ -165,6 +156,10 @@ def run_pipeline(print_algo=True, **kwargs):
            pygments syntax coloring if pygments is found.
 
     """
+    # pandas is imported here rather than at module scope so that parsing
+    # command line arguments doesn't pay for it.
+    import pandas as pd
+
     start = kwargs['start']
     end = kwargs['end']
     # Compare against None because strings/timestamps may have been given
@@ -230,11 +225,15 @@ def run_pipeline(print_algo=True, **kwargs):
             algo_text = fd.read()
 
     if print_algo:
-        if PYGMENTS:
+        try:
+            from pygments import highlight
+            from pygments.lexers import PythonLexer
+            from pygments.formatters import TerminalFormatter
+        except ImportError:
+            print_(algo_text)
+        else:
             highlight(algo_text, PythonLexer(), TerminalFormatter(),
                       outfile=sys.stdout)
-        else:
-            print_(algo_text)
 
     algo = zipline.TradingAlgorithm(script=algo_text,
                                     namespace=kwargs.get('namespace', {}),
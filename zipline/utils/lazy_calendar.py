@@ -0,0 +1,199 @@
+"""
+Tools for deferring and caching the construction of exchange calendars.
+
+Each ``zipline.utils.tradingcalendar*`` module describes its exchange with
+holiday and early-close rules.  Evaluating those rules over decades of dates
+is expensive, so the modules replace themselves with a ``LazyCalendarModule``
+whose calendar attributes are only computed when first accessed, and whose
+day arrays are persisted to a versioned cache file under the zipline cache
+root.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from zipline.utils.lazy_module import LazyModule, install_lazy_module
+
+# Version of the persisted calendar layout and rules.  Bump this whenever a
+# calendar's rules change so that days computed with the old rules are
+# ignored.
+CALENDAR_CACHE_VERSION = 1
+
+
+class LazyCalendarModule(LazyModule):
+    """
+    A LazyModule for an exchange calendar.
+    """
+
+
+def install_lazy_calendar(module_name, **lazy_attributes):
+    """
+    Replace the calendar module ``module_name`` in ``sys.modules`` with a
+    ``LazyCalendarModule`` computing ``lazy_attributes`` on demand.
+
+    This should be called at the bottom of the calendar module.
+    """
+    return install_lazy_module(
+        module_name,
+        module_type=LazyCalendarModule,
+        **lazy_attributes
+    )
+
+
+def weekend_days(start, end):
+    """
+    Get every Saturday and Sunday between ``start`` and ``end``, inclusive.
+
+    This is equivalent to evaluating a weekly rrule on SA and SU, which is by
+    far the largest rule in every calendar, but is vectorized.
+    """
+    days = pd.date_range(start, end, freq='D')
+    return days[days.dayofweek >= 5]
+
+
+def _calendar_cache_path(name):
+    # Deferred to avoid a circular import: zipline.data imports the NYSE
+    # calendar.
+    from zipline.data.paths import cache_root
+
+    root = os.path.join(cache_root(), 'calendars')
+    if not os.path.exists(root):
+        os.makedirs(root)
+    return os.path.join(
+        root,
+        '%s.v%d.npz' % (name, CALENDAR_CACHE_VERSION),
+    )
+
+
+def _read_cached_days(path, bounds):
+    if not os.path.exists(path):
+        return None
+    archive = np.load(path)
+    try:
+        if not np.array_equal(archive['bounds'], bounds):
+            return None
+        return {
+            key: pd.DatetimeIndex(archive[key], tz='UTC')
+            for key in archive.files
+            if key != 'bounds'
+        }
+    finally:
+        archive.close()
+
+
+def _to_nanos(index):
+    return index.values.astype('datetime64[ns]').astype(np.int64)
+
+
+def _write_cached_days(path, bounds, days):
+    arrays = {key: _to_nanos(value) for key, value in days.items()}
+    arrays['bounds'] = bounds
+
+    # Write to a temporary file and rename so that concurrent readers never
+    # observe a partially written cache.
+    tmp_path = '%s.%d.tmp' % (path, os.getpid())
+    with open(tmp_path, 'wb') as f:
+        np.savez(f, **arrays)
+    os.rename(tmp_path, path)
+
+
+def calendar_cache_end(end):
+    """
+    Get the last day of the year containing ``end``.
+
+    Calendars end a year after the current time, so their cache files are
+    keyed on this bound instead, which stays the same for a whole year.
+    """
+    end = pd.Timestamp(end)
+    return pd.Timestamp('%d-12-31' % end.year, tz=end.tz)
+
+
+def cached_calendar_days(name, start, end, build):
+    """
+    Load the day arrays for the calendar ``name`` between ``start`` and
+    ``end`` from the calendar cache, building and persisting them on a miss.
+
+    The cache holds the days through ``calendar_cache_end(end)``, which are
+    sliced to ``end`` when loaded, so calendars ending on different dates in
+    the same year share a cache file.  Failures to read or write the cache
+    are never fatal; the days are simply rebuilt.
+
+    Parameters
+    ----------
+    name : str
+        The name of the calendar, used as the cache file name.
+    start : datetime-like
+        The first date covered by the calendar.
+    end : datetime-like
+        The last date covered by the calendar.
+    build : callable[(pd.Timestamp, pd.Timestamp) -> dict]
+        Function computing the day arrays between two dates, inclusive, from
+        the calendar's rules.  It's called with ``start`` and
+        ``calendar_cache_end(end)``, and returns a dict mapping names to
+        pd.DatetimeIndex.
+
+    Returns
+    -------
+    days : dict[str -> pd.DatetimeIndex]
+        The arrays produced by ``build``, truncated to ``end``.
+    """
+    start = pd.Timestamp(start)
+    end = pd.Timestamp(end)
+    cache_end = calendar_cache_end(end)
+    bounds = np.array([start.value, cache_end.value], dtype=np.int64)
+
+    try:
+        path = _calendar_cache_path(name)
+        days = _read_cached_days(path, bounds)
+    except (OSError, IOError, ValueError, KeyError):
+        path = days = None
+
+    if days is None:
+        days = build(start, cache_end)
+        if path is not None:
+            try:
+                _write_cached_days(path, bounds, days)
+            except (OSError, IOError):
+                pass
+    return {key: value[value <= end] for key, value in days.items()}
+
+
+def open_and_closes_from_local_times(trading_days,
+                                     open_offsets,
+                                     close_offsets,
+                                     tz):
+    """
+    Build a table of market opens and closes from wall-clock times.
+
+    Parameters
+    ----------
+    trading_days : pd.DatetimeIndex
+        UTC midnight of each trading day.
+    open_offsets : np.array[int64]
+        Nanoseconds after local midnight at which the market opens on each
+        day.
+    close_offsets : np.array[int64]
+        Nanoseconds after local midnight at which the market closes on each
+        day.
+    tz : str
+        The exchange's timezone.
+
+    Returns
+    -------
+    open_and_closes : pd.DataFrame
+        Frame indexed by ``trading_days`` with 'market_open' and
+        'market_close' columns of UTC Timestamps, as produced by
+        ``zipline.utils.tradingcalendar.get_open_and_closes``.
+    """
+    midnights = _to_nanos(trading_days)
+
+    def to_utc(offsets):
+        local = pd.DatetimeIndex(midnights + offsets)
+        return local.tz_localize(tz).tz_convert('UTC')
+
+    open_and_closes = pd.DataFrame(index=trading_days,
+                                   columns=('market_open', 'market_close'))
+    open_and_closes['market_open'] = list(to_utc(open_offsets))
+    open_and_closes['market_close'] = list(to_utc(close_offsets))
+    return open_and_closes
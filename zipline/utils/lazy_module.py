@@ -0,0 +1,91 @@
+"""
+Modules whose attributes are computed or imported on first access.
+
+Python 2 doesn't support module-level ``__getattr__``, so a module that wants
+lazy attributes replaces itself in ``sys.modules`` with a ``LazyModule``
+carrying a copy of its namespace.  Both ``module.attr`` and
+``from module import attr`` then resolve lazy attributes on demand.
+"""
+from importlib import import_module
+import sys
+from types import ModuleType
+
+
+class LazyModule(ModuleType):
+    """
+    A module whose lazy attributes are computed on first access.
+
+    Parameters
+    ----------
+    module : module
+        The module being replaced.  Its namespace is copied into this module.
+    lazy_attributes : dict[str -> callable[LazyModule -> object]]
+        Map from attribute name to a function computing that attribute.  The
+        function receives this module, so attributes may be defined in terms
+        of other lazy attributes.
+    """
+    def __init__(self, module, lazy_attributes):
+        super(LazyModule, self).__init__(module.__name__, module.__doc__)
+        self.__dict__.update(module.__dict__)
+        # Functions copied from ``module`` still look up their globals in
+        # ``module.__dict__``, which Python 2 clears when the module object is
+        # collected, so keep it alive.
+        self._wrapped_module = module
+        self._lazy_attributes = lazy_attributes
+
+    def __getattr__(self, name):
+        # Only called when normal attribute lookup fails, i.e. for lazy
+        # attributes that haven't been computed yet.
+        try:
+            compute = self.__dict__['_lazy_attributes'][name]
+        except KeyError:
+            raise AttributeError(
+                "module %r has no attribute %r" % (self.__name__, name)
+            )
+        value = compute(self)
+        setattr(self, name, value)
+        return value
+
+
+def install_lazy_module(module_name,
+                        module_type=LazyModule,
+                        **lazy_attributes):
+    """
+    Replace the module ``module_name`` in ``sys.modules`` with a
+    ``module_type`` computing ``lazy_attributes`` on demand.
+
+    This should be called at the bottom of the module being replaced.
+
+    Returns
+    -------
+    lazy : LazyModule
+        The module now stored in ``sys.modules``.
+    """
+    lazy = module_type(sys.modules[module_name], lazy_attributes)
+    sys.modules[module_name] = lazy
+    return lazy
+
+
+def lazy_import(module_name, attribute=None):
+    """
+    Make a lazy attribute that imports ``module_name`` when first accessed.
+
+    Parameters
+    ----------
+    module_name : str
+        The absolute name of the module to import.
+    attribute : str, optional
+        If given, the lazy attribute is this attribute of the imported module
+        rather than the module itself.
+
+    Returns
+    -------
+    load : callable[LazyModule -> object]
+        A function suitable for use as a lazy attribute.
+    """
+    def load(lazy_module):
+        module = import_module(module_name)
+        if attribute is None:
+            return module
+        return getattr(module, attribute)
+    return load
@@ -22,6 +22,9 @@ from toolz import flip
 uint8_dtype = dtype('uint8')
 bool_dtype = dtype('bool')
 
+int8_dtype = dtype('int8')
+int16_dtype = dtype('int16')
+int32_dtype = dtype('int32')
 int64_dtype = dtype('int64')
 
 float32_dtype = dtype('float32')
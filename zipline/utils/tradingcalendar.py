@@ -12,6 +12,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import sys
+
+import numpy as np
 import pandas as pd
 import pytz
 
@@ -19,6 +22,13 @@ from datetime import datetime
 from dateutil import rrule
 from functools import partial
 
+from zipline.utils.lazy_calendar import (
+    cached_calendar_days,
+    install_lazy_calendar,
+    open_and_closes_from_local_times,
+    weekend_days,
+)
+
 start = pd.Timestamp('1990-01-01', tz='UTC')
 end_base = pd.Timestamp('today', tz='UTC')
 # Give an aggressive buffer for logic that needs to use the next trading
@@ -38,15 +48,6 @@ def get_non_trading_days(start, end):
     start = canonicalize_datetime(start)
     end = canonicalize_datetime(end)
 
-    weekends = rrule.rrule(
-        rrule.YEARLY,
-        byweekday=(rrule.SA, rrule.SU),
-        cache=True,
-        dtstart=start,
-        until=end
-    )
-    non_trading_rules.append(weekends)
-
     new_years = rrule.rrule(
         rrule.MONTHLY,
         byyearday=1,
@@ -244,20 +245,18 @@ def get_non_trading_days(start, end):
     # - President Gerald R. Ford - Jan 2, 2007
     non_trading_days.append(datetime(2007, 1, 2, tzinfo=pytz.utc))
 
-    non_trading_days.sort()
-    return pd.DatetimeIndex(non_trading_days)
-
-non_trading_days = get_non_trading_days(start, end)
-trading_day = pd.tseries.offsets.CDay(holidays=non_trading_days)
+    return pd.DatetimeIndex(
+        sorted(set(non_trading_days))
+    ).union(weekend_days(start, end))
 
 
-def get_trading_days(start, end, trading_day=trading_day):
+def get_trading_days(start, end, trading_day=None):
+    if trading_day is None:
+        trading_day = sys.modules[__name__].trading_day
     return pd.date_range(start=start.date(),
                          end=end.date(),
                          freq=trading_day).tz_localize('UTC')
 
-trading_days = get_trading_days(start, end)
-
 
 def get_early_closes(start, end):
     # 1:00 PM close rules based on
@@ -365,8 +364,6 @@ def get_early_closes(start, end):
     early_closes.sort()
     return pd.DatetimeIndex(early_closes)
 
-early_closes = get_early_closes(start, end)
-
 
 def get_open_and_close(day, early_closes):
     market_open = pd.Timestamp(
@@ -401,5 +398,45 @@ def get_open_and_closes(trading_days, early_closes, get_open_and_close):
 
     return open_and_closes
 
-open_and_closes = get_open_and_closes(trading_days, early_closes,
-                                      get_open_and_close)
+
+MARKET_OPEN = pd.Timedelta(hours=9, minutes=31).value
+MARKET_CLOSE = pd.Timedelta(hours=16).value
+EARLY_CLOSE = pd.Timedelta(hours=13).value
+
+
+def _get_open_and_closes(trading_days, early_closes):
+    """
+    Vectorized equivalent of ``get_open_and_closes(trading_days,
+    early_closes, get_open_and_close)``.
+    """
+    return open_and_closes_from_local_times(
+        trading_days,
+        np.full(len(trading_days), MARKET_OPEN, dtype=np.int64),
+        np.where(trading_days.isin(early_closes), EARLY_CLOSE, MARKET_CLOSE),
+        'US/Eastern',
+    )
+
+
+def _build_calendar_days(start, end):
+    return {
+        'non_trading_days': get_non_trading_days(start, end),
+        'early_closes': get_early_closes(start, end),
+    }
+
+
+# The calendar is only built when one of these attributes is first accessed.
+install_lazy_calendar(
+    __name__,
+    _calendar_days=lambda cal: cached_calendar_days(
+        'nyse', start, end, _build_calendar_days,
+    ),
+    non_trading_days=lambda cal: cal._calendar_days['non_trading_days'],
+    trading_day=lambda cal: pd.tseries.offsets.CDay(
+        holidays=cal.non_trading_days,
+    ),
+    trading_days=lambda cal: get_trading_days(start, end, cal.trading_day),
+    early_closes=lambda cal: cal._calendar_days['early_closes'],
+    open_and_closes=lambda cal: _get_open_and_closes(
+        cal.trading_days, cal.early_closes,
+    ),
+)
@@ -13,13 +13,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import sys
+
+import numpy as np
 import pandas as pd
 import pytz
 
 from datetime import datetime
 from dateutil import rrule
-from zipline.utils.tradingcalendar import end, canonicalize_datetime, \
-    get_open_and_closes
+from zipline.utils.lazy_calendar import (
+    cached_calendar_days,
+    install_lazy_calendar,
+    open_and_closes_from_local_times,
+    weekend_days,
+)
+from zipline.utils.tradingcalendar import end, canonicalize_datetime
 
 start = pd.Timestamp('1994-01-01', tz='UTC')
 
@@ -30,15 +38,6 @@ def get_non_trading_days(start, end):
     start = canonicalize_datetime(start)
     end = canonicalize_datetime(end)
 
-    weekends = rrule.rrule(
-        rrule.YEARLY,
-        byweekday=(rrule.SA, rrule.SU),
-        cache=True,
-        dtstart=start,
-        until=end
-    )
-    non_trading_rules.append(weekends)
-
     # Universal confraternization
     conf_universal = rrule.rrule(
         rrule.MONTHLY,
@@ -242,30 +241,18 @@ def get_non_trading_days(start, end):
     # World Cup 2014 Opening
     non_trading_days.append(datetime(2014, 6, 12, tzinfo=pytz.utc))
 
-    non_trading_days.sort()
-    return pd.DatetimeIndex(non_trading_days)
+    return pd.DatetimeIndex(
+        sorted(set(non_trading_days))
+    ).union(weekend_days(start, end))
 
-non_trading_days = get_non_trading_days(start, end)
-trading_day = pd.tseries.offsets.CDay(holidays=non_trading_days)
 
-
-def get_trading_days(start, end, trading_day=trading_day):
+def get_trading_days(start, end, trading_day=None):
+    if trading_day is None:
+        trading_day = sys.modules[__name__].trading_day
     return pd.date_range(start=start.date(),
                          end=end.date(),
                          freq=trading_day).tz_localize('UTC')
 
-trading_days = get_trading_days(start, end)
-
-
-# Ash Wednesday
-quarta_cinzas = rrule.rrule(
-    rrule.MONTHLY,
-    byeaster=-46,
-    cache=True,
-    dtstart=start,
-    until=end
-)
-
 
 def get_early_closes(start, end):
     # TSX closed at 1:00 PM on december 24th.
@@ -275,6 +262,14 @@ def get_early_closes(start, end):
 
     early_close_rules = []
 
+    # Ash Wednesday
+    quarta_cinzas = rrule.rrule(
+        rrule.MONTHLY,
+        byeaster=-46,
+        cache=True,
+        dtstart=start,
+        until=end
+    )
     early_close_rules.append(quarta_cinzas)
 
     early_close_ruleset = rrule.rruleset()
@@ -286,13 +281,11 @@ def get_early_closes(start, end):
     early_closes.sort()
     return pd.DatetimeIndex(early_closes)
 
-early_closes = get_early_closes(start, end)
-
 
 def get_open_and_close(day, early_closes):
     # only "early close" event in Bovespa actually is a late start
-    # as the market only opens at 1pm
-    open_hour = 13 if day in quarta_cinzas else 10
+    # as the market only opens at 1pm, on Ash Wednesday.
+    open_hour = 13 if day in early_closes else 10
     market_open = pd.Timestamp(
         datetime(
             year=day.year,
@@ -311,5 +304,48 @@ def get_open_and_close(day, early_closes):
 
     return market_open, market_close
 
-open_and_closes = get_open_and_closes(trading_days, early_closes,
-                                      get_open_and_close)
+
+MARKET_OPEN = pd.Timedelta(hours=10).value
+LATE_OPEN = pd.Timedelta(hours=13).value
+MARKET_CLOSE = pd.Timedelta(hours=16).value
+
+
+def _get_open_and_closes(trading_days, early_closes):
+    """
+    Vectorized equivalent of ``get_open_and_closes(trading_days,
+    early_closes, get_open_and_close)``.
+
+    ``early_closes`` are the Ash Wednesdays in the calendar, on which the
+    market opens late rather than closing early.
+    """
+    return open_and_closes_from_local_times(
+        trading_days,
+        np.where(trading_days.isin(early_closes), LATE_OPEN, MARKET_OPEN),
+        np.full(len(trading_days), MARKET_CLOSE, dtype=np.int64),
+        'America/Sao_Paulo',
+    )
+
+
+def _build_calendar_days(start, end):
+    return {
+        'non_trading_days': get_non_trading_days(start, end),
+        'early_closes': get_early_closes(start, end),
+    }
+
+
+# The calendar is only built when one of these attributes is first accessed.
+install_lazy_calendar(
+    __name__,
+    _calendar_days=lambda cal: cached_calendar_days(
+        'bmf', start, end, _build_calendar_days,
+    ),
+    non_trading_days=lambda cal: cal._calendar_days['non_trading_days'],
+    trading_day=lambda cal: pd.tseries.offsets.CDay(
+        holidays=cal.non_trading_days,
+    ),
+    trading_days=lambda cal: get_trading_days(start, end, cal.trading_day),
+    early_closes=lambda cal: cal._calendar_days['early_closes'],
+    open_and_closes=lambda cal: _get_open_and_closes(
+        cal.trading_days, cal.early_closes,
+    ),
+)
@@ -27,27 +27,27 @@ import pandas as pd
 
 from datetime import datetime
 from dateutil import rrule
+from zipline.utils.lazy_calendar import (
+    cached_calendar_days,
+    calendar_cache_end,
+    install_lazy_calendar,
+    weekend_days,
+)
 from zipline.utils.tradingcalendar import end
 
 start = datetime(2002, 1, 1, tzinfo=pytz.utc)
+# The rules run through the end of the cached range, which covers `end`.
+rules_end = calendar_cache_end(end)
 
+# Weekends are added by _build_calendar_days.
 non_trading_rules = []
-# Weekends
-weekends = rrule.rrule(
-    rrule.YEARLY,
-    byweekday=(rrule.SA, rrule.SU),
-    cache=True,
-    dtstart=start,
-    until=end
-)
-non_trading_rules.append(weekends)
 # New Year's Day
 new_year = rrule.rrule(
     rrule.MONTHLY,
     byyearday=1,
     cache=True,
     dtstart=start,
-    until=end
+    until=rules_end
 )
 # If new years day is on Saturday then Monday 3rd is a holiday
 # If new years day is on Sunday then Monday 2nd is a holiday
@@ -58,7 +58,7 @@ weekend_new_year = rrule.rrule(
     byweekday=(rrule.MO),
     cache=True,
     dtstart=start,
-    until=end
+    until=rules_end
 )
 non_trading_rules.append(new_year)
 non_trading_rules.append(weekend_new_year)
@@ -68,7 +68,7 @@ good_friday = rrule.rrule(
     byeaster=-2,
     cache=True,
     dtstart=start,
-    until=end
+    until=rules_end
 )
 non_trading_rules.append(good_friday)
 # Easter Monday
@@ -77,7 +77,7 @@ easter_monday = rrule.rrule(
     byeaster=1,
     cache=True,
     dtstart=start,
-    until=end
+    until=rules_end
 )
 non_trading_rules.append(easter_monday)
 # Early May Bank Holiday (1st Monday in May)
@@ -87,7 +87,7 @@ may_bank = rrule.rrule(
     byweekday=(rrule.MO(1)),
     cache=True,
     dtstart=start,
-    until=end
+    until=rules_end
 )
 non_trading_rules.append(may_bank)
 # Spring Bank Holiday (Last Monday in May)
@@ -97,7 +97,7 @@ spring_bank = rrule.rrule(
     byweekday=(rrule.MO(-1)),
     cache=True,
     dtstart=datetime(2003, 1, 1, tzinfo=pytz.utc),
-    until=end
+    until=rules_end
 )
 non_trading_rules.append(spring_bank)
 # Summer Bank Holiday (Last Monday in August)
@@ -107,7 +107,7 @@ summer_bank = rrule.rrule(
     byweekday=(rrule.MO(-1)),
     cache=True,
     dtstart=start,
-    until=end
+    until=rules_end
 )
 non_trading_rules.append(summer_bank)
 # Christmas Day
@@ -117,7 +117,7 @@ christmas = rrule.rrule(
     bymonthday=25,
     cache=True,
     dtstart=start,
-    until=end
+    until=rules_end
 )
 # If christmas day is Saturday Monday 27th is a holiday
 # If christmas day is sunday the Tuesday 27th is a holiday
@@ -128,7 +128,7 @@ weekend_christmas = rrule.rrule(
     byweekday=(rrule.MO, rrule.TU),
     cache=True,
     dtstart=start,
-    until=end
+    until=rules_end
 )
 
 non_trading_rules.append(christmas)
@@ -140,7 +140,7 @@ boxing_day = rrule.rrule(
     bymonthday=26,
     cache=True,
     dtstart=start,
-    until=end
+    until=rules_end
 )
 # If boxing day is saturday then Monday 28th is a holiday
 # If boxing day is sunday then Tuesday 28th is a holiday
@@ -151,7 +151,7 @@ weekend_boxing_day = rrule.rrule(
     byweekday=(rrule.MO, rrule.TU),
     cache=True,
     dtstart=start,
-    until=end
+    until=rules_end
 )
 
 non_trading_rules.append(boxing_day)
@@ -177,10 +177,30 @@ non_trading_ruleset.rdate(datetime(2012, 6, 5, tzinfo=pytz.utc))
 for rule in non_trading_rules:
     non_trading_ruleset.rrule(rule)
 
-non_trading_days = non_trading_ruleset.between(start, end, inc=True)
-non_trading_day_index = pd.DatetimeIndex(sorted(non_trading_days))
 
-business_days = pd.DatetimeIndex(start=start, end=end,
-                                 freq=pd.datetools.BDay())
+def _build_calendar_days(start, end):
+    holidays = non_trading_ruleset.between(start, end, inc=True)
+    return {
+        'non_trading_days': pd.DatetimeIndex(
+            sorted(holidays)
+        ).union(weekend_days(start, end)),
+    }
+
 
-trading_days = business_days.difference(non_trading_day_index)
+# The calendar is only built when one of these attributes is first accessed.
+install_lazy_calendar(
+    __name__,
+    _calendar_days=lambda cal: cached_calendar_days(
+        'lse', start, end, _build_calendar_days,
+    ),
+    non_trading_days=lambda cal: list(cal.non_trading_day_index),
+    non_trading_day_index=lambda cal: (
+        cal._calendar_days['non_trading_days']
+    ),
+    business_days=lambda cal: pd.DatetimeIndex(
+        start=start, end=end, freq=pd.datetools.BDay(),
+    ),
+    trading_days=lambda cal: cal.business_days.difference(
+        cal.non_trading_day_index,
+    ),
+)
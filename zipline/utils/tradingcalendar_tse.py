@@ -14,13 +14,21 @@
 # limitations under the License.
 
 
+import sys
+
+import numpy as np
 import pandas as pd
 import pytz
 
 from datetime import datetime
 from dateutil import rrule
-from zipline.utils.tradingcalendar import end, canonicalize_datetime, \
-    get_open_and_closes
+from zipline.utils.lazy_calendar import (
+    cached_calendar_days,
+    install_lazy_calendar,
+    open_and_closes_from_local_times,
+    weekend_days,
+)
+from zipline.utils.tradingcalendar import end, canonicalize_datetime
 
 start = pd.Timestamp('1994-01-01', tz='UTC')
 
@@ -31,15 +39,6 @@ def get_non_trading_days(start, end):
     start = canonicalize_datetime(start)
     end = canonicalize_datetime(end)
 
-    weekends = rrule.rrule(
-        rrule.YEARLY,
-        byweekday=(rrule.SA, rrule.SU),
-        cache=True,
-        dtstart=start,
-        until=end
-    )
-    non_trading_rules.append(weekends)
-
     new_years = rrule.rrule(
         rrule.MONTHLY,
         byyearday=1,
@@ -258,20 +257,18 @@ def get_non_trading_days(start, end):
     non_trading_days.append(
         datetime(2001, 9, 12, tzinfo=pytz.utc))
 
-    non_trading_days.sort()
-    return pd.DatetimeIndex(non_trading_days)
+    return pd.DatetimeIndex(
+        sorted(set(non_trading_days))
+    ).union(weekend_days(start, end))
 
-non_trading_days = get_non_trading_days(start, end)
-trading_day = pd.tseries.offsets.CDay(holidays=non_trading_days)
 
-
-def get_trading_days(start, end, trading_day=trading_day):
+def get_trading_days(start, end, trading_day=None):
+    if trading_day is None:
+        trading_day = sys.modules[__name__].trading_day
     return pd.date_range(start=start.date(),
                          end=end.date(),
                          freq=trading_day).tz_localize('UTC')
 
-trading_days = get_trading_days(start, end)
-
 # Days in Environment but not in Calendar (using ^GSPTSE as bm_symbol):
 # --------------------------------------------------------------------
 # Used http://web.tmxmoney.com/pricehistory.php?qm_page=61468&qm_symbol=^TSX
@@ -336,8 +333,6 @@ def get_early_closes(start, end):
     early_closes.sort()
     return pd.DatetimeIndex(early_closes)
 
-early_closes = get_early_closes(start, end)
-
 
 def get_open_and_close(day, early_closes):
     market_open = pd.Timestamp(
@@ -360,5 +355,45 @@ def get_open_and_close(day, early_closes):
 
     return market_open, market_close
 
-open_and_closes = get_open_and_closes(trading_days, early_closes,
-                                      get_open_and_close)
+
+MARKET_OPEN = pd.Timedelta(hours=9, minutes=31).value
+MARKET_CLOSE = pd.Timedelta(hours=16).value
+EARLY_CLOSE = pd.Timedelta(hours=13).value
+
+
+def _get_open_and_closes(trading_days, early_closes):
+    """
+    Vectorized equivalent of ``get_open_and_closes(trading_days,
+    early_closes, get_open_and_close)``.
+    """
+    return open_and_closes_from_local_times(
+        trading_days,
+        np.full(len(trading_days), MARKET_OPEN, dtype=np.int64),
+        np.where(trading_days.isin(early_closes), EARLY_CLOSE, MARKET_CLOSE),
+        'US/Eastern',
+    )
+
+
+def _build_calendar_days(start, end):
+    return {
+        'non_trading_days': get_non_trading_days(start, end),
+        'early_closes': get_early_closes(start, end),
+    }
+
+
+# The calendar is only built when one of these attributes is first accessed.
+install_lazy_calendar(
+    __name__,
+    _calendar_days=lambda cal: cached_calendar_days(
+        'tse', start, end, _build_calendar_days,
+    ),
+    non_trading_days=lambda cal: cal._calendar_days['non_trading_days'],
+    trading_day=lambda cal: pd.tseries.offsets.CDay(
+        holidays=cal.non_trading_days,
+    ),
+    trading_days=lambda cal: get_trading_days(start, end, cal.trading_day),
+    early_closes=lambda cal: cal._calendar_days['early_closes'],
+    open_and_closes=lambda cal: _get_open_and_closes(
+        cal.trading_days, cal.early_closes,
+    ),
+)